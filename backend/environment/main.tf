@@ -253,10 +253,10 @@ resource "aws_lambda_event_source_mapping" "event_processing_trigger" {
   event_source_arn = module.sqs.event_processing_queue_arn
   function_name    = module.lambda.event_processor_function_name
 
-  # Process messages in batches of 1 for individual processing
-  batch_size = 1
+  # Up to 10 messages per invocation: the processor handles every record and stores them with one batch write
+  batch_size = 10
 
-  # Set batching window to 10 seconds
+  # Wait up to 10 seconds to fill a batch
   maximum_batching_window_in_seconds = 10
 
   # Set concurrent lambda instances to 3
@@ -376,6 +376,7 @@ module "eventbridge_us_east_1_deployment" {
   event_processor_function_name  = module.lambda.event_processor_function_name
   event_sync_schedule_expression = var.event_sync_schedule_expression
   event_sync_lookback_days       = var.event_sync_lookback_days
+  event_processor_warmer_enabled = var.event_processor_warmer_enabled
   name_prefix                    = "${local.name_prefix}-us-east-1"
   common_tags = merge(local.common_tags, {
     Region = "us-east-1"
@@ -401,6 +402,7 @@ module "eventbridge_us_east_1_monitoring" {
   event_processor_function_name  = module.lambda.event_processor_function_name
   event_sync_schedule_expression = var.event_sync_schedule_expression
   event_sync_lookback_days       = var.event_sync_lookback_days
+  event_processor_warmer_enabled = var.event_processor_warmer_enabled
   name_prefix                    = "${local.name_prefix}-us-east-1"
   common_tags = merge(local.common_tags, {
     Region = "us-east-1"
@@ -426,6 +428,7 @@ module "eventbridge_us_east_2" {
   event_processor_function_name  = module.lambda.event_processor_function_name
   event_sync_schedule_expression = var.event_sync_schedule_expression
   event_sync_lookback_days       = var.event_sync_lookback_days
+  event_processor_warmer_enabled = var.event_processor_warmer_enabled
   name_prefix                    = "${local.name_prefix}-us-east-2"
   common_tags = merge(local.common_tags, {
     Region = "us-east-2"
@@ -451,6 +454,7 @@ module "eventbridge_us_west_1" {
   event_processor_function_name  = module.lambda.event_processor_function_name
   event_sync_schedule_expression = var.event_sync_schedule_expression
   event_sync_lookback_days       = var.event_sync_lookback_days
+  event_processor_warmer_enabled = var.event_processor_warmer_enabled
   name_prefix                    = "${local.name_prefix}-us-west-1"
   common_tags = merge(local.common_tags, {
     Region = "us-west-1"
@@ -476,6 +480,7 @@ module "eventbridge_us_west_2" {
   event_processor_function_name  = module.lambda.event_processor_function_name
   event_sync_schedule_expression = var.event_sync_schedule_expression
   event_sync_lookback_days       = var.event_sync_lookback_days
+  event_processor_warmer_enabled = var.event_processor_warmer_enabled
   name_prefix                    = "${local.name_prefix}-us-west-2"
   common_tags = merge(local.common_tags, {
     Region = "us-west-2"
@@ -501,6 +506,7 @@ module "eventbridge_eu_west_1" {
   event_processor_function_name  = module.lambda.event_processor_function_name
   event_sync_schedule_expression = var.event_sync_schedule_expression
   event_sync_lookback_days       = var.event_sync_lookback_days
+  event_processor_warmer_enabled = var.event_processor_warmer_enabled
   name_prefix                    = "${local.name_prefix}-eu-west-1"
   common_tags = merge(local.common_tags, {
     Region = "eu-west-1"
@@ -526,6 +532,7 @@ module "eventbridge_eu_west_2" {
   event_processor_function_name  = module.lambda.event_processor_function_name
   event_sync_schedule_expression = var.event_sync_schedule_expression
   event_sync_lookback_days       = var.event_sync_lookback_days
+  event_processor_warmer_enabled = var.event_processor_warmer_enabled
   name_prefix                    = "${local.name_prefix}-eu-west-2"
   common_tags = merge(local.common_tags, {
     Region = "eu-west-2"
@@ -551,6 +558,7 @@ module "eventbridge_eu_west_3" {
   event_processor_function_name  = module.lambda.event_processor_function_name
   event_sync_schedule_expression = var.event_sync_schedule_expression
   event_sync_lookback_days       = var.event_sync_lookback_days
+  event_processor_warmer_enabled = var.event_processor_warmer_enabled
   name_prefix                    = "${local.name_prefix}-eu-west-3"
   common_tags = merge(local.common_tags, {
     Region = "eu-west-3"
@@ -576,6 +584,7 @@ module "eventbridge_eu_central_1" {
   event_processor_function_name  = module.lambda.event_processor_function_name
   event_sync_schedule_expression = var.event_sync_schedule_expression
   event_sync_lookback_days       = var.event_sync_lookback_days
+  event_processor_warmer_enabled = var.event_processor_warmer_enabled
   name_prefix                    = "${local.name_prefix}-eu-central-1"
   common_tags = merge(local.common_tags, {
     Region = "eu-central-1"
@@ -601,6 +610,7 @@ module "eventbridge_eu_north_1" {
   event_processor_function_name  = module.lambda.event_processor_function_name
   event_sync_schedule_expression = var.event_sync_schedule_expression
   event_sync_lookback_days       = var.event_sync_lookback_days
+  event_processor_warmer_enabled = var.event_processor_warmer_enabled
   name_prefix                    = "${local.name_prefix}-eu-north-1"
   common_tags = merge(local.common_tags, {
     Region = "eu-north-1"
@@ -626,6 +636,7 @@ module "eventbridge_ap_southeast_1" {
   event_processor_function_name  = module.lambda.event_processor_function_name
   event_sync_schedule_expression = var.event_sync_schedule_expression
   event_sync_lookback_days       = var.event_sync_lookback_days
+  event_processor_warmer_enabled = var.event_processor_warmer_enabled
   name_prefix                    = "${local.name_prefix}-ap-southeast-1"
   common_tags = merge(local.common_tags, {
     Region = "ap-southeast-1"
@@ -651,6 +662,7 @@ module "eventbridge_ap_southeast_2" {
   event_processor_function_name  = module.lambda.event_processor_function_name
   event_sync_schedule_expression = var.event_sync_schedule_expression
   event_sync_lookback_days       = var.event_sync_lookback_days
+  event_processor_warmer_enabled = var.event_processor_warmer_enabled
   name_prefix                    = "${local.name_prefix}-ap-southeast-2"
   common_tags = merge(local.common_tags, {
     Region = "ap-southeast-2"
@@ -676,6 +688,7 @@ module "eventbridge_ap_northeast_1" {
   event_processor_function_name  = module.lambda.event_processor_function_name
   event_sync_schedule_expression = var.event_sync_schedule_expression
   event_sync_lookback_days       = var.event_sync_lookback_days
+  event_processor_warmer_enabled = var.event_processor_warmer_enabled
   name_prefix                    = "${local.name_prefix}-ap-northeast-1"
   common_tags = merge(local.common_tags, {
     Region = "ap-northeast-1"
@@ -701,6 +714,7 @@ module "eventbridge_ap_northeast_2" {
   event_processor_function_name  = module.lambda.event_processor_function_name
   event_sync_schedule_expression = var.event_sync_schedule_expression
   event_sync_lookback_days       = var.event_sync_lookback_days
+  event_processor_warmer_enabled = var.event_processor_warmer_enabled
   name_prefix                    = "${local.name_prefix}-ap-northeast-2"
   common_tags = merge(local.common_tags, {
     Region = "ap-northeast-2"
@@ -726,6 +740,7 @@ module "eventbridge_ap_northeast_3" {
   event_processor_function_name  = module.lambda.event_processor_function_name
   event_sync_schedule_expression = var.event_sync_schedule_expression
   event_sync_lookback_days       = var.event_sync_lookback_days
+  event_processor_warmer_enabled = var.event_processor_warmer_enabled
   name_prefix                    = "${local.name_prefix}-ap-northeast-3"
   common_tags = merge(local.common_tags, {
     Region = "ap-northeast-3"
@@ -751,6 +766,7 @@ module "eventbridge_ap_south_1" {
   event_processor_function_name  = module.lambda.event_processor_function_name
   event_sync_schedule_expression = var.event_sync_schedule_expression
   event_sync_lookback_days       = var.event_sync_lookback_days
+  event_processor_warmer_enabled = var.event_processor_warmer_enabled
   name_prefix                    = "${local.name_prefix}-ap-south-1"
   common_tags = merge(local.common_tags, {
     Region = "ap-south-1"
@@ -776,6 +792,7 @@ module "eventbridge_ca_central_1" {
   event_processor_function_name  = module.lambda.event_processor_function_name
   event_sync_schedule_expression = var.event_sync_schedule_expression
   event_sync_lookback_days       = var.event_sync_lookback_days
+  event_processor_warmer_enabled = var.event_processor_warmer_enabled
   name_prefix                    = "${local.name_prefix}-ca-central-1"
   common_tags = merge(local.common_tags, {
     Region = "ca-central-1"
@@ -801,6 +818,7 @@ module "eventbridge_sa_east_1" {
   event_processor_function_name  = module.lambda.event_processor_function_name
   event_sync_schedule_expression = var.event_sync_schedule_expression
   event_sync_lookback_days       = var.event_sync_lookback_days
+  event_processor_warmer_enabled = var.event_processor_warmer_enabled
   name_prefix                    = "${local.name_prefix}-sa-east-1"
   common_tags = merge(local.common_tags, {
     Region = "sa-east-1"
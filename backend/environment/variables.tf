@@ -170,3 +170,9 @@ variable "event_sync_lookback_days" {
 }
 
 
+
+variable "event_processor_warmer_enabled" {
+  description = "Ping the event processor every 5 minutes to keep it warm (avoids cold starts)"
+  type        = bool
+  default     = false
+}
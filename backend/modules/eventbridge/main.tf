@@ -95,4 +95,42 @@ resource "aws_lambda_permission" "allow_eventbridge_sync" {
   function_name = var.event_processor_function_name
   principal     = "events.amazonaws.com"
   source_arn    = aws_cloudwatch_event_rule.event_sync_schedule[0].arn
-}
\ No newline at end of file
+}
+
+# EventBridge Scheduled Rule to keep the event processor warm (optional, deployment region only)
+# Warmup pings return immediately without creating clients or touching AWS APIs
+resource "aws_cloudwatch_event_rule" "event_processor_warmer" {
+  count = local.is_deployment_region && var.event_processor_warmer_enabled ? 1 : 0
+
+  name                = "${var.name_prefix}-warmer"
+  description         = "Keep the event processor Lambda warm"
+  schedule_expression = var.event_processor_warmer_schedule_expression
+
+  tags = merge(var.common_tags, {
+    Name = "${var.name_prefix}-warmer"
+  })
+}
+
+# EventBridge Target for the warmer (optional, deployment region only)
+resource "aws_cloudwatch_event_target" "event_processor_warmer_target" {
+  count = local.is_deployment_region && var.event_processor_warmer_enabled ? 1 : 0
+
+  rule      = aws_cloudwatch_event_rule.event_processor_warmer[0].name
+  target_id = "EventProcessorWarmer"
+  arn       = var.event_processor_function_arn
+
+  input = jsonencode({
+    warmup = true
+  })
+}
+
+# Lambda Permission for the warmer (optional, deployment region only)
+resource "aws_lambda_permission" "allow_eventbridge_warmer" {
+  count = local.is_deployment_region && var.event_processor_warmer_enabled ? 1 : 0
+
+  statement_id  = "AllowExecutionFromEventBridgeWarmer"
+  action        = "lambda:InvokeFunction"
+  function_name = var.event_processor_function_name
+  principal     = "events.amazonaws.com"
+  source_arn    = aws_cloudwatch_event_rule.event_processor_warmer[0].arn
+}
@@ -58,4 +58,16 @@ variable "event_processor_function_name" {
   description = "Event processor Lambda function name (required for scheduled sync in deployment region)"
   type        = string
   default     = ""
-}
\ No newline at end of file
+}
+
+variable "event_processor_warmer_enabled" {
+  description = "Whether to ping the event processor on a schedule to keep it warm"
+  type        = bool
+  default     = false
+}
+
+variable "event_processor_warmer_schedule_expression" {
+  description = "EventBridge schedule expression for the event processor warmer"
+  type        = string
+  default     = "rate(5 minutes)"
+}
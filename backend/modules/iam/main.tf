@@ -276,7 +276,8 @@ resource "aws_iam_role_policy" "event_processor_bedrock" {
       {
         Effect = "Allow"
         Action = [
-          "bedrock:InvokeModel"
+          "bedrock:InvokeModel",
+          "bedrock:InvokeModelWithResponseStream"
         ]
         Resource = local.bedrock_resources
       }
@@ -6,6 +6,8 @@ import re
 import time
 import traceback
 import hashlib
+import orjson
+from types import MappingProxyType
 from botocore.exceptions import ClientError
 
 from utils.config import (
@@ -13,10 +15,13 @@ from utils.config import (
     BEDROCK_TEMPERATURE,
     BEDROCK_TOP_P,
     BEDROCK_MAX_TOKENS,
+    BEDROCK_BATCH_SIZE,
+    BEDROCK_BATCH_MAX_TOKENS,
 )
 
 # Default analysis values used when Bedrock fails or returns invalid data
-DEFAULT_ANALYSIS_VALUES = {
+# Read-only so the shared fallback can't be mutated by one of the error paths
+DEFAULT_ANALYSIS_VALUES = MappingProxyType({
     "critical": False,
     "risk_level": "LOW",
     "account_impact": "LOW",
@@ -27,7 +32,163 @@ DEFAULT_ANALYSIS_VALUES = {
     "consequences_if_ignored": "Unknown",
     "affected_resources": "Unknown",
     "event_impact_type": "Informational",
-}
+})
+
+# Prompt sections shared by the single-event and batched analysis prompts.
+# Kept verbatim (including indentation) so both prompts read the same to the model.
+ANALYSIS_FOCUS_PROMPT = """        IMPORTANT ANALYSIS FOCUS:
+        1. Will this event cause workload downtime if required actions are not taken?
+        2. Will there be any service outages associated with this event?
+        3. Will the application/workload experience network integration issues between connecting systems?
+        4. What specific AWS services or resources could be impacted?
+         
+        
+        CRITICAL EVENT CRITERIA:
+        - Any event that will cause service downtime should be marked as CRITICAL
+        - Any event that will cause network integration or SSL issues between systems should be marked as CRITICAL
+        - Any event that requires immediate action to prevent outage should be marked as URGENT time sensitivity
+        - Events with high impact but no immediate downtime should be marked as HIGH risk level"""
+
+ANALYSIS_JSON_FORMAT = """        {
+          "critical": boolean,
+          "risk_level": "critical|high|medium|low",
+          "account_impact": "critical|high|medium|low",
+          "time_sensitivity": "Routine|Urgent|Critical",
+          "risk_category": "Availability|Security|Performance|Cost|Compliance",
+          "required_actions": "string",
+          "impact_analysis": "string",
+          "consequences_if_ignored": "string",
+          "affected_resources": "string",
+          "event_impact_type": "Service Outage|Billing Impact|Security Issue|Performance Degradation|Maintenance|Informational"
+        }"""
+
+ANALYSIS_GUIDELINES_PROMPT = """        IMPORTANT: In your impact_analysis field, be very specific about:
+        1. Potential outages and their estimated duration
+        2. Connectivity issues between systems
+        3. Whether this will cause downtime if actions are not taken
+        
+        In your consequences_if_ignored field, clearly state what outages or disruptions will occur if the event is not addressed.
+
+        RISK LEVEL GUIDELINES:
+        - CRITICAL: Will cause service outage or severe disruption if not addressed
+        - HIGH: Significant impact but not an immediate outage
+        - MEDIUM: Moderate impact requiring attention
+        - LOW: Minimal impact, routine maintenance
+        
+        EVENT IMPACT TYPE GUIDELINES:
+        - Service Outage: Event will cause or is causing service unavailability
+        - Billing Impact: Event affects billing or costs
+        - Security Issue: Event relates to security vulnerabilities or threats
+        - Performance Degradation: Event causes reduced performance but not complete outage
+        - Maintenance: Planned maintenance with minimal impact
+        - Informational: General information with no direct impact
+
+        IMPORTANT INTERPRETATION GUIDELINES:
+            1. Pay careful attention to conditional statements (if/then relationships)
+            2. For end-of-support notifications, clearly distinguish between:
+                - What happens if the customer takes the recommended action
+                - What happens if the customer does NOT take the recommended action
+            3. Do not conflate these scenarios or suggest negative outcomes will occur even if recommended actions are taken"""
+
+# Stagger seed derived from the Lambda log stream name, which is unique per container.
+# Uses blake2b rather than hash() so the value is stable across cold starts
+# (str hashing is randomized per process) and each container keeps its own time slot.
+STAGGER_SEED = (
+    int.from_bytes(
+        hashlib.blake2b(
+            os.environ.get("AWS_LAMBDA_LOG_STREAM_NAME", "unknown").encode(),
+            digest_size=4,
+        ).digest(),
+        "big",
+    )
+    % 1000
+)
+
+# Text allowed before the JSON value for the stream reader to stop early:
+# whitespace and an optional opening code fence such as ```json
+JSON_LEADING_TEXT_RE = re.compile(r"\s*(?:```[A-Za-z]*\s*)?")
+
+
+def read_bedrock_response_stream(event_stream, uses_messages_api):
+    """
+    Collect text from an invoke_model_with_response_stream body
+
+    When the response opens with a JSON object or array (optionally after
+    whitespace or an opening code fence), tracks bracket depth (ignoring brackets
+    inside JSON strings) and stops reading as soon as that value closes, so
+    trailing tokens such as a closing code fence are not waited for. Responses
+    with any other leading text are read to the end of the stream.
+
+    Args:
+        event_stream: EventStream from the Bedrock streaming response
+        uses_messages_api: True for Claude 3+ (messages) models, False for completion models
+
+    Returns:
+        str: Response text received up to the end of the leading JSON value
+    """
+    chunks = []
+    # None until the first bracket is seen, then whether early stop applies
+    track_json = None
+    depth = 0
+    in_string = False
+    escaped = False
+    json_complete = False
+
+    try:
+        for stream_event in event_stream:
+            chunk = stream_event.get("chunk")
+            if not chunk:
+                continue
+
+            chunk_body = orjson.loads(chunk["bytes"])
+            if uses_messages_api:
+                if chunk_body.get("type") != "content_block_delta":
+                    continue
+                text = chunk_body.get("delta", {}).get("text", "")
+            else:
+                text = chunk_body.get("completion", "")
+
+            if not text:
+                continue
+
+            for index, char in enumerate(text):
+                if track_json is False:
+                    break
+                if in_string:
+                    if escaped:
+                        escaped = False
+                    elif char == "\\":
+                        escaped = True
+                    elif char == '"':
+                        in_string = False
+                elif char == '"' and depth > 0:
+                    in_string = True
+                elif char in "{[":
+                    if track_json is None:
+                        # Only a response that starts with JSON can be cut short safely
+                        leading_text = "".join(chunks) + text[:index]
+                        track_json = bool(JSON_LEADING_TEXT_RE.fullmatch(leading_text))
+                        if not track_json:
+                            break
+                    depth += 1
+                elif char in "}]" and depth > 0:
+                    depth -= 1
+                    if depth == 0:
+                        json_complete = True
+                        # Drop anything after the closing bracket (e.g. a code fence)
+                        text = text[: index + 1]
+                        break
+
+            chunks.append(text)
+            if json_complete:
+                logging.debug("Outer JSON value closed, stopping Bedrock stream early")
+                break
+    finally:
+        # Release the connection when we stop reading before the end of the stream
+        if json_complete and hasattr(event_stream, "close"):
+            event_stream.close()
+
+    return "".join(chunks)
 
 
 def invoke_bedrock_with_advanced_retry(bedrock_client, payload, model_id):
@@ -36,7 +197,7 @@ def invoke_bedrock_with_advanced_retry(bedrock_client, payload, model_id):
 
     Features:
     - Extended retry attempts (10 instead of 5)
-    - Staggered delays based on Lambda instance ID
+    - Staggered retry delays based on Lambda instance ID
     - Progressive backoff with higher maximum delays
     - Jitter to prevent thundering herd
     - Circuit breaker pattern for persistent failures
@@ -53,16 +214,9 @@ def invoke_bedrock_with_advanced_retry(bedrock_client, payload, model_id):
     base_delay = 2  # Increased base delay
     max_delay = 60  # Maximum delay cap
 
-    # Create a unique stagger based on Lambda instance and event
-    instance_id = os.environ.get("AWS_LAMBDA_LOG_STREAM_NAME", "unknown")
-    event_hash = hashlib.md5(str(payload).encode()).hexdigest()[:8]
-    stagger_seed = hash(f"{instance_id}-{event_hash}") % 1000
-    initial_stagger = (stagger_seed / 1000) * 3  # 0-3 second initial stagger
-
-    logging.debug(
-        f"Starting Bedrock request with {initial_stagger:.2f}s initial stagger"
-    )
-    time.sleep(initial_stagger)
+    # Per-container stagger slot (see STAGGER_SEED); the initial 0-3s stagger
+    # is applied once at cold start, see COLD_START_STAGGER below
+    stagger_seed = STAGGER_SEED
 
     consecutive_throttles = 0
     response_text = ""
@@ -70,23 +224,23 @@ def invoke_bedrock_with_advanced_retry(bedrock_client, payload, model_id):
     for attempt in range(max_retries):
         try:
             logging.debug(f"Bedrock attempt {attempt + 1}/{max_retries}")
-            response = bedrock_client.invoke_model(**payload)
-            response_body = json.loads(response.get("body").read())
+            response = bedrock_client.invoke_model_with_response_stream(**payload)
 
             # Extract response based on model
-            if any(
+            uses_messages_api = any(
                 model in model_id.lower()
                 for model in ["claude-3", "claude-sonnet-4", "claude-3-7", "claude-3-5"]
-            ):
-                response_text = response_body.get("content", [{}])[0].get("text", "")
-            else:
-                response_text = response_body.get("completion", "")
+            )
+            response_text = read_bedrock_response_stream(
+                response.get("body"), uses_messages_api
+            )
 
             logging.info(f"Bedrock request successful on attempt {attempt + 1}")
             break  # Success!
 
         except ClientError as e:
-            if e.response["Error"]["Code"] == "ThrottlingException":
+            # Mid-stream throttling surfaces as an EventStreamError with a lowercase code
+            if e.response["Error"]["Code"] in ("ThrottlingException", "throttlingException"):
                 consecutive_throttles += 1
 
                 if attempt < max_retries - 1:  # Don't sleep on last attempt
@@ -135,6 +289,93 @@ def invoke_bedrock_with_advanced_retry(bedrock_client, payload, model_id):
     return response_text
 
 
+def build_bedrock_payload(prompt, max_tokens):
+    """
+    Build the invoke_model request for the configured Bedrock model
+
+    Args:
+        prompt (str): Prompt text
+        max_tokens (int): Maximum tokens to generate
+
+    Returns:
+        dict: Keyword arguments for invoke_model / invoke_model_with_response_stream
+    """
+    model_id = BEDROCK_MODEL_ID
+    temperature = BEDROCK_TEMPERATURE
+    top_p = BEDROCK_TOP_P
+
+    logging.info(f"Sending request to Bedrock model: '{model_id}'")
+
+    if any(
+        model in model_id.lower()
+        for model in ["claude-3", "claude-sonnet-4", "claude-3-7", "claude-3-5"]
+    ):
+        # Modern Claude models use the messages format
+        payload = {
+            "modelId": model_id,
+            "contentType": "application/json",
+            "accept": "application/json",
+            "body": orjson.dumps(
+                {
+                    "anthropic_version": "bedrock-2023-05-31",
+                    "max_tokens": max_tokens,
+                    "temperature": temperature,
+                    "top_p": top_p,
+                    "messages": [{"role": "user", "content": prompt}],
+                }
+            ),
+        }
+    else:
+        # Claude 2 and other models use the older prompt format
+        payload = {
+            "modelId": model_id,
+            "contentType": "application/json",
+            "accept": "application/json",
+            "body": orjson.dumps(
+                {
+                    "prompt": f"\n\nHuman: {prompt}\n\nAssistant:",
+                    "max_tokens_to_sample": max_tokens,
+                    "temperature": temperature,
+                    "top_p": top_p,
+                }
+            ),
+        }
+
+    return payload
+
+
+def normalize_risk_level(analysis):
+    """
+    Normalize the risk_level of a parsed Bedrock analysis in place
+
+    Args:
+        analysis (dict): Parsed analysis JSON
+
+    Returns:
+        dict: The same analysis dictionary
+    """
+    if "risk_level" in analysis:
+        risk_level = analysis["risk_level"].strip().upper()
+
+        # Ensure "critical" is properly recognized and distinguished from "high"
+        if risk_level in ["CRITICAL", "SEVERE"]:
+            analysis["risk_level"] = "CRITICAL"
+            # Make sure critical boolean flag is consistent
+            analysis["critical"] = True
+        elif risk_level == "HIGH":
+            analysis["risk_level"] = "HIGH"
+        elif risk_level in ["MEDIUM", "MODERATE"]:
+            analysis["risk_level"] = "MEDIUM"
+        elif risk_level == "LOW":
+            analysis["risk_level"] = "LOW"
+
+        # If critical flag is True but risk_level isn't CRITICAL, fix it
+        if analysis.get("critical", False) and analysis["risk_level"] != "CRITICAL":
+            analysis["risk_level"] = "CRITICAL"
+
+    return analysis
+
+
 def generate_fallback_analysis(event_data):
     """
     Generate basic analysis when Bedrock is unavailable
@@ -182,7 +423,7 @@ def generate_fallback_analysis(event_data):
         ),
     }
 
-    return f"FALLBACK ANALYSIS (Bedrock unavailable):\n```json\n{json.dumps(fallback_analysis, indent=2)}\n```"
+    return f"FALLBACK ANALYSIS (Bedrock unavailable):\n```json\n{orjson.dumps(fallback_analysis, option=orjson.OPT_INDENT_2).decode()}\n```"
 
 
 def analyze_event_with_bedrock(bedrock_client, event_data):
@@ -230,18 +471,7 @@ def analyze_event_with_bedrock(bedrock_client, event_data):
         Event Description:
         {description}
         
-        IMPORTANT ANALYSIS FOCUS:
-        1. Will this event cause workload downtime if required actions are not taken?
-        2. Will there be any service outages associated with this event?
-        3. Will the application/workload experience network integration issues between connecting systems?
-        4. What specific AWS services or resources could be impacted?
-         
-        
-        CRITICAL EVENT CRITERIA:
-        - Any event that will cause service downtime should be marked as CRITICAL
-        - Any event that will cause network integration or SSL issues between systems should be marked as CRITICAL
-        - Any event that requires immediate action to prevent outage should be marked as URGENT time sensitivity
-        - Events with high impact but no immediate downtime should be marked as HIGH risk level
+{ANALYSIS_FOCUS_PROMPT}
     
         CRITICAL OUTPUT REQUIREMENTS:
         - Return ONLY valid JSON - no explanatory text, no markdown formatting, no preamble
@@ -251,90 +481,14 @@ def analyze_event_with_bedrock(bedrock_client, event_data):
         - Your entire response must be parseable by json.loads()
         
         Provide your analysis in this exact JSON format:
-        {{
-          "critical": boolean,
-          "risk_level": "critical|high|medium|low",
-          "account_impact": "critical|high|medium|low",
-          "time_sensitivity": "Routine|Urgent|Critical",
-          "risk_category": "Availability|Security|Performance|Cost|Compliance",
-          "required_actions": "string",
-          "impact_analysis": "string",
-          "consequences_if_ignored": "string",
-          "affected_resources": "string",
-          "event_impact_type": "Service Outage|Billing Impact|Security Issue|Performance Degradation|Maintenance|Informational"
-        }}
-        
-        IMPORTANT: In your impact_analysis field, be very specific about:
-        1. Potential outages and their estimated duration
-        2. Connectivity issues between systems
-        3. Whether this will cause downtime if actions are not taken
-        
-        In your consequences_if_ignored field, clearly state what outages or disruptions will occur if the event is not addressed.
-
-        RISK LEVEL GUIDELINES:
-        - CRITICAL: Will cause service outage or severe disruption if not addressed
-        - HIGH: Significant impact but not an immediate outage
-        - MEDIUM: Moderate impact requiring attention
-        - LOW: Minimal impact, routine maintenance
+{ANALYSIS_JSON_FORMAT}
         
-        EVENT IMPACT TYPE GUIDELINES:
-        - Service Outage: Event will cause or is causing service unavailability
-        - Billing Impact: Event affects billing or costs
-        - Security Issue: Event relates to security vulnerabilities or threats
-        - Performance Degradation: Event causes reduced performance but not complete outage
-        - Maintenance: Planned maintenance with minimal impact
-        - Informational: General information with no direct impact
-
-        IMPORTANT INTERPRETATION GUIDELINES:
-            1. Pay careful attention to conditional statements (if/then relationships)
-            2. For end-of-support notifications, clearly distinguish between:
-                - What happens if the customer takes the recommended action
-                - What happens if the customer does NOT take the recommended action
-            3. Do not conflate these scenarios or suggest negative outcomes will occur even if recommended actions are taken
+{ANALYSIS_GUIDELINES_PROMPT}
         """
 
         # Determine which model we're using and format accordingly
         model_id = BEDROCK_MODEL_ID
-        max_tokens = BEDROCK_MAX_TOKENS
-        temperature = BEDROCK_TEMPERATURE
-        top_p = BEDROCK_TOP_P
-
-        logging.info(f"Sending request to Bedrock model: '{model_id}'")
-
-        if any(
-            model in model_id.lower()
-            for model in ["claude-3", "claude-sonnet-4", "claude-3-7", "claude-3-5"]
-        ):
-            # Modern Claude models use the messages format
-            payload = {
-                "modelId": model_id,
-                "contentType": "application/json",
-                "accept": "application/json",
-                "body": json.dumps(
-                    {
-                        "anthropic_version": "bedrock-2023-05-31",
-                        "max_tokens": max_tokens,
-                        "temperature": temperature,
-                        "top_p": top_p,
-                        "messages": [{"role": "user", "content": prompt}],
-                    }
-                ),
-            }
-        else:
-            # Claude 2 and other models use the older prompt format
-            payload = {
-                "modelId": model_id,
-                "contentType": "application/json",
-                "accept": "application/json",
-                "body": json.dumps(
-                    {
-                        "prompt": f"\n\nHuman: {prompt}\n\nAssistant:",
-                        "max_tokens_to_sample": max_tokens,
-                        "temperature": temperature,
-                        "top_p": top_p,
-                    }
-                ),
-            }
+        payload = build_bedrock_payload(prompt, BEDROCK_MAX_TOKENS)
 
         # Call Bedrock with advanced retry strategy for concurrent processing
         try:
@@ -366,7 +520,7 @@ def analyze_event_with_bedrock(bedrock_client, event_data):
         # Parse JSON with progressive fallback strategy
         try:
             # Primary: Parse as-is (should work with updated prompt)
-            analysis = json.loads(json_str)
+            analysis = orjson.loads(json_str)
         except json.JSONDecodeError:
             # Fallback 1: Try lenient parsing for minor formatting issues
             try:
@@ -379,32 +533,12 @@ def analyze_event_with_bedrock(bedrock_client, event_data):
                     return f'"{content}"'
                 
                 json_str = re.sub(r'"([^"]*)"', escape_control_chars, json_str)
-                analysis = json.loads(json_str)
+                analysis = orjson.loads(json_str)
 
         # At this point, analysis is already parsed from the try blocks above
         # Normalize risk level to ensure consistency
         try:
-            if "risk_level" in analysis:
-                risk_level = analysis["risk_level"].strip().upper()
-
-                # Ensure "critical" is properly recognized and distinguished from "high"
-                if risk_level in ["CRITICAL", "SEVERE"]:
-                    analysis["risk_level"] = "CRITICAL"
-                    # Make sure critical boolean flag is consistent
-                    analysis["critical"] = True
-                elif risk_level == "HIGH":
-                    analysis["risk_level"] = "HIGH"
-                elif risk_level in ["MEDIUM", "MODERATE"]:
-                    analysis["risk_level"] = "MEDIUM"
-                elif risk_level == "LOW":
-                    analysis["risk_level"] = "LOW"
-
-                # If critical flag is True but risk_level isn't CRITICAL, fix it
-                if (
-                    analysis.get("critical", False)
-                    and analysis["risk_level"] != "CRITICAL"
-                ):
-                    analysis["risk_level"] = "CRITICAL"
+            normalize_risk_level(analysis)
 
             # Update event data with analysis
             event_data.update(analysis)
@@ -438,7 +572,7 @@ def analyze_event_with_bedrock(bedrock_client, event_data):
                     fixed_json_str += '}' * (open_braces - close_braces)
                     
                     logging.info(f"Attempting to parse fixed JSON with {open_braces - close_braces} added closing braces")
-                    analysis = json.loads(fixed_json_str)
+                    analysis = orjson.loads(fixed_json_str)
                     
                     # Fill in any missing required fields with defaults from DEFAULT_ANALYSIS_VALUES
                     for field, default_value in DEFAULT_ANALYSIS_VALUES.items():
@@ -460,7 +594,9 @@ def analyze_event_with_bedrock(bedrock_client, event_data):
 
     except Exception as e:
         logging.error(f"Error in Bedrock analysis: {str(e)}")
-        logging.error(f"{traceback.format_exc()}")
+        # Only format the traceback when debug logging is on (walking frames is not free)
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug(traceback.format_exc())
 
         # Provide default values if Bedrock analysis fails
         event_data.update(DEFAULT_ANALYSIS_VALUES)
@@ -468,6 +604,147 @@ def analyze_event_with_bedrock(bedrock_client, event_data):
         return event_data
 
 
+def analyze_events_batch(bedrock_client, events_data):
+    """
+    Analyze several AWS Health events with a single Bedrock request
+
+    Each event is given an id (its position in the list) and the model returns a
+    JSON array of analyses carrying that id. Lists longer than BEDROCK_BATCH_SIZE
+    are split into several requests. Events missing from the response, entries
+    that can't be applied, or a whole batch whose response can't be parsed fall
+    back to analyze_event_with_bedrock.
+
+    Args:
+        bedrock_client: Bedrock client instance
+        events_data (list): Event data dictionaries to analyze
+
+    Returns:
+        tuple: (event data dictionaries updated with analysis fields in input order,
+                number of Bedrock requests made including per-event fallbacks)
+    """
+    bedrock_requests = 0
+    for offset in range(0, len(events_data), BEDROCK_BATCH_SIZE):
+        batch = events_data[offset:offset + BEDROCK_BATCH_SIZE]
+
+        if len(batch) == 1:
+            analyze_event_with_bedrock(bedrock_client, batch[0])
+            bedrock_requests += 1
+            continue
+
+        analyses_by_id = {}
+        try:
+            events_prompt = []
+            for event_id, event_data in enumerate(batch):
+                start_time = event_data.get(
+                    "startTime", event_data.get("start_time", "Unknown")
+                )
+                if hasattr(start_time, "isoformat"):
+                    start_time = start_time.isoformat()
+
+                # Same truncation as the single-event prompt to prevent token exhaustion
+                description = event_data.get("description", "No description available")
+                if len(description) > 3000:
+                    description = description[:3000] + "\n\n[Description truncated for analysis - full details available in event]"
+
+                events_prompt.append(
+                    {
+                        "id": event_id,
+                        "type": event_data.get(
+                            "eventTypeCode", event_data.get("event_type", "Unknown")
+                        ),
+                        "category": event_data.get(
+                            "eventTypeCategory",
+                            event_data.get("event_type_category", "Unknown"),
+                        ),
+                        "region": event_data.get("region", "Unknown"),
+                        "start_time": str(start_time),
+                        "description": description,
+                    }
+                )
+
+            prompt = f"""
+        You are an AWS expert specializing in outage analysis and business continuity. Your task is to analyze each of the following {len(batch)} AWS Health events independently and determine its potential impact on workload availability, system connectivity, and service outages.
+
+        AWS Health Events (JSON array):
+        {orjson.dumps(events_prompt, option=orjson.OPT_INDENT_2).decode()}
+
+{ANALYSIS_FOCUS_PROMPT}
+
+        CRITICAL OUTPUT REQUIREMENTS:
+        - Return ONLY a valid JSON array with exactly one object per event - no explanatory text, no markdown formatting, no preamble
+        - Each object must include the "id" of the event it analyzes
+        - Do not wrap the JSON in ```json``` code blocks
+        - Do not include any text before or after the JSON array
+        - Ensure all string values use proper escape sequences for special characters
+        - Your entire response must be parseable by json.loads()
+
+        Each object in the array must use this exact JSON format, plus an integer "id" field:
+{ANALYSIS_JSON_FORMAT}
+
+{ANALYSIS_GUIDELINES_PROMPT}
+        """
+
+            payload = build_bedrock_payload(
+                prompt,
+                min(BEDROCK_MAX_TOKENS * len(batch), BEDROCK_BATCH_MAX_TOKENS),
+            )
+            bedrock_requests += 1
+            response_text = invoke_bedrock_with_advanced_retry(
+                bedrock_client, payload, BEDROCK_MODEL_ID
+            )
+
+            # Extract the JSON array (tolerate code fences or leading text)
+            json_str = response_text.strip()
+            json_match = re.search(r"(\[.*\])", json_str, re.DOTALL)
+            if json_match:
+                json_str = json_match.group(1)
+            try:
+                analyses = orjson.loads(json_str)
+            except json.JSONDecodeError:
+                analyses = json.loads(json_str, strict=False)
+
+            for analysis in analyses:
+                if isinstance(analysis, dict) and isinstance(analysis.get("id"), int):
+                    analyses_by_id[analysis.pop("id")] = analysis
+
+        except Exception as e:
+            logging.warning(
+                f"Batched Bedrock analysis of {len(batch)} events failed, "
+                f"falling back to per-event analysis: {str(e)}"
+            )
+
+        batched_count = 0
+        for event_id, event_data in enumerate(batch):
+            analysis = analyses_by_id.get(event_id)
+            if analysis is not None:
+                try:
+                    normalize_risk_level(analysis)
+                    analysis_text = orjson.dumps(analysis).decode()
+                except Exception as e:
+                    # e.g. a null or non-string risk_level from the model
+                    logging.warning(
+                        f"Invalid batched analysis for event {event_id}, "
+                        f"falling back to per-event analysis: {str(e)}"
+                    )
+                    analysis = None
+
+            if analysis is None:
+                analyze_event_with_bedrock(bedrock_client, event_data)
+                bedrock_requests += 1
+                continue
+
+            event_data["analysis_text"] = analysis_text
+            event_data.update(analysis)
+            batched_count += 1
+
+        logging.info(
+            f"Batched Bedrock analysis: {batched_count}/{len(batch)} events "
+            f"analyzed in a single request"
+        )
+
+    return events_data, bedrock_requests
+
+
 def categorize_analysis(analysis_text):
     """
     Extract structured data from Bedrock analysis text
@@ -504,7 +781,7 @@ def categorize_analysis(analysis_text):
 
         # Try to parse as JSON first
         try:
-            json_data = json.loads(analysis_text)
+            json_data = orjson.loads(analysis_text)
             # If successful, update our categories with values from the JSON
             for key in categories.keys():
                 if key in json_data:
@@ -598,3 +875,12 @@ def categorize_analysis(analysis_text):
         logging.error(f"Error categorizing analysis: {str(e)}")
 
     return categories
+
+
+# Initial stagger (0-3 seconds) applied once per container at cold start rather than
+# before every Bedrock request, so warm invocations don't pay it on each call.
+# Only sleeps inside Lambda (log stream name set), not when imported locally.
+COLD_START_STAGGER = (STAGGER_SEED / 1000) * 3
+if os.environ.get("AWS_LAMBDA_LOG_STREAM_NAME"):
+    logging.debug(f"Applying {COLD_START_STAGGER:.2f}s cold start Bedrock stagger")
+    time.sleep(COLD_START_STAGGER)
@@ -0,0 +1,224 @@
+"""
+Tests for Bedrock response handling in the analyzer
+"""
+
+import os
+import sys
+
+import orjson
+from hypothesis import given, strategies as st
+
+# The analyzer imports its siblings as top-level packages (utils.config, ...)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analysis import bedrock_analyzer
+from analysis.bedrock_analyzer import analyze_events_batch, read_bedrock_response_stream
+
+
+class FakeEventStream:
+    """Minimal stand-in for a botocore EventStream that records how far it was read"""
+
+    def __init__(self, texts, uses_messages_api=True):
+        self.events = []
+        for text in texts:
+            if uses_messages_api:
+                body = {"type": "content_block_delta", "delta": {"text": text}}
+            else:
+                body = {"completion": text}
+            self.events.append({"chunk": {"bytes": orjson.dumps(body)}})
+        self.consumed = 0
+        self.closed = False
+
+    def __iter__(self):
+        for stream_event in self.events:
+            self.consumed += 1
+            yield stream_event
+
+    def close(self):
+        self.closed = True
+
+
+def split_text(text, sizes):
+    """Split text into consecutive chunks using the given sizes, keeping any remainder"""
+    chunks = []
+    position = 0
+    for size in sizes:
+        if position >= len(text):
+            break
+        chunks.append(text[position:position + size])
+        position += size
+    if position < len(text):
+        chunks.append(text[position:])
+    return chunks
+
+
+# Property Test 1: Leading JSON stops the stream at the closing bracket
+@given(
+    value=st.dictionaries(
+        st.text(min_size=1, max_size=10),
+        st.text(alphabet='ab{}[]"\\ ', max_size=20),
+        min_size=1,
+        max_size=5,
+    ),
+    sizes=st.lists(st.integers(min_value=1, max_value=8), max_size=30),
+    uses_messages_api=st.booleans(),
+)
+def test_leading_json_stops_early(value, sizes, uses_messages_api):
+    """
+    For any JSON object sent on its own or inside a code fence, the reader should
+    return exactly that object and close the stream without reading the trailer.
+    """
+    json_text = orjson.dumps(value).decode()
+    for prefix, suffix in (("", ""), ("  \n", "\n"), ("```json\n", "\n```")):
+        texts = split_text(prefix + json_text + suffix, sizes) + ["\nunread trailer"]
+        stream = FakeEventStream(texts, uses_messages_api)
+
+        result = read_bedrock_response_stream(stream, uses_messages_api)
+
+        assert result.strip().removeprefix("```json").strip() == json_text
+        assert stream.closed, "Stream should be closed after stopping early"
+        assert stream.consumed < len(texts), "Trailing chunks should not be read"
+
+
+# Property Test 2: Any other leading text reads the whole stream
+@given(
+    sizes=st.lists(st.integers(min_value=1, max_value=8), max_size=30),
+)
+def test_preamble_reads_whole_stream(sizes):
+    """
+    Brackets in leading prose must not be mistaken for the JSON value, so the
+    full response is returned for the legacy extraction fallbacks.
+    """
+    text = 'Note [1]: {"a": 1} and [2]\n```json\n{"b": [1, 2]}\n```'
+    stream = FakeEventStream(split_text(text, sizes))
+
+    result = read_bedrock_response_stream(stream, True)
+
+    assert result == text
+    assert not stream.closed, "Stream read to the end should not be closed early"
+    assert stream.consumed == len(stream.events)
+
+
+def test_preamble_example():
+    """The reviewed example keeps the JSON object that follows the preamble"""
+    stream = FakeEventStream(['Note [1]: {"a":', "1}"])
+    assert read_bedrock_response_stream(stream, True) == 'Note [1]: {"a":1}'
+
+
+def test_code_fence_example():
+    """A fenced array stops at its closing bracket, before the closing fence"""
+    stream = FakeEventStream(["```json\n[", '{"id": 0, "x": "]"}', "]", "\n```"])
+    assert read_bedrock_response_stream(stream, True) == '```json\n[{"id": 0, "x": "]"}]'
+    assert stream.closed
+
+
+def run_batch_analysis(events_data, response_text):
+    """
+    Run analyze_events_batch with the Bedrock request and the per-event fallback
+    replaced, returning (results, request count, ids sent to the fallback)
+    """
+    fallback_ids = []
+
+    def fake_invoke(bedrock_client, payload, model_id):
+        return response_text
+
+    def fake_single_analysis(bedrock_client, event_data):
+        fallback_ids.append(event_data["id"])
+        event_data["risk_level"] = "FALLBACK"
+        return event_data
+
+    original_invoke = bedrock_analyzer.invoke_bedrock_with_advanced_retry
+    original_single = bedrock_analyzer.analyze_event_with_bedrock
+    bedrock_analyzer.invoke_bedrock_with_advanced_retry = fake_invoke
+    bedrock_analyzer.analyze_event_with_bedrock = fake_single_analysis
+    try:
+        results, bedrock_requests = analyze_events_batch(None, events_data)
+    finally:
+        bedrock_analyzer.invoke_bedrock_with_advanced_retry = original_invoke
+        bedrock_analyzer.analyze_event_with_bedrock = original_single
+    return results, bedrock_requests, fallback_ids
+
+
+# Property Test 3: Batched analyses are applied to the event with the matching id
+@given(
+    risk_levels=st.lists(
+        st.sampled_from(["low", "medium", "high", "critical"]), min_size=2, max_size=5
+    ),
+    order=st.randoms(use_true_random=False),
+)
+def test_batch_maps_analyses_by_id(risk_levels, order):
+    """
+    For any response order, each event should get the analysis carrying its id,
+    with a single Bedrock request and no per-event fallback.
+    """
+    events_data = [{"id": index} for index in range(len(risk_levels))]
+    analyses = [
+        {"id": index, "risk_level": risk_level, "impact_analysis": f"event {index}"}
+        for index, risk_level in enumerate(risk_levels)
+    ]
+    order.shuffle(analyses)
+
+    results, bedrock_requests, fallback_ids = run_batch_analysis(
+        events_data, "```json\n" + orjson.dumps(analyses).decode() + "\n```"
+    )
+
+    assert bedrock_requests == 1
+    assert fallback_ids == []
+    for index, event_data in enumerate(results):
+        assert event_data["impact_analysis"] == f"event {index}"
+        assert event_data["risk_level"] == risk_levels[index].upper()
+        assert "id" not in orjson.loads(event_data["analysis_text"])
+
+
+def test_batch_missing_and_invalid_entries_fall_back():
+    """Missing ids and entries that can't be normalized are analyzed one by one"""
+    events_data = [{"id": index} for index in range(5)]
+    response_text = orjson.dumps(
+        [
+            {"id": 0, "risk_level": "high"},
+            {"id": 1, "risk_level": None},
+            {"id": 2, "risk_level": 3},
+            {"id": "3", "risk_level": "low"},
+            "not an object",
+        ]
+    ).decode()
+
+    results, bedrock_requests, fallback_ids = run_batch_analysis(events_data, response_text)
+
+    assert results[0]["risk_level"] == "HIGH"
+    assert fallback_ids == [1, 2, 3, 4]
+    assert bedrock_requests == 5, "One batched request plus four per-event fallbacks"
+
+
+def test_batch_unparseable_response_falls_back():
+    """A response without a JSON array sends every event to the fallback"""
+    events_data = [{"id": index} for index in range(3)]
+
+    results, bedrock_requests, fallback_ids = run_batch_analysis(
+        events_data, "Sorry, I can't help with that."
+    )
+
+    assert fallback_ids == [0, 1, 2]
+    assert bedrock_requests == 4
+    assert all(event_data["risk_level"] == "FALLBACK" for event_data in results)
+
+
+if __name__ == "__main__":
+    print("Running Property Test 1: Leading JSON stops the stream early...")
+    test_leading_json_stops_early()
+    print("✓ Property Test 1 passed")
+
+    print("Running Property Test 2: Preamble text reads the whole stream...")
+    test_preamble_reads_whole_stream()
+    print("✓ Property Test 2 passed")
+
+    test_preamble_example()
+    test_code_fence_example()
+
+    print("Running Property Test 3: Batched analyses are mapped by id...")
+    test_batch_maps_analyses_by_id()
+    print("✓ Property Test 3 passed")
+
+    test_batch_missing_and_invalid_entries_fall_back()
+    test_batch_unparseable_response_falls_back()
+    print("\nAll tests passed!")
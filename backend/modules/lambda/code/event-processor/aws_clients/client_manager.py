@@ -3,9 +3,24 @@ AWS client management and initialization
 """
 
 import boto3
+import functools
+import logging
 import os
+from botocore.config import Config
 
+# One botocore session per container: credentials, endpoint data and service models
+# are resolved once and shared by every client built from it
+boto_session = boto3.session.Session()
 
+# Keep-alive pooled connections and standard retries for the Bedrock, SQS and DynamoDB clients
+CLIENT_CONFIG = Config(
+    tcp_keepalive=True,
+    retries={"mode": "standard"},
+    max_pool_connections=10,
+)
+
+
+@functools.lru_cache(maxsize=1)
 def get_clients():
     """
     Get initialized AWS clients (cached per Lambda container)
@@ -13,14 +28,31 @@ def get_clients():
     Returns:
         tuple: (health_client, bedrock_client, sqs_client)
     """
+    # Import here to avoid circular dependency (health_client builds from boto_session)
+    from aws_clients.health_client import get_health_client
+
     # Health API must always use us-east-1 for organizational health events
-    health_client = boto3.client("health", region_name="us-east-1")
+    health_client = get_health_client()
 
     # Initialize Bedrock client - use deployment region or fallback to us-east-1
     bedrock_region = os.environ.get("AWS_REGION", os.environ.get("BEDROCK_REGION", "us-east-1"))
-    bedrock_client = boto3.client("bedrock-runtime", region_name=bedrock_region)
+    bedrock_client = boto_session.client(
+        "bedrock-runtime", region_name=bedrock_region, config=CLIENT_CONFIG
+    )
 
     # Initialize SQS client for parallel processing - use current region
-    sqs_client = boto3.client("sqs")
+    sqs_client = boto_session.client("sqs", config=CLIENT_CONFIG)
 
+    logging.info(f"Initialized AWS clients (Bedrock region: {bedrock_region}, keep-alive enabled)")
     return health_client, bedrock_client, sqs_client
+
+
+@functools.lru_cache(maxsize=1)
+def get_dynamodb_resource():
+    """
+    Get the DynamoDB resource (cached per Lambda container)
+
+    Returns:
+        boto3.resource: DynamoDB service resource
+    """
+    return boto_session.resource("dynamodb", config=CLIENT_CONFIG)
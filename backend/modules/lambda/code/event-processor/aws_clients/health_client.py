@@ -1,21 +1,130 @@
-import boto3
+import collections.abc
+import concurrent.futures
+import functools
+import itertools
 import logging
+import threading
+import time
+from botocore.config import Config
 from botocore.exceptions import ClientError
+from aws_clients.client_manager import boto_session
+from utils.config import HEALTH_ORG_VIEW_ENABLED
 from utils.helpers import get_account_id_from_event
 
-
+# Keep connections alive across paginated calls and let botocore back off on throttling
+HEALTH_CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    retries={"max_attempts": 10, "mode": "adaptive"},
+    tcp_keepalive=True,
+    connect_timeout=3,
+    read_timeout=20,
+)
+
+# Concurrent describe_affected_entities_for_organization calls per event (bounded to stay under throttling limits)
+STATUS_BATCH_MAX_WORKERS = 8
+
+# Map entity status to event status
+ENTITY_STATUS_MAPPING = {
+    'IMPAIRED': 'open',      # Resource is impaired = event is open
+    'PENDING': 'open',       # Issue is pending = event is open
+    'UNIMPAIRED': 'closed',  # Resource is unimpaired = event is closed
+    'RESOLVED': 'closed',    # Issue is resolved = event is closed
+    'UNKNOWN': 'unknown',    # Unknown status = unknown
+}
+
+# In-flight fetch_per_account_status_batch calls keyed by (event_arn, event_level_status),
+# each a list of (frozenset of account IDs, Future) so overlapping requests share one fetch
+_inflight_status_fetches = {}
+_inflight_status_lock = threading.Lock()
+
+# Paging for describe_affected_entities_for_organization (100 is the API maximum per page)
+ENTITY_PAGINATION_CONFIG = {'PageSize': 100}
+# Organization entity/event-detail filters accepted per call (AWS API limit)
+ORG_FILTERS_PER_CALL = 10
+
+# "Worst case wins" ordering for per-account status merges (higher = more actionable)
+STATUS_PRIORITY = {'unknown': -1, 'closed': 0, 'upcoming': 1, 'open': 2}
+PRIORITY_STATUS = {priority: status for status, priority in STATUS_PRIORITY.items()}
+OPEN_PRIORITY = STATUS_PRIORITY['open']
+# Entity status code -> priority directly, so the per-entity hot loop is a single dict lookup
+ENTITY_STATUS_PRIORITY = {code: STATUS_PRIORITY[status] for code, status in ENTITY_STATUS_MAPPING.items()}
+
+# Organization view enablement is deployment configuration, so probe it once per container
+_org_view_enabled = None
+# Account this Lambda runs in, cached only after a successful STS lookup
+_current_account_id = None
+
+# Shared pool for issuing the independent event-details and affected-entities calls side by side
+_details_executor = concurrent.futures.ThreadPoolExecutor(max_workers=16)
+
+# Short-lived cache of event details so fan-out within an invocation doesn't refetch the same event
+EVENT_DETAILS_CACHE_TTL_SECONDS = 60
+EVENT_DETAILS_CACHE_MAX_ENTRIES = 1024
+_event_details_cache = {}
+_event_details_cache_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
 def get_health_client():
-    """Get AWS Health client"""
-    return boto3.client("health", region_name="us-east-1")
+    """Get AWS Health client (built once per Lambda container)"""
+    return boto_session.client("health", region_name="us-east-1", config=HEALTH_CLIENT_CONFIG)
+
+
+def get_current_account_id():
+    """
+    Get the account ID this Lambda runs in (None if unavailable)
+
+    Successful lookups are cached for the container; failures are retried on the next call
+    so a transient STS error doesn't disable the same-account paths for the container's life.
+    """
+    global _current_account_id
+
+    if _current_account_id is None:
+        try:
+            _current_account_id = boto_session.client("sts").get_caller_identity()["Account"]
+        except Exception as e:
+            logging.warning(f"Could not determine current account ID: {str(e)}")
+    return _current_account_id
+
+
+def _get_cached_event_details(cache_key):
+    """Return cached event details for cache_key, or None if missing or expired"""
+    with _event_details_cache_lock:
+        entry = _event_details_cache.get(cache_key)
+    if entry and time.monotonic() - entry[0] < EVENT_DETAILS_CACHE_TTL_SECONDS:
+        return entry[1]
+    return None
+
+
+def _cache_event_details(cache_key, health_data):
+    """Cache a successful event details lookup (failed/empty lookups are not cached)"""
+    if not health_data.get("details"):
+        return
+    with _event_details_cache_lock:
+        if len(_event_details_cache) >= EVENT_DETAILS_CACHE_MAX_ENTRIES:
+            # Entries are insertion ordered, so the first one is the oldest
+            _event_details_cache.pop(next(iter(_event_details_cache)))
+        _event_details_cache[cache_key] = (time.monotonic(), health_data)
 
 
 def is_org_view_enabled():
     """
-    Check if AWS Health Organization View is enabled
+    Check if AWS Health Organization View is enabled (probed once per container)
 
     Returns:
         bool: True if organization view is enabled, False otherwise
     """
+    global _org_view_enabled
+
+    if _org_view_enabled is not None:
+        return _org_view_enabled
+
+    # Known-good deployments can skip the probe entirely
+    if HEALTH_ORG_VIEW_ENABLED.lower() in ("true", "false"):
+        _org_view_enabled = HEALTH_ORG_VIEW_ENABLED.lower() == "true"
+        logging.info(f"Organization view set by HEALTH_ORG_VIEW_ENABLED: {_org_view_enabled}")
+        return _org_view_enabled
+
     try:
         # Try to call an organization-specific API to check if it's enabled
         health_client = get_health_client()
@@ -25,6 +134,7 @@ def is_org_view_enabled():
         # This will throw an exception if org view is not enabled
         health_client.describe_events_for_organization(filter={}, maxResults=1)
         logging.info("Organization view test successful")
+        _org_view_enabled = True
         return True
     except Exception as e:
         error_code = getattr(e, "response", {}).get("Error", {}).get("Code", "")
@@ -32,6 +142,9 @@ def is_org_view_enabled():
         logging.warning(
             f"Organization view test failed - Error Code: {error_code}, Message: {error_message}"
         )
+        # Only remember definitive answers - a throttled or failed probe is retried next time
+        if error_code and error_code not in ("ThrottlingException", "TooManyRequestsException"):
+            _org_view_enabled = False
         if error_code == "SubscriptionRequiredException":
             return False
         # For any other error, assume we don't have org view permissions
@@ -48,18 +161,25 @@ def fetch_health_event_details(event_arn):
     Returns:
         dict: Event details including affected resources
     """
+    cache_key = (event_arn, None, False)
+    cached = _get_cached_event_details(cache_key)
+    if cached is not None:
+        return cached
+
     try:
         health_client = get_health_client()
 
-        # Get event details
-        event_details = health_client.describe_event_details(eventArns=[event_arn])
-
-        # Get affected entities
-        affected_entities = health_client.describe_affected_entities(
-            filter={"eventArns": [event_arn]}
+        # Get event details and affected entities concurrently (independent calls)
+        details_future = _details_executor.submit(
+            health_client.describe_event_details, eventArns=[event_arn]
         )
+        entities_future = _details_executor.submit(
+            health_client.describe_affected_entities, filter={"eventArns": [event_arn]}
+        )
+        event_details = details_future.result()
+        affected_entities = entities_future.result()
 
-        return {
+        health_data = {
             "details": (
                 event_details.get("successfulSet", [{}])[0]
                 if event_details.get("successfulSet")
@@ -67,11 +187,35 @@ def fetch_health_event_details(event_arn):
             ),
             "entities": affected_entities.get("entities", []),
         }
+        _cache_event_details(cache_key, health_data)
+        return health_data
     except Exception as e:
         logging.error(f"Error fetching Health API data: {str(e)}")
         return {"details": {}, "entities": []}
 
 
+def iter_affected_accounts(event_arn):
+    """
+    Lazily yield affected account IDs for an event, fetching pages only as they are consumed
+
+    Can be passed straight to fetch_per_account_status_batch so status lookups for the first
+    accounts start while later pages are still being fetched.
+
+    Args:
+        event_arn (str): ARN of the health event
+
+    Yields:
+        str: Affected account ID
+    """
+    paginator = get_health_client().get_paginator("describe_affected_accounts_for_organization")
+    pages = paginator.paginate(eventArn=event_arn, PaginationConfig={"PageSize": 100})  # Request maximum per page
+
+    for page_count, page in enumerate(pages, 1):
+        page_accounts = page.get("affectedAccounts", [])
+        logging.debug(f"Page {page_count}: Retrieved {len(page_accounts)} accounts for event {event_arn}")
+        yield from page_accounts
+
+
 def fetch_affected_accounts_for_event(event_arn, max_accounts=None):
     """
     Fetch all affected accounts for an event with pagination support
@@ -84,48 +228,12 @@ def fetch_affected_accounts_for_event(event_arn, max_accounts=None):
         list: List of affected account IDs
     """
     try:
-        health_client = get_health_client()
-        all_affected_accounts = []
-        next_token = None
-        page_count = 0
-
-        while True:
-            page_count += 1
-            
-            # Build request parameters
-            request_params = {
-                "eventArn": event_arn,
-                "maxResults": 100  # Request maximum per page
-            }
-            
-            if next_token:
-                request_params["nextToken"] = next_token
-
-            # Fetch affected accounts
-            logging.debug(f"Fetching affected accounts page {page_count} for event {event_arn}")
-            accounts_response = health_client.describe_affected_accounts_for_organization(
-                **request_params
-            )
-
-            # Add accounts from this page
-            page_accounts = accounts_response.get("affectedAccounts", [])
-            all_affected_accounts.extend(page_accounts)
-            
-            logging.debug(f"Page {page_count}: Retrieved {len(page_accounts)} accounts (total: {len(all_affected_accounts)})")
-
-            # Check if we've hit the max_accounts limit
-            if max_accounts and len(all_affected_accounts) >= max_accounts:
-                logging.info(f"Reached max_accounts limit of {max_accounts}, stopping pagination")
-                all_affected_accounts = all_affected_accounts[:max_accounts]
-                break
-
-            # Check for more pages
-            next_token = accounts_response.get("nextToken")
-            if not next_token:
-                logging.debug(f"No more pages, total accounts: {len(all_affected_accounts)}")
-                break
+        # islice stops consuming (and fetching pages) once max_accounts is reached
+        all_affected_accounts = list(
+            itertools.islice(iter_affected_accounts(event_arn), max_accounts or None)
+        )
 
-        logging.info(f"Fetched {len(all_affected_accounts)} affected accounts for event {event_arn} across {page_count} page(s)")
+        logging.info(f"Fetched {len(all_affected_accounts)} affected accounts for event {event_arn}")
         return all_affected_accounts
 
     except Exception as e:
@@ -151,26 +259,138 @@ def map_entity_status_to_event_status(entity_status):
     Returns:
         str: Mapped event status code (open, closed, upcoming, or unknown)
     """
+    # Fast path: the API returns canonical uppercase codes, so no normalization is needed
+    mapped_status = ENTITY_STATUS_MAPPING.get(entity_status)
+    if mapped_status is not None:
+        return mapped_status
+
     # Normalize to uppercase for comparison
     entity_status_upper = str(entity_status).upper()
-    
-    # Map entity status to event status
-    status_mapping = {
-        'IMPAIRED': 'open',      # Resource is impaired = event is open
-        'PENDING': 'open',       # Issue is pending = event is open
-        'UNIMPAIRED': 'closed',  # Resource is unimpaired = event is closed
-        'RESOLVED': 'closed',    # Issue is resolved = event is closed
-        'UNKNOWN': 'unknown',    # Unknown status = unknown
-    }
-    
-    mapped_status = status_mapping.get(entity_status_upper, 'unknown')
-    
-    if mapped_status == 'unknown' and entity_status_upper not in status_mapping:
+    mapped_status = ENTITY_STATUS_MAPPING.get(entity_status_upper)
+
+    if mapped_status is None:
         logging.warning(f"Unknown entity status '{entity_status}', mapping to 'unknown'")
-    
+        return 'unknown'
+
     return mapped_status
 
 
+def _fetch_batch_status(entities_paginator, event_arn, batch, event_level_status):
+    """
+    Fetch per-account status for a single batch of up to 10 accounts (all pages)
+
+    Args:
+        entities_paginator: Shared describe_affected_entities_for_organization paginator
+        event_arn (str): Event ARN
+        batch (list): Account IDs in this batch
+        event_level_status (str): Fallback status if API fails or no entities are returned
+
+    Returns:
+        dict: {account_id: status_code} for the accounts in this batch
+    """
+    # Statuses are tracked as STATUS_PRIORITY ints so merges are a single comparison
+    batch_statuses = {}
+    # Unrecognized event-level statuses (e.g. a null statusCode) fall back to "open", the safe default
+    fallback_priority = STATUS_PRIORITY.get(event_level_status, OPEN_PRIORITY)
+
+    # Build filters for this batch
+    filters = [
+        {'eventArn': event_arn, 'awsAccountId': account_id}
+        for account_id in batch
+    ]
+
+    try:
+        # Lazily iterate ALL pages of entities so the early exit below skips unfetched pages
+        pages = entities_paginator.paginate(
+            organizationEntityFilters=filters,
+            PaginationConfig=ENTITY_PAGINATION_CONFIG
+        )
+        page_count = 0
+        total_entities = 0
+        # Accounts already at the worst case ("open") - once this covers the batch we can stop
+        known_open = set()
+        batch_accounts = set(batch)
+
+        for response in pages:
+            page_count += 1
+
+            # Parse response - entities are grouped by account
+            entities = response.get('entities', [])
+            total_entities += len(entities)
+            logging.debug("Page %d: Received %d entities (total so far: %d)", page_count, len(entities), total_entities)
+
+            # Process entities from this page
+            for entity in entities:
+                account_id = entity.get('awsAccountId')
+                entity_status = entity.get('statusCode')
+
+                if account_id:
+                    if entity_status:
+                        # Map entity status to event status priority (slow path handles odd casing/unknown codes)
+                        priority = ENTITY_STATUS_PRIORITY.get(entity_status)
+                        if priority is None:
+                            priority = STATUS_PRIORITY[map_entity_status_to_event_status(entity_status)]
+
+                        # CRITICAL: "Worst case wins" logic
+                        # Only update if new status is "worse": open > upcoming > closed
+                        try:
+                            current_priority = batch_statuses[account_id]
+                        except KeyError:
+                            # First entity for this account
+                            batch_statuses[account_id] = priority
+                            logging.debug("Account %s: entity_status=%s -> priority=%d", account_id, entity_status, priority)
+                        else:
+                            if priority <= current_priority:
+                                continue
+                            # Found a more actionable entity, upgrade
+                            batch_statuses[account_id] = priority
+                            logging.debug("Account %s: upgraded to priority %d (found %s entity on page %d)", account_id, priority, entity_status, page_count)
+
+                        if priority == OPEN_PRIORITY:
+                            known_open.add(account_id)
+                            if known_open >= batch_accounts:
+                                # Every account is already worst case - skip the rest of this page
+                                break
+                    else:
+                        # No statusCode in entity response - only applies if we haven't seen this account yet
+                        batch_statuses.setdefault(account_id, fallback_priority)
+
+            # OPTIMIZATION: Early exit if all accounts have "open" status
+            # No need to fetch more pages since "open" is worst case
+            if known_open >= batch_accounts:
+                logging.info(
+                    f"All {len(batch)} accounts have 'open' status after page {page_count}. "
+                    f"Skipping remaining pages (optimization)."
+                )
+                break
+
+        logging.debug(f"Processed {page_count} page(s) with {total_entities} total entities")
+
+        # After ALL pages, handle accounts with no entities
+        for account_id in batch:
+            if account_id not in batch_statuses:
+                # No entities across ALL pages - use event-level status as fallback
+                # This is safer than assuming "closed" because:
+                # 1. API might have issues returning entities
+                # 2. Some event types don't expose entities via this API
+                # 3. Events past deadline may not return entities even if resources still affected
+                batch_statuses[account_id] = fallback_priority
+                logging.debug(
+                    f"Account {account_id}: no entities across {page_count} page(s), "
+                    f"using event-level status '{event_level_status}' as fallback"
+                )
+
+    except Exception as e:
+        logging.error(f"Error fetching batch status for event {event_arn}: {str(e)}")
+        # Use event-level status as fallback instead of 'unknown'
+        for account_id in batch:
+            if account_id not in batch_statuses:
+                batch_statuses[account_id] = fallback_priority
+                logging.warning(f"Account {account_id}: API error, using event-level status '{event_level_status}' as fallback")
+
+    return {account_id: PRIORITY_STATUS[priority] for account_id, priority in batch_statuses.items()}
+
+
 def fetch_per_account_status_batch(event_arn, account_ids, event_level_status='open', batch_size=10):
     """
     Fetch status for multiple accounts with PAGINATION support.
@@ -184,10 +404,13 @@ def fetch_per_account_status_batch(event_arn, account_ids, event_level_status='o
     
     PAGINATION: Handles multiple pages of entities to ensure ALL affected resources are checked.
     Critical for events with 100+ entities where some may be IMPAIRED while others are RESOLVED.
+
+    CONCURRENCY: Batches are fetched in parallel on a bounded thread pool sharing one Health client.
     
     Args:
         event_arn (str): Event ARN
-        account_ids (list): List of account IDs to fetch status for
+        account_ids (iterable): Account IDs to fetch status for (a list, or a lazy iterator
+            such as iter_affected_accounts - batches are submitted as soon as they fill)
         event_level_status (str): Fallback status if API fails (default: 'open')
         batch_size (int): Number of accounts per API call (max 10, AWS API limit)
         
@@ -196,138 +419,101 @@ def fetch_per_account_status_batch(event_arn, account_ids, event_level_status='o
             status_code will be: 'open', 'closed', 'upcoming' (never 'unknown' - uses event_level_status as fallback)
             (mapped from entity status: IMPAIRED/PENDING -> open, UNIMPAIRED/RESOLVED -> closed)
     """
-    health_client = get_health_client()
     account_statuses = {}
     
     # CRITICAL FIX: If event is closed at event level, ALL accounts must be closed
     # This is a safety net to ensure closed events stay closed regardless of entity status
     # Event deadline has passed - no longer actionable even if some resources weren't addressed
     if event_level_status == 'closed':
+        account_statuses = {account_id: 'closed' for account_id in account_ids}
         logging.info(
             f"Event {event_arn} is closed at event level. "
-            f"Marking all {len(account_ids)} accounts as closed (skipping entity checks). "
+            f"Marking all {len(account_statuses)} accounts as closed (skipping entity checks). "
             f"Reason: Event deadline passed - no longer actionable."
         )
-        return {account_id: 'closed' for account_id in account_ids}
-    
-    if not account_ids:
-        logging.warning("No account IDs provided to fetch_per_account_status_batch")
         return account_statuses
-    
-    # Split accounts into batches of batch_size (API limit is 10)
-    for i in range(0, len(account_ids), batch_size):
-        batch = account_ids[i:i + batch_size]
-        
-        # Build filters for this batch
-        filters = [
-            {'eventArn': event_arn, 'awsAccountId': account_id}
-            for account_id in batch
-        ]
-        
-        try:
-            # PAGINATION LOOP - fetch ALL pages of entities
-            next_token = None
-            page_count = 0
-            total_entities = 0
-            max_pages = 10  # Safety limit to prevent infinite loops
-            
-            while True:
-                page_count += 1
-                
-                # Safety check: prevent excessive pagination
-                if page_count > max_pages:
-                    logging.warning(
-                        f"Reached max pagination limit ({max_pages} pages, {total_entities} entities). "
-                        f"Some entities may not be processed. Consider increasing max_pages if needed."
-                    )
-                    break
-                
-                logging.debug(f"Fetching entities page {page_count} for {len(batch)} accounts")
-                
-                # Build API call parameters
-                api_params = {
-                    'organizationEntityFilters': filters,
-                    'maxResults': 100  # Explicit max per page
-                }
-                
-                if next_token:
-                    api_params['nextToken'] = next_token
-                
-                response = health_client.describe_affected_entities_for_organization(**api_params)
-                
-                # Parse response - entities are grouped by account
-                entities = response.get('entities', [])
-                total_entities += len(entities)
-                logging.debug(f"Page {page_count}: Received {len(entities)} entities (total so far: {total_entities})")
-                
-                # Process entities from this page
-                for entity in entities:
-                    account_id = entity.get('awsAccountId')
-                    entity_status = entity.get('statusCode')
-                    
-                    if account_id:
-                        if entity_status:
-                            # Map entity status to event status
-                            event_status = map_entity_status_to_event_status(entity_status)
-                            
-                            # CRITICAL: "Worst case wins" logic
-                            # If account already has status, only update if new status is "worse"
-                            # Priority: open > closed (open means action needed)
-                            current_status = account_statuses.get(account_id)
-                            
-                            if current_status is None:
-                                # First entity for this account
-                                account_statuses[account_id] = event_status
-                                logging.debug(f"Account {account_id}: entity_status={entity_status} -> event_status={event_status}")
-                            elif current_status == 'closed' and event_status == 'open':
-                                # Found an open entity, upgrade to open
-                                account_statuses[account_id] = 'open'
-                                logging.info(f"Account {account_id}: upgraded to 'open' (found IMPAIRED/PENDING entity on page {page_count})")
-                            # If current is 'open', keep it (already worst case)
-                        else:
-                            # No statusCode in entity response
-                            if account_id not in account_statuses:
-                                # Only set if we haven't seen this account yet
-                                account_statuses[account_id] = event_level_status
-                                logging.debug(f"Account {account_id}: no statusCode in entity, using event-level status '{event_level_status}'")
-                
-                # OPTIMIZATION: Early exit if all accounts have "open" status
-                # No need to check more pages since "open" is worst case
-                if len(account_statuses) == len(batch) and all(status == 'open' for status in account_statuses.values()):
-                    logging.info(
-                        f"All {len(batch)} accounts have 'open' status after page {page_count}. "
-                        f"Skipping remaining pages (optimization)."
-                    )
-                    break
-                
-                # Check for more pages
-                next_token = response.get('nextToken')
-                if not next_token:
-                    logging.debug(f"No more pages, processed {page_count} page(s) with {total_entities} total entities")
-                    break
-            
-            # After ALL pages, handle accounts with no entities
-            for account_id in batch:
-                if account_id not in account_statuses:
-                    # No entities across ALL pages - use event-level status as fallback
-                    # This is safer than assuming "closed" because:
-                    # 1. API might have issues returning entities
-                    # 2. Some event types don't expose entities via this API
-                    # 3. Events past deadline may not return entities even if resources still affected
-                    account_statuses[account_id] = event_level_status
-                    logging.debug(
-                        f"Account {account_id}: no entities across {page_count} page(s), "
-                        f"using event-level status '{event_level_status}' as fallback"
-                    )
-                    
-        except Exception as e:
-            logging.error(f"Error fetching batch status for event {event_arn}: {str(e)}")
-            # Use event-level status as fallback instead of 'unknown'
-            for account_id in batch:
-                if account_id not in account_statuses:
-                    account_statuses[account_id] = event_level_status
-                    logging.warning(f"Account {account_id}: API error, using event-level status '{event_level_status}' as fallback")
-    
+
+    # Lazy iterators can't be compared against in-flight requests, so they always fetch directly
+    if not isinstance(account_ids, collections.abc.Collection):
+        return _fetch_account_statuses(event_arn, account_ids, event_level_status, batch_size)
+
+    # Singleflight: reuse an in-flight fetch for the same event that covers all requested accounts
+    requested = frozenset(account_ids)
+    inflight_key = (event_arn, event_level_status)
+    with _inflight_status_lock:
+        shared = next(
+            (future for accounts, future in _inflight_status_fetches.get(inflight_key, [])
+             if accounts >= requested),
+            None,
+        )
+        if shared is None:
+            entry = (requested, concurrent.futures.Future())
+            _inflight_status_fetches.setdefault(inflight_key, []).append(entry)
+
+    if shared is not None:
+        logging.info(f"Reusing in-flight status fetch for event {event_arn} ({len(requested)} accounts)")
+        shared_statuses = shared.result()
+        return {
+            account_id: shared_statuses.get(account_id, event_level_status)
+            for account_id in account_ids
+        }
+
+    try:
+        account_statuses = _fetch_account_statuses(event_arn, account_ids, event_level_status, batch_size)
+        entry[1].set_result(account_statuses)
+        return account_statuses
+    except Exception as e:
+        entry[1].set_exception(e)
+        raise
+    finally:
+        with _inflight_status_lock:
+            inflight = _inflight_status_fetches[inflight_key]
+            inflight.remove(entry)
+            if not inflight:
+                del _inflight_status_fetches[inflight_key]
+
+
+def _fetch_account_statuses(event_arn, account_ids, event_level_status, batch_size):
+    """
+    Fetch per-account status for all account_ids, batching and parallelizing the API calls
+
+    Args:
+        event_arn (str): Event ARN
+        account_ids (iterable): Account IDs to fetch status for
+        event_level_status (str): Fallback status if API fails
+        batch_size (int): Number of accounts per API call (max 10, AWS API limit)
+
+    Returns:
+        dict: {account_id: status_code}
+    """
+    account_statuses = {}
+
+    # One paginator (and its operation model lookup) shared by every batch
+    entities_paginator = get_health_client().get_paginator('describe_affected_entities_for_organization')
+    account_iter = iter(account_ids)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=STATUS_BATCH_MAX_WORKERS) as executor:
+        # Split accounts into batches of batch_size (API limit is 10) and submit each one as soon as
+        # it fills, so a lazy account_ids iterator overlaps with the status lookups
+        futures = []
+        for batch in iter(lambda: list(itertools.islice(account_iter, batch_size)), []):
+            futures.append(
+                executor.submit(_fetch_batch_status, entities_paginator, event_arn, batch, event_level_status)
+            )
+
+        if not futures:
+            logging.warning("No account IDs provided to fetch_per_account_status_batch")
+            return account_statuses
+
+        for future in concurrent.futures.as_completed(futures):
+            # Merge batch results with the same "worst case wins" rule used within a batch
+            for account_id, status in future.result().items():
+                current_status = account_statuses.get(account_id)
+                if current_status is None or (
+                    STATUS_PRIORITY.get(status, OPEN_PRIORITY) > STATUS_PRIORITY.get(current_status, OPEN_PRIORITY)
+                ):
+                    account_statuses[account_id] = status
+
     logging.info(f"Fetched per-account status for {len(account_statuses)} accounts: {account_statuses}")
     return account_statuses
 
@@ -343,6 +529,19 @@ def fetch_health_event_details_for_org(event_arn, account_id=None):
     Returns:
         dict: Event details including affected resources
     """
+    cache_key = (event_arn, account_id, True)
+    cached = _get_cached_event_details(cache_key)
+    if cached is not None:
+        return cached
+
+    # Skip the organization API when it can only fail (org view off) or isn't needed (own account)
+    if not is_org_view_enabled():
+        logging.debug(f"Organization view disabled, using account-specific API for event {event_arn}")
+        return fetch_health_event_details(event_arn)
+    if account_id and account_id == get_current_account_id():
+        logging.debug(f"Event {event_arn} is for the current account, using account-specific API")
+        return fetch_health_event_details(event_arn)
+
     try:
         health_client = get_health_client()
 
@@ -355,36 +554,38 @@ def fetch_health_event_details_for_org(event_arn, account_id=None):
             if account_id:
                 org_filter["awsAccountId"] = account_id
 
-            # Get event details using organization API
-            org_event_details = health_client.describe_event_details_for_organization(
-                organizationEventDetailFilters=[org_filter]
+            # Get event details and affected entities using organization API (concurrently)
+            details_future = _details_executor.submit(
+                health_client.describe_event_details_for_organization,
+                organizationEventDetailFilters=[org_filter],
             )
-
-            # Get affected entities using organization API
-            org_affected_entities = (
-                health_client.describe_affected_entities_for_organization(
-                    organizationEntityFilters=[
-                        {
-                            "eventArn": event_arn,
-                            "awsAccountId": (
-                                account_id
-                                if account_id
-                                else get_account_id_from_event(event_arn)
-                            ),
-                        }
-                    ]
-                )
+            entities_future = _details_executor.submit(
+                health_client.describe_affected_entities_for_organization,
+                organizationEntityFilters=[
+                    {
+                        "eventArn": event_arn,
+                        "awsAccountId": (
+                            account_id
+                            if account_id
+                            else get_account_id_from_event(event_arn)
+                        ),
+                    }
+                ],
             )
+            org_event_details = details_future.result()
+            org_affected_entities = entities_future.result()
 
             # Check if we got successful results
             if (
                 org_event_details.get("successfulSet")
                 and len(org_event_details["successfulSet"]) > 0
             ):
-                return {
+                health_data = {
                     "details": org_event_details["successfulSet"][0],
                     "entities": org_affected_entities.get("entities", []),
                 }
+                _cache_event_details(cache_key, health_data)
+                return health_data
 
             # If we got here, organization API didn't return results
             logging.warning(
@@ -408,4 +609,100 @@ def fetch_health_event_details_for_org(event_arn, account_id=None):
         return {"details": {}, "entities": []}
 
 
+def _fetch_org_details_chunk(health_client, event_arn, chunk):
+    """
+    Fetch event details and affected entities for up to 10 accounts with one call each
+
+    Args:
+        health_client: AWS Health client
+        event_arn (str): ARN of the health event
+        chunk (list): Account IDs (at most ORG_FILTERS_PER_CALL)
+
+    Returns:
+        dict: {account_id: health_data} for accounts the organization API returned details for
+    """
+    filters = [{"eventArn": event_arn, "awsAccountId": account_id} for account_id in chunk]
+    details_future = _details_executor.submit(
+        health_client.describe_event_details_for_organization,
+        organizationEventDetailFilters=filters,
+    )
+    entities_by_account = {account_id: [] for account_id in chunk}
+    pages = health_client.get_paginator("describe_affected_entities_for_organization").paginate(
+        organizationEntityFilters=filters,
+        PaginationConfig=ENTITY_PAGINATION_CONFIG,
+    )
+    for page in pages:
+        for entity in page.get("entities", []):
+            entities_by_account.setdefault(entity.get("awsAccountId"), []).append(entity)
+
+    return {
+        details["awsAccountId"]: {
+            "details": details,
+            "entities": entities_by_account.get(details["awsAccountId"], []),
+        }
+        for details in details_future.result().get("successfulSet", [])
+        if details.get("awsAccountId") in entities_by_account
+    }
+
+
+def fetch_health_event_details_for_org_bulk(event_arn, account_ids):
+    """
+    Fetch event details for several accounts of one event, batching the organization API calls
+
+    Same results as calling fetch_health_event_details_for_org per account, but with one
+    describe_event_details_for_organization and one (paginated) describe_affected_entities_for_organization
+    call per ORG_FILTERS_PER_CALL accounts instead of one of each per account.
+
+    Args:
+        event_arn (str): ARN of the health event
+        account_ids (list): AWS account IDs affected by the event
+
+    Returns:
+        dict: {account_id: health_data} with an entry for every account in account_ids
+    """
+    results = {}
+    pending = []
+    for account_id in dict.fromkeys(account_ids):
+        cached = _get_cached_event_details((event_arn, account_id, True))
+        if cached is not None:
+            results[account_id] = cached
+        elif not is_org_view_enabled() or account_id == get_current_account_id():
+            # Same routing as fetch_health_event_details_for_org: account-specific API
+            results[account_id] = fetch_health_event_details(event_arn)
+        else:
+            pending.append(account_id)
+
+    if pending:
+        health_client = get_health_client()
+        chunks = [pending[i:i + ORG_FILTERS_PER_CALL] for i in range(0, len(pending), ORG_FILTERS_PER_CALL)]
+        for chunk in chunks:
+            try:
+                chunk_results = _fetch_org_details_chunk(health_client, event_arn, chunk)
+            except Exception as org_error:
+                logging.error(
+                    f"Error using organization API for event {event_arn}: {str(org_error)}"
+                )
+                chunk_results = {}
+            for account_id, health_data in chunk_results.items():
+                _cache_event_details((event_arn, account_id, True), health_data)
+                results[account_id] = health_data
+
+        missing = [account_id for account_id in pending if account_id not in results]
+        if missing:
+            # Fall back to account-specific API (only works for current account)
+            logging.warning(
+                f"Organization API didn't return results for event {event_arn} "
+                f"({len(missing)} accounts), falling back to account-specific API"
+            )
+            fallback = fetch_health_event_details(event_arn)
+            for account_id in missing:
+                results[account_id] = fallback
+
+    return results
+
+
 # get_account_id_from_event function imported from utils.helpers
+
+
+# Build the Health client (and load its service model) during Lambda init rather than on the first request
+get_health_client()
@@ -1,9 +1,116 @@
-import boto3
+import concurrent.futures
+import functools
+import json
 import logging
+import os
+import threading
+import time
+from aws_clients.client_manager import boto_session
 
 # Dictionary to store account ID to name mapping
 account_id_to_name_map = {}
 
+# Whether the map has been bulk-loaded from ListAccounts in this container
+_primed = False
+_prime_lock = threading.Lock()
+
+# In-flight DescribeAccount lookups, so concurrent misses for one account share a single call
+_pending_lookups = {}
+_pending_lookups_lock = threading.Lock()
+
+# On-disk copy of the map in Lambda's /tmp, reused while younger than the TTL
+ACCOUNT_CACHE_PATH = "/tmp/account_names.json"
+ACCOUNT_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+
+def load_account_cache():
+    """
+    Load the persisted account name map from /tmp if it is still fresh
+
+    Returns:
+        bool: True if the map was loaded, False if missing, stale or unreadable
+    """
+    try:
+        age = time.time() - os.path.getmtime(ACCOUNT_CACHE_PATH)
+        if age > ACCOUNT_CACHE_TTL_SECONDS:
+            logging.debug(f"Account name cache is {age:.0f}s old, ignoring")
+            return False
+
+        with open(ACCOUNT_CACHE_PATH) as f:
+            account_id_to_name_map.update(json.load(f))
+        logging.debug(f"Loaded {len(account_id_to_name_map)} account names from {ACCOUNT_CACHE_PATH}")
+        return True
+    except FileNotFoundError:
+        return False
+    except Exception as e:
+        logging.warning(f"Error loading account name cache: {str(e)}")
+        return False
+
+
+def save_account_cache():
+    """Persist resolved account names to /tmp (lookup failures are not persisted)"""
+    try:
+        resolved = {
+            account_id: name
+            for account_id, name in list(account_id_to_name_map.items())
+            if name != account_id
+        }
+        # Write to a temp file and rename so concurrent readers never see a partial file
+        tmp_path = f"{ACCOUNT_CACHE_PATH}.{os.getpid()}.{threading.get_ident()}"
+        with open(tmp_path, "w") as f:
+            json.dump(resolved, f)
+        os.replace(tmp_path, ACCOUNT_CACHE_PATH)
+    except Exception as e:
+        logging.warning(f"Error saving account name cache: {str(e)}")
+
+
+def clear_account_cache():
+    """Forget cached account names (in memory and in /tmp) so renamed accounts are looked up again"""
+    global _primed
+
+    with _prime_lock:
+        account_id_to_name_map.clear()
+        _primed = False
+        try:
+            os.remove(ACCOUNT_CACHE_PATH)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logging.warning(f"Error removing account name cache: {str(e)}")
+
+
+@functools.lru_cache(maxsize=1)
+def get_organizations_client():
+    """Get AWS Organizations client (built once per Lambda container)"""
+    return boto_session.client("organizations")
+
+
+def prime_account_cache():
+    """
+    Bulk-load account names for the whole organization with ListAccounts (once per container)
+
+    ListAccounts returns every account in ~N/20 paginated calls, instead of one
+    heavily throttled DescribeAccount call per account.
+    """
+    global _primed
+
+    with _prime_lock:
+        if _primed:
+            return
+
+        try:
+            paginator = get_organizations_client().get_paginator("list_accounts")
+            for page in paginator.paginate(PaginationConfig={"PageSize": 20}):
+                for account in page.get("Accounts", []):
+                    account_id_to_name_map[account["Id"]] = account.get("Name", account["Id"])
+            logging.info(f"Primed account name cache with {len(account_id_to_name_map)} accounts")
+            save_account_cache()
+        except Exception as e:
+            # Not fatal - get_account_name falls back to DescribeAccount per account
+            logging.warning(f"Error priming account name cache: {str(e)}")
+        finally:
+            _primed = True
+
 
 def get_account_name(account_id):
     """
@@ -19,14 +126,55 @@ def get_account_name(account_id):
     if account_id in account_id_to_name_map:
         return account_id_to_name_map[account_id]
 
+    # First miss in this container - load every account name in one sweep
+    # (concurrent callers wait on the prime lock and are served by the same sweep)
+    if not _primed:
+        prime_account_cache()
+        if account_id in account_id_to_name_map:
+            return account_id_to_name_map[account_id]
+
+    # Collapse concurrent misses for the same account into one DescribeAccount call
+    with _pending_lookups_lock:
+        if account_id in account_id_to_name_map:
+            return account_id_to_name_map[account_id]
+        pending = _pending_lookups.get(account_id)
+        if pending is None:
+            lookup = _pending_lookups[account_id] = concurrent.futures.Future()
+
+    if pending is not None:
+        return pending.result()
+
+    try:
+        account_name = describe_account_name(account_id)
+        lookup.set_result(account_name)
+        return account_name
+    finally:
+        # Never leave waiters blocked, even if the lookup raised
+        if not lookup.done():
+            lookup.set_result(account_id)
+        with _pending_lookups_lock:
+            _pending_lookups.pop(account_id, None)
+
+
+def describe_account_name(account_id):
+    """
+    Look up a single account name with DescribeAccount and cache the result
+
+    Args:
+        account_id (str): AWS account ID
+
+    Returns:
+        str: Account name or account ID if name can't be retrieved
+    """
     try:
         # Try to get account name from Organizations API
-        org_client = boto3.client("organizations")
+        org_client = get_organizations_client()
         response = org_client.describe_account(AccountId=account_id)
         account_name = response.get("Account", {}).get("Name", account_id)
 
         # Cache the result
         account_id_to_name_map[account_id] = account_name
+        save_account_cache()
         return account_name
     except Exception as e:
         logging.warning(
@@ -35,3 +183,7 @@ def get_account_name(account_id):
         # If we can't get the name, just return the ID
         account_id_to_name_map[account_id] = account_id
         return account_id
+
+
+# A fresh on-disk cache counts as primed, so warm containers skip Organizations entirely
+_primed = load_account_cache()
@@ -4,23 +4,224 @@ Routes events to appropriate processors based on event source
 """
 
 import os
-import json
+import orjson
+import functools
+import importlib
 import logging
-import traceback
+import logging.handlers
+import queue
+import threading
+import time
+from botocore.exceptions import BotoCoreError, ClientError
 
-from utils.event_helpers import is_sqs_event, is_dynamodb_stream_event
-from processing.sqs_processor import process_sqs_event
-from processing.stream_processor import process_dynamodb_stream_event
-from processing.batch_processor import process_single_event_mode, process_batch_events
 from aws_clients.client_manager import get_clients
 
 # Set up logging for Lambda
 LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO").upper()
 logger = logging.getLogger()
 logger.setLevel(getattr(logging, LOG_LEVEL, logging.INFO))
+# LOG_LEVEL is fixed for the container, so DEBUG-only work can be skipped with one flag check
+DEBUG_ENABLED = logger.isEnabledFor(logging.DEBUG)
+# Upper bound on how long an invocation waits for queued log records to be written
+LOG_FLUSH_TIMEOUT_SECONDS = 2.0
+
+
+class FlushableQueueListener(logging.handlers.QueueListener):
+    """QueueListener that can report when everything queued so far has been handled"""
+
+    def handle(self, record):
+        # A flush marker is an Event queued behind the records it waits for
+        if isinstance(record, threading.Event):
+            record.set()
+            return
+        super().handle(record)
+
+    def flush(self, timeout=LOG_FLUSH_TIMEOUT_SECONDS):
+        """Block until the records queued before this call have been written"""
+        drained = threading.Event()
+        self.queue.put_nowait(drained)
+        drained.wait(timeout)
+
+
+def start_log_listener():
+    """
+    Move log writes off the request thread: the root logger's handlers are fronted by a
+    QueueHandler and drained by a background QueueListener
+
+    Returns:
+        FlushableQueueListener: Running listener, or None if the root logger has no handlers
+    """
+    handlers = logger.handlers[:]
+    if not handlers:
+        return None
+
+    log_queue = queue.SimpleQueue()
+    for existing_handler in handlers:
+        logger.removeHandler(existing_handler)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    listener = FlushableQueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    return listener
+
+
+def flush_logs():
+    """Drain queued log records before the invocation returns (Lambda freezes the sandbox after)"""
+    if log_listener:
+        # Wait for the listener to reach a marker instead of stopping and restarting its thread
+        log_listener.flush()
+
+
+log_listener = start_log_listener()
 
 # Environment variables
 DYNAMODB_TABLE_NAME = os.environ.get("DYNAMODB_HEALTH_EVENTS_TABLE_NAME")
+HAS_DYNAMODB_TABLE = bool(DYNAMODB_TABLE_NAME)
+
+# Build AWS clients during Lambda init so warm invocations reuse them
+try:
+    get_clients()
+except Exception as e:
+    # Not fatal - handler retries client creation on first use
+    logger.warning("Could not initialize AWS clients during init: %s", e)
+
+# One record per sandbox: static configuration is logged here rather than on every invocation
+logger.info("cold_start log_level=%s has_table=%s", LOG_LEVEL, HAS_DYNAMODB_TABLE)
+
+
+# Processor functions resolved on first use: kept out of INIT, then reused on warm invocations
+_lazy_functions = {}
+
+
+def lazy_function(module_name, function_name):
+    """
+    Import module_name on first use and return (and memoize) its function_name attribute
+
+    Args:
+        module_name (str): Dotted module path, e.g. "processing.sqs_processor"
+        function_name (str): Function to resolve from the module
+
+    Returns:
+        callable: The resolved function
+    """
+    key = (module_name, function_name)
+    function = _lazy_functions.get(key)
+    if function is None:
+        function = _lazy_functions[key] = getattr(importlib.import_module(module_name), function_name)
+    return function
+
+
+def route_dynamodb_stream_event(event, context):
+    """Process a DynamoDB Stream event (TTL deletions)"""
+    logger.debug("Detected DynamoDB Stream event")
+    process_dynamodb_stream_event = lazy_function("processing.stream_processor", "process_dynamodb_stream_event")
+    return process_dynamodb_stream_event(event, context)
+
+
+def route_sqs_event(event, context):
+    """Process an SQS event (individual processing mode)"""
+    logger.debug("Detected SQS event")
+    process_sqs_event = lazy_function("processing.sqs_processor", "process_sqs_event")
+    return process_sqs_event(event, context)
+
+
+# Record-based invocations dispatched on Records[0].eventSource
+EVENT_SOURCE_ROUTES = {
+    "aws:dynamodb": route_dynamodb_stream_event,
+    "aws:sqs": route_sqs_event,
+}
+
+
+def run_recalculate_counts(event, context):
+    """Recalculate ARN-based counts (ARN-based counting mode)"""
+    logger.debug("Recalculate ARN-based counts mode triggered")
+    recalculate_arn_based_counts = lazy_function("storage.dynamodb_handler", "recalculate_arn_based_counts")
+    # Direct operator invoke: Lambda serializes the response, so the summary dict goes out as-is
+    return {"statusCode": 200, "body": recalculate_arn_based_counts()}
+
+
+def run_scheduled_sync(event, context):
+    """Sync events from the last lookback_days days (scheduled sync mode)"""
+    logger.debug("Scheduled sync mode triggered")
+    lookback_days = event.get("lookback_days", 30)
+    logger.info("Syncing events from last %s days", lookback_days)
+    if event.get("refresh_account_names", False):
+        # Account names are cached for the container's lifetime; an operator can force a reload
+        logger.info("Clearing cached account names")
+        lazy_function("aws_clients.organizations_client", "clear_account_cache")()
+    health_client, bedrock_client, sqs_client = get_clients()
+    process_batch_events = lazy_function("processing.batch_processor", "process_batch_events")
+    return process_batch_events(
+        health_client, bedrock_client, sqs_client, context,
+        lookback_days=lookback_days
+    )
+
+
+# Direct invocations dispatched on event["mode"]
+MODE_HANDLERS = {
+    "recalculate_counts": run_recalculate_counts,
+    "scheduled_sync": run_scheduled_sync,
+}
+
+
+def run_single_event(event, context):
+    """Process a single event by ARN (single event mode)"""
+    logger.info("Single event processing mode for ARN: %s", event.get("event_arn"))
+    health_client, bedrock_client, _ = get_clients()
+    process_single_event_mode = lazy_function("processing.batch_processor", "process_single_event_mode")
+    return process_single_event_mode(event, health_client, bedrock_client)
+
+
+def run_batch(event, context):
+    """Process all recent Health events (batch processing mode)"""
+    logger.debug("Batch processing mode")
+    health_client, bedrock_client, sqs_client = get_clients()
+    process_batch_events = lazy_function("processing.batch_processor", "process_batch_events")
+    return process_batch_events(
+        health_client, bedrock_client, sqs_client, context
+    )
+
+
+@functools.lru_cache(maxsize=16)
+def select_route(event_source, mode, single_event):
+    """
+    Resolve the route for an event shape
+
+    Invocations arrive in a handful of fixed shapes, so the decision is
+    memoized per shape and repeat invocations skip the routing chain.
+
+    Args:
+        event_source (str): Records[0].eventSource, or None
+        mode (str): event["mode"], or None
+        single_event (bool): Whether the event targets a single event ARN
+
+    Returns:
+        callable: Route taking (event, context)
+    """
+    route = EVENT_SOURCE_ROUTES.get(event_source) or MODE_HANDLERS.get(mode)
+    if route:
+        return route
+    return run_single_event if single_event else run_batch
+
+
+def error_response(e):
+    """
+    Build the 500 response returned for a failed invocation
+
+    Args:
+        e (Exception): Error raised while handling the event
+
+    Returns:
+        dict: Error response
+    """
+    # Single string argument with the default __str__ (boto and most builtin errors):
+    # use it as-is instead of going through str()
+    args = e.args
+    if len(args) == 1 and type(args[0]) is str and type(e).__str__ is BaseException.__str__:
+        message = args[0]
+    else:
+        message = str(e)
+    return {"statusCode": 500, "body": "Error: " + message}
 
 
 def handler(event, context):
@@ -34,66 +235,45 @@ def handler(event, context):
     Returns:
         dict: Processing result
     """
-    logger.info(
-        f"Event processor handler invoked with event: {json.dumps(event, default=str)}"
-    )
-    logger.info("Starting execution...")
-    logger.debug(f"Raw event: {event}")
+    # Scheduled warmer pings: keep the container warm without creating clients or doing I/O
+    if isinstance(event, dict) and event.get("warmup"):
+        return {"statusCode": 200, "body": "warm"}
 
+    start_time = time.perf_counter()
     try:
-        # Route based on event source
-        if is_dynamodb_stream_event(event):
-            logger.info("Detected DynamoDB Stream event")
-            logger.debug(
-                f"Stream event contains {len(event.get('Records', []))} records"
-            )
-            return process_dynamodb_stream_event(event, context)
-
-        elif is_sqs_event(event):
-            logger.info("Detected SQS event")
-            logger.debug(f"SQS event contains {len(event.get('Records', []))} records")
-            return process_sqs_event(event, context)
-
+        # Read the routing fields once: one type check, one Records lookup, one mode lookup.
+        # Inside the try so a malformed Records value still gets an error response and log flush
+        is_dict_event = isinstance(event, dict)
+        if is_dict_event:
+            records = event.get("Records")
+            mode = event.get("mode")
         else:
-            # Batch processing, scheduled sync, or single event mode
-            logger.info("Detected batch/single event/scheduled sync processing")
-
-            # Initialize clients
-            logger.debug("Initializing AWS clients")
-            health_client, bedrock_client, sqs_client = get_clients()
-
-            # Check if we're in recalculate_counts mode (ARN-based counting)
-            if isinstance(event, dict) and event.get("mode") == "recalculate_counts":
-                logger.info("Recalculate ARN-based counts mode triggered")
-                from storage.dynamodb_handler import recalculate_arn_based_counts
-                result = recalculate_arn_based_counts()
-                return {
-                    "statusCode": 200,
-                    "body": json.dumps(result, default=str)
-                }
-            # Check if we're in scheduled sync mode
-            elif isinstance(event, dict) and event.get("mode") == "scheduled_sync":
-                logger.info("Scheduled sync mode triggered")
-                lookback_days = event.get("lookback_days", 30)
-                logger.info(f"Syncing events from last {lookback_days} days")
-                return process_batch_events(
-                    health_client, bedrock_client, sqs_client, context,
-                    lookback_days=lookback_days
-                )
-            # Check if we're in single event processing mode
-            elif isinstance(event, dict) and "event_arn" in event and DYNAMODB_TABLE_NAME:
-                logger.info(
-                    f"Single event processing mode for ARN: {event.get('event_arn')}"
-                )
-                return process_single_event_mode(event, health_client, bedrock_client)
-            else:
-                logger.info("Batch processing mode")
-                logger.debug(f"DynamoDB table configured: {bool(DYNAMODB_TABLE_NAME)}")
-                return process_batch_events(
-                    health_client, bedrock_client, sqs_client, context
-                )
+            records = mode = None
+        event_source = records[0].get("eventSource") if records else None
+        record_count = len(records) if records else 0
+
+        # One INFO line per invocation; the event payload is only rendered when DEBUG is enabled
+        logger.info("handler start source=%s mode=%s records=%d", event_source, mode, record_count)
+        if DEBUG_ENABLED:
+            logger.debug("Event processor handler invoked with event: %s", orjson.dumps(event, default=str).decode())
+
+        # Route based on event source, mode, or single event ARN
+        single_event = is_dict_event and HAS_DYNAMODB_TABLE and "event_arn" in event
+        # Route keys are only ever strings; anything else (possibly unhashable) can't match
+        route = select_route(
+            event_source if isinstance(event_source, str) else None,
+            mode if isinstance(mode, str) else None,
+            single_event,
+        )
+        return route(event, context)
 
+    except (ClientError, BotoCoreError) as e:
+        # AWS API failures are usually transient/throttling - the message is enough unless debugging
+        logger.error("AWS error in main handler: %s", e, exc_info=DEBUG_ENABLED)
+        return error_response(e)
     except Exception as e:
-        logger.error(f"Error in main handler: {str(e)}")
-        logger.error("Full traceback:", exc_info=True)
-        return {"statusCode": 500, "body": f"Error: {str(e)}"}
+        logger.exception("Error in main handler: %s", e)
+        return error_response(e)
+    finally:
+        logger.info("handler done dt=%.3fms", (time.perf_counter() - start_time) * 1000)
+        flush_logs()
@@ -2,14 +2,16 @@
 Batch processing logic for health events
 """
 
+import concurrent.futures
 import json
 import logging
-import os
+import threading
 import traceback
 from datetime import datetime, timedelta
 from collections import defaultdict
 from botocore.exceptions import ClientError
 
+from aws_clients.client_manager import get_dynamodb_resource
 from aws_clients.organizations_client import get_account_name
 from aws_clients.health_client import (
     fetch_health_event_details_for_org,
@@ -19,18 +21,39 @@ from aws_clients.health_client import (
 from storage.dynamodb_handler import (
     process_single_event,
     store_events_in_dynamodb,
-    update_live_counts,
-    initialize_live_counts,
     recalculate_arn_based_counts,
 )
 from utils.helpers import format_date_only, format_datetime, extract_affected_resources
-from utils.event_helpers import expand_events_by_account, create_account_batches
-from analysis.bedrock_analyzer import analyze_event_with_bedrock, categorize_analysis
+from utils.event_helpers import expand_events_by_account, count_expanded_events, create_account_batches
+from analysis.bedrock_analyzer import (
+    analyze_event_with_bedrock,
+    analyze_events_batch,
+    categorize_analysis,
+)
 from utils.sqs_helpers import send_events_to_sqs
+from utils.config import (
+    DYNAMODB_TABLE_NAME,
+    AWS_REGION,
+    ANALYSIS_WINDOW_DAYS,
+    BEDROCK_MAX_CONCURRENCY,
+    excluded_services,
+    event_categories,
+)
+
+# Concurrent describe_affected_accounts_for_organization calls in process_batch_events
+# (the Health client retries adaptively if this outruns the API rate limit)
+AFFECTED_ACCOUNTS_MAX_WORKERS = 8
+# Concurrent describe_affected_entities_for_organization calls in process_single_event_mode
+AFFECTED_ENTITIES_MAX_WORKERS = 8
+# organizationEntityFilters accepts at most 10 (event, account) filters per call
+ENTITY_FILTERS_PER_CALL = 10
 
-# Import environment variables
-DYNAMODB_TABLE_NAME = os.environ.get("DYNAMODB_HEALTH_EVENTS_TABLE_NAME")
-COUNTS_TABLE_NAME = os.environ.get("DYNAMODB_COUNTS_TABLE_NAME")
+# Guards the per-invocation analysis cache shared by the process_synchronously workers
+_analysis_cache_lock = threading.Lock()
+
+# Category tally keys for the usual analysis levels, built once instead of per event
+RISK_LEVEL_KEYS = {level: f"{level}_risk" for level in ("LOW", "MEDIUM", "HIGH", "CRITICAL")}
+ACCOUNT_IMPACT_KEYS = {impact: f"{impact}_impact" for impact in ("low", "medium", "high", "critical")}
 
 
 def has_valid_analysis_in_dynamodb(event):
@@ -53,10 +76,9 @@ def has_valid_analysis_in_dynamodb(event):
         return False
     
     try:
-        import boto3
         from analysis.bedrock_analyzer import DEFAULT_ANALYSIS_VALUES
         
-        dynamodb = boto3.resource("dynamodb")
+        dynamodb = get_dynamodb_resource()
         table = dynamodb.Table(DYNAMODB_TABLE_NAME)
         
         # Check first affected account (analysis is same for all accounts)
@@ -151,7 +173,144 @@ def should_skip_analysis_in_main_lambda(all_events_with_accounts):
         return False
 
 
-def analyze_and_batch_event(event, bedrock_client, skip_analysis=False):
+def get_existing_analysis(event):
+    """
+    Look up reusable Bedrock analysis for an event in DynamoDB.
+
+    Args:
+        event (dict): Health event with arn and affectedAccounts
+
+    Returns:
+        dict: Existing analysis fields, or None if the event is new or its
+            analysis is failed/blank and needs Bedrock
+    """
+    event_arn = event.get("arn", "")
+    affected_accounts = event.get("affectedAccounts", [])
+    existing_analysis = None
+
+    if event_arn and affected_accounts and DYNAMODB_TABLE_NAME:
+        try:
+            from analysis.bedrock_analyzer import DEFAULT_ANALYSIS_VALUES
+            
+            dynamodb = get_dynamodb_resource()
+            table = dynamodb.Table(DYNAMODB_TABLE_NAME)
+            
+            # Check first affected account (analysis is same for all accounts)
+            response = table.get_item(
+                Key={
+                    "eventArn": event_arn,
+                    "accountId": affected_accounts[0]
+                }
+            )
+            
+            if "Item" in response:
+                existing_event = response["Item"]
+                
+                # Check if analysis is valid
+                required_actions = existing_event.get("requiredActions", "")
+                risk_category = existing_event.get("riskCategory", "")
+                impact_analysis = existing_event.get("impactAnalysis", "")
+                
+                # Check for failed analysis (Bedrock fallback values)
+                is_failed_analysis = (
+                    required_actions == DEFAULT_ANALYSIS_VALUES["required_actions"] and
+                    risk_category == DEFAULT_ANALYSIS_VALUES["risk_category"] and
+                    impact_analysis == DEFAULT_ANALYSIS_VALUES["impact_analysis"]
+                )
+                
+                # Check for blank/null values
+                has_blank_or_null = (
+                    not required_actions or required_actions.strip() == "" or
+                    not risk_category or risk_category.strip() == "" or
+                    not impact_analysis or impact_analysis.strip() == ""
+                )
+                
+                # Valid analysis = has all fields populated AND not failed analysis
+                has_valid_analysis = (
+                    required_actions and required_actions.strip() and
+                    risk_category and risk_category.strip() and
+                    impact_analysis and impact_analysis.strip() and
+                    not is_failed_analysis
+                )
+                
+                if has_valid_analysis:
+                    # Use impactAnalysis as the analysis_text since analysisText field doesn't exist in schema
+                    # The SQS processor only needs categories anyway, analysis_text is just for logging
+                    existing_analysis = {
+                        "analysis_text": impact_analysis,  # Use impactAnalysis as proxy for analysis text
+                        "critical": existing_event.get("critical", False),
+                        "risk_level": existing_event.get("riskLevel", "LOW"),
+                        "impact_analysis": impact_analysis,
+                        "required_actions": required_actions,
+                        "time_sensitivity": existing_event.get("timeSensitivity", "Routine"),
+                        "risk_category": risk_category,
+                        "consequences_if_ignored": existing_event.get("consequencesIfIgnored", ""),
+                        "event_impact_type": existing_event.get("eventImpactType", "Informational"),
+                        "account_impact": existing_event.get("accountImpact", "low"),
+                    }
+                    logging.info(f"Event {event.get('eventTypeCode', 'unknown')} has valid analysis in DynamoDB, skipping Bedrock (affects {len(affected_accounts)} accounts)")
+                elif is_failed_analysis:
+                    logging.info(f"Event {event.get('eventTypeCode', 'unknown')} has failed analysis, will retry with Bedrock")
+                elif has_blank_or_null:
+                    logging.info(f"Event {event.get('eventTypeCode', 'unknown')} has blank/null analysis, will analyze with Bedrock")
+                    
+        except Exception as e:
+            logging.warning(f"Error checking DynamoDB for existing analysis: {str(e)}, will proceed with Bedrock")
+
+    return existing_analysis
+
+
+def build_event_for_analysis(event):
+    """
+    Build the event data passed to Bedrock, with the full description fetched
+    from the Health API.
+
+    Args:
+        event (dict): Health event with arn and affectedAccounts
+
+    Returns:
+        dict: Event data for analyze_event_with_bedrock / analyze_events_batch
+    """
+    event_arn = event.get("arn", "")
+    affected_accounts = event.get("affectedAccounts", [])
+
+    # Fetch full event description from Health API for Bedrock analysis
+    # Use the first affected account to get the description (description is same for all accounts)
+    description = "No description available"
+    
+    if event_arn and affected_accounts:
+        try:
+            # Fetch event details using first account to get description
+            health_data = fetch_health_event_details_for_org(event_arn, affected_accounts[0])
+            description = (
+                health_data.get("details", {})
+                .get("eventDescription", {})
+                .get("latestDescription", "No description available")
+            )
+            if description:
+                logging.debug(f"Fetched description for event (length: {len(description)})")
+            else:
+                description = "No description available"
+        except Exception as e:
+            logging.warning(f"Could not fetch description for event {event.get('eventTypeCode', 'unknown')}: {str(e)}")
+            description = "No description available"
+    
+    # Create event data structure for analysis
+    event_for_analysis = {
+        "eventTypeCode": event.get("eventTypeCode", "Unknown"),
+        "eventTypeCategory": event.get("eventTypeCategory", "Unknown"),
+        "region": event.get("region", "global"),
+        "startTime": event.get("startTime", ""),
+        "description": description,
+        "service": event.get("service", "Unknown"),
+    }
+
+    return event_for_analysis
+
+
+def analyze_and_batch_event(
+    event, bedrock_client, skip_analysis=False, existing_analysis=None, analyzed_event=None
+):
     """
     Analyze event once and create account batches for parallel processing.
     
@@ -168,6 +327,10 @@ def analyze_and_batch_event(event, bedrock_client, skip_analysis=False):
         event (dict): Health event with affectedAccounts array
         bedrock_client: Bedrock client for analysis
         skip_analysis (bool): If True, skip Bedrock analysis entirely and send raw events to SQS
+        existing_analysis (dict): Valid analysis already read from DynamoDB by the caller
+            (see get_existing_analysis); when given, it is reused without another lookup
+        analyzed_event (dict): Result of an earlier batched Bedrock analysis for this event;
+            when given, the DynamoDB check and Bedrock call are skipped
         
     Returns:
         list: Batch messages ready for SQS, each containing:
@@ -186,8 +349,6 @@ def analyze_and_batch_event(event, bedrock_client, skip_analysis=False):
             logging.debug(f"Event {event.get('eventTypeCode', 'unknown')} has no affected accounts - skipping")
             return []
         
-        event_arn = event.get("arn", "")
-        
         # If skip_analysis is True, create raw batches without any Bedrock analysis
         if skip_analysis:
             logging.debug(f"Skipping analysis for event {event.get('eventTypeCode', 'unknown')}, will be handled by SQS workers")
@@ -216,79 +377,10 @@ def analyze_and_batch_event(event, bedrock_client, skip_analysis=False):
             return batch_messages
         
         # Check if we can reuse existing valid analysis from DynamoDB
-        existing_analysis = None
-        skip_bedrock = False
-        
-        if event_arn and affected_accounts and DYNAMODB_TABLE_NAME:
-            try:
-                import boto3
-                from analysis.bedrock_analyzer import DEFAULT_ANALYSIS_VALUES
-                
-                dynamodb = boto3.resource("dynamodb")
-                table = dynamodb.Table(DYNAMODB_TABLE_NAME)
-                
-                # Check first affected account (analysis is same for all accounts)
-                response = table.get_item(
-                    Key={
-                        "eventArn": event_arn,
-                        "accountId": affected_accounts[0]
-                    }
-                )
-                
-                if "Item" in response:
-                    existing_event = response["Item"]
-                    
-                    # Check if analysis is valid
-                    required_actions = existing_event.get("requiredActions", "")
-                    risk_category = existing_event.get("riskCategory", "")
-                    impact_analysis = existing_event.get("impactAnalysis", "")
-                    
-                    # Check for failed analysis (Bedrock fallback values)
-                    is_failed_analysis = (
-                        required_actions == DEFAULT_ANALYSIS_VALUES["required_actions"] and
-                        risk_category == DEFAULT_ANALYSIS_VALUES["risk_category"] and
-                        impact_analysis == DEFAULT_ANALYSIS_VALUES["impact_analysis"]
-                    )
-                    
-                    # Check for blank/null values
-                    has_blank_or_null = (
-                        not required_actions or required_actions.strip() == "" or
-                        not risk_category or risk_category.strip() == "" or
-                        not impact_analysis or impact_analysis.strip() == ""
-                    )
-                    
-                    # Valid analysis = has all fields populated AND not failed analysis
-                    has_valid_analysis = (
-                        required_actions and required_actions.strip() and
-                        risk_category and risk_category.strip() and
-                        impact_analysis and impact_analysis.strip() and
-                        not is_failed_analysis
-                    )
-                    
-                    if has_valid_analysis:
-                        skip_bedrock = True
-                        # Use impactAnalysis as the analysis_text since analysisText field doesn't exist in schema
-                        # The SQS processor only needs categories anyway, analysis_text is just for logging
-                        existing_analysis = {
-                            "analysis_text": impact_analysis,  # Use impactAnalysis as proxy for analysis text
-                            "critical": existing_event.get("critical", False),
-                            "risk_level": existing_event.get("riskLevel", "LOW"),
-                            "impact_analysis": impact_analysis,
-                            "required_actions": required_actions,
-                            "time_sensitivity": existing_event.get("timeSensitivity", "Routine"),
-                            "risk_category": risk_category,
-                            "consequences_if_ignored": existing_event.get("consequencesIfIgnored", ""),
-                            "event_impact_type": existing_event.get("eventImpactType", "Informational"),
-                            "account_impact": existing_event.get("accountImpact", "low"),
-                        }
-                        logging.info(f"Event {event.get('eventTypeCode', 'unknown')} has valid analysis in DynamoDB, skipping Bedrock (affects {len(affected_accounts)} accounts)")
-                    elif is_failed_analysis:
-                        logging.info(f"Event {event.get('eventTypeCode', 'unknown')} has failed analysis, will retry with Bedrock")
-                    elif has_blank_or_null:
-                        logging.info(f"Event {event.get('eventTypeCode', 'unknown')} has blank/null analysis, will analyze with Bedrock")
-                        
-            except Exception as e:
-                logging.warning(f"Error checking DynamoDB for existing analysis: {str(e)}, will proceed with Bedrock")
+        # (skipped when the caller already looked it up or analyzed this event in a batched request)
+        if existing_analysis is None and analyzed_event is None:
+            existing_analysis = get_existing_analysis(event)
+        skip_bedrock = existing_analysis is not None
         
         # Use existing analysis or perform new Bedrock analysis
         if skip_bedrock and existing_analysis:
@@ -308,42 +400,13 @@ def analyze_and_batch_event(event, bedrock_client, skip_analysis=False):
         
         # Perform new Bedrock analysis if needed
         if not skip_bedrock or not existing_analysis:
-            # Perform new Bedrock analysis
-            logging.info(f"Analyzing event {event.get('eventTypeCode', 'unknown')} with Bedrock (affects {len(affected_accounts)} accounts)")
-            
-            # Fetch full event description from Health API for Bedrock analysis
-            # Use the first affected account to get the description (description is same for all accounts)
-            description = "No description available"
-            
-            if event_arn and affected_accounts:
-                try:
-                    # Fetch event details using first account to get description
-                    health_data = fetch_health_event_details_for_org(event_arn, affected_accounts[0])
-                    description = (
-                        health_data.get("details", {})
-                        .get("eventDescription", {})
-                        .get("latestDescription", "No description available")
-                    )
-                    if description:
-                        logging.debug(f"Fetched description for event (length: {len(description)})")
-                    else:
-                        description = "No description available"
-                except Exception as e:
-                    logging.warning(f"Could not fetch description for event {event.get('eventTypeCode', 'unknown')}: {str(e)}")
-                    description = "No description available"
-            
-            # Create event data structure for analysis
-            event_for_analysis = {
-                "eventTypeCode": event.get("eventTypeCode", "Unknown"),
-                "eventTypeCategory": event.get("eventTypeCategory", "Unknown"),
-                "region": event.get("region", "global"),
-                "startTime": event.get("startTime", ""),
-                "description": description,
-                "service": event.get("service", "Unknown"),
-            }
-            
-            # Perform Bedrock analysis once
-            analyzed_event = analyze_event_with_bedrock(bedrock_client, event_for_analysis)
+            if analyzed_event is None:
+                # Perform new Bedrock analysis
+                logging.info(f"Analyzing event {event.get('eventTypeCode', 'unknown')} with Bedrock (affects {len(affected_accounts)} accounts)")
+                event_for_analysis = build_event_for_analysis(event)
+
+                # Perform Bedrock analysis once
+                analyzed_event = analyze_event_with_bedrock(bedrock_client, event_for_analysis)
             analysis_text = analyzed_event.get("analysis_text", "")
             
             # Categorize the analysis
@@ -386,6 +449,44 @@ def analyze_and_batch_event(event, bedrock_client, skip_analysis=False):
         return []
 
 
+def fetch_affected_resources_for_accounts(health_client, event_arn, account_ids):
+    """
+    Fetch the affected resources of an event for a batch of up to 10 accounts in one query
+
+    Args:
+        health_client: AWS Health client
+        event_arn (str): ARN of the health event
+        account_ids (list): Affected account IDs (at most ENTITY_FILTERS_PER_CALL)
+
+    Returns:
+        dict: Account ID -> comma-separated entity values ("None specified" if all are empty);
+              accounts with no entities, or whose lookup failed, are omitted
+    """
+    entity_values_by_account = defaultdict(list)
+    try:
+        paginator = health_client.get_paginator("describe_affected_entities_for_organization")
+        pages = paginator.paginate(
+            organizationEntityFilters=[
+                {"eventArn": event_arn, "awsAccountId": account_id} for account_id in account_ids
+            ],
+            PaginationConfig={"PageSize": 100},
+        )
+        for page in pages:
+            for entity in page.get("entities", ()):
+                values = entity_values_by_account[entity.get("awsAccountId")]
+                entity_value = entity.get("entityValue")
+                if entity_value:
+                    values.append(entity_value)
+    except Exception as e:
+        logging.error(f"Error getting affected entities for accounts {account_ids}: {str(e)}")
+        return {}
+
+    return {
+        account_id: ", ".join(values) if values else "None specified"
+        for account_id, values in entity_values_by_account.items()
+    }
+
+
 def process_single_event_mode(event, health_client, bedrock_client):
     """
     Process a single event by ARN
@@ -406,36 +507,41 @@ def process_single_event_mode(event, health_client, bedrock_client):
     service = arn_parts[1] if len(arn_parts) > 1 else "UNKNOWN"
     event_type_code = arn_parts[2] if len(arn_parts) > 2 else "UNKNOWN"
 
-    # Create a synthetic event with information from the ARN
+    # Create a synthetic event with information from the ARN (one timestamp for both times)
+    now_iso = datetime.utcnow().isoformat()
     synthetic_event = {
         "arn": single_event_arn,
         "eventArn": single_event_arn,
         "eventTypeCode": event_type_code,
         "eventTypeCategory": "issue",
         "service": service,
-        "region": os.environ.get("AWS_REGION", "us-east-1"),
-        "startTime": datetime.utcnow().isoformat(),
-        "lastUpdatedTime": datetime.utcnow().isoformat(),
+        "region": AWS_REGION,
+        "startTime": now_iso,
+        "lastUpdatedTime": now_iso,
         "accountId": "N/A",
         "description": f"This is a synthetic event created for analysis of ARN: {single_event_arn}",
     }
 
+    # Probed once here and reused for the affected-accounts lookup below
+    use_org_view = is_org_view_enabled()
+    logging.info(f"Organization view enabled: {use_org_view}")
+
     # Try to get more information from the events list
     try:
-        use_org_view = is_org_view_enabled()
-        logging.info(f"Organization view enabled: {use_org_view}")
-
-        list_filter = {"services": [service]} if service != "UNKNOWN" else {}
-        logging.debug(f"Attempting to list events with filter: {list_filter}")
-
+        # Narrow the listing to this event instead of a 100-event page of the whole service:
+        # the account API filters by ARN, the organization API by service and event type code
         if use_org_view:
+            list_filter = {"services": [service]} if service != "UNKNOWN" else {}
+            if event_type_code != "UNKNOWN":
+                list_filter["eventTypeCodes"] = [event_type_code]
+            logging.debug(f"Attempting to list events with filter: {list_filter}")
             list_response = health_client.describe_events_for_organization(
                 filter=list_filter, maxResults=100
             )
         else:
-            list_response = health_client.describe_events(
-                filter=list_filter, maxResults=100
-            )
+            list_filter = {"eventArns": [single_event_arn]}
+            logging.debug(f"Attempting to list events with filter: {list_filter}")
+            list_response = health_client.describe_events(filter=list_filter)
 
         if "events" in list_response:
             for evt in list_response["events"]:
@@ -471,7 +577,7 @@ def process_single_event_mode(event, health_client, bedrock_client):
     # Try to get affected accounts (with pagination support)
     affected_accounts = []
     try:
-        if is_org_view_enabled():
+        if use_org_view:
             logging.info("Attempting to get affected accounts with pagination")
             affected_accounts = fetch_affected_accounts_for_event(single_event_arn)
             logging.info(f"Found {len(affected_accounts)} affected accounts")
@@ -483,40 +589,28 @@ def process_single_event_mode(event, health_client, bedrock_client):
 
     if affected_accounts:
         logging.info(f"Processing event for {len(affected_accounts)} affected accounts")
+
+        # Look up entity details in batches of 10 accounts per call, all batches concurrently
+        account_batches = [
+            affected_accounts[i:i + ENTITY_FILTERS_PER_CALL]
+            for i in range(0, len(affected_accounts), ENTITY_FILTERS_PER_CALL)
+        ]
+        affected_resources_by_account = {}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=AFFECTED_ENTITIES_MAX_WORKERS) as executor:
+            for batch_resources in executor.map(
+                lambda account_batch: fetch_affected_resources_for_accounts(
+                    health_client, single_event_arn, account_batch
+                ),
+                account_batches,
+            ):
+                affected_resources_by_account.update(batch_resources)
+
         for account_id in affected_accounts:
             account_event = synthetic_event.copy()
             account_event["accountId"] = account_id
             account_event["accountName"] = get_account_name(account_id)
-
-            # Try to get entity details for this account
-            try:
-                entities_response = (
-                    health_client.describe_affected_entities_for_organization(
-                        organizationEntityFilters=[
-                            {
-                                "eventArn": single_event_arn,
-                                "awsAccountId": account_id,
-                            }
-                        ]
-                    )
-                )
-
-                entities = entities_response.get("entities", [])
-                if entities:
-                    affected_resources = ", ".join(
-                        [
-                            e.get("entityValue", "")
-                            for e in entities
-                            if e.get("entityValue")
-                        ]
-                    )
-                    account_event["affected_resources"] = (
-                        affected_resources if affected_resources else "None specified"
-                    )
-            except Exception as e:
-                logging.error(
-                    f"Error getting affected entities for account {account_id}: {str(e)}"
-                )
+            if account_id in affected_resources_by_account:
+                account_event["affected_resources"] = affected_resources_by_account[account_id]
 
             # Process this account's event
             account_analysis = process_single_event(bedrock_client, account_event)
@@ -589,10 +683,8 @@ def process_batch_events(health_client, bedrock_client, sqs_client, context, loo
     """
     logging.info("Starting batch event processing")
 
-    # Get configuration from environment
-    analysis_window_days = lookback_days if lookback_days is not None else int(os.environ["ANALYSIS_WINDOW_DAYS"])
-    excluded_services = os.environ.get("EXCLUDED_SERVICES", "").split(",")
-    excluded_services = [s.strip() for s in excluded_services if s.strip()]
+    # Configuration is read from the environment once at import (utils.config)
+    analysis_window_days = lookback_days if lookback_days is not None else ANALYSIS_WINDOW_DAYS
 
     logging.info(
         f"Configuration: analysis_window_days={analysis_window_days}, excluded_services={len(excluded_services)}"
@@ -602,11 +694,8 @@ def process_batch_events(health_client, bedrock_client, sqs_client, context, loo
         logging.info(f"Using scheduled sync mode with {lookback_days} days lookback")
 
     # Get event categories to process from environment variable
-    event_categories_to_process = []
-    if "EVENT_CATEGORIES" in os.environ and os.environ["EVENT_CATEGORIES"].strip():
-        event_categories_to_process = [
-            cat.strip() for cat in os.environ["EVENT_CATEGORIES"].split(",")
-        ]
+    event_categories_to_process = event_categories
+    if event_categories_to_process:
         logging.info(
             f"Will only process these event categories: {event_categories_to_process}"
         )
@@ -622,8 +711,8 @@ def process_batch_events(health_client, bedrock_client, sqs_client, context, loo
     logging.info(f"Fetching events between {start_time} and {end_time}")
 
     # Format dates properly for the API
-    formatted_start = start_time.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
-    formatted_end = end_time.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+    formatted_start = start_time.isoformat(timespec="milliseconds") + "Z"
+    formatted_end = end_time.isoformat(timespec="milliseconds") + "Z"
 
     # Fetch events from AWS Health
     all_events = []
@@ -681,69 +770,64 @@ def process_batch_events(health_client, bedrock_client, sqs_client, context, loo
 
     logging.info(f"Retrieved {len(all_events)} events from AWS Health API")
 
+    # An event updated while the pages were being read can be returned twice
+    all_events = dedupe_events_by_arn(all_events)
+
     # Fetch affected accounts for each event and expand
     logging.info(f"Fetching affected accounts for {len(all_events)} events...")
     all_events_with_accounts = []
 
-    for i, event in enumerate(all_events):
-        # Check remaining time to avoid timeout
-        if context.get_remaining_time_in_millis() < 30000:  # 30 seconds buffer
-            logging.warning(
-                f"Approaching timeout, processing remaining {len(all_events) - i} events without account fetching"
-            )
-            # Add remaining events without account fetching
-            for remaining_event in all_events[i:]:
-                remaining_event["affectedAccounts"] = []
-                all_events_with_accounts.append(remaining_event)
-            break
+    # Fetch accounts for all events concurrently; results are collected in event order
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=AFFECTED_ACCOUNTS_MAX_WORKERS)
+    futures = [executor.submit(fetch_event_affected_accounts, event) for event in all_events]
+    timed_out = False
 
-        try:
-            event_arn = event.get("arn", "")
-            if event_arn:
-                # Fetch affected accounts for this event (with pagination support)
-                affected_accounts = fetch_affected_accounts_for_event(event_arn)
-                event["affectedAccounts"] = affected_accounts
-
-                if affected_accounts:
-                    logging.debug(
-                        f"Event {event.get('eventTypeCode', 'unknown')} affects {len(affected_accounts)} accounts"
-                    )
-                else:
-                    logging.debug(
-                        f"Event {event.get('eventTypeCode', 'unknown')} has no affected accounts - will be skipped"
-                    )
-            else:
+    for i, (event, future) in enumerate(zip(all_events, futures)):
+        if not timed_out:
+            # Wait only until the 30 second buffer before the Lambda timeout
+            wait_seconds = max(context.get_remaining_time_in_millis() - 30000, 0) / 1000
+            try:
+                event["affectedAccounts"] = future.result(timeout=wait_seconds)
+            except concurrent.futures.TimeoutError:
+                timed_out = True
                 logging.warning(
-                    f"Event {event.get('eventTypeCode', 'unknown')} has no ARN - will be skipped"
+                    f"Approaching timeout, processing remaining {len(all_events) - i} events without account fetching"
                 )
-                event["affectedAccounts"] = []
+                for pending in futures[i:]:
+                    pending.cancel()
 
-        except Exception as e:
-            logging.error(
-                f"Error fetching affected accounts for event {event.get('eventTypeCode', 'unknown')}: {str(e)}"
+        if timed_out:
+            # Keep results that already finished; the rest continue without account fetching
+            event["affectedAccounts"] = (
+                future.result() if future.done() and not future.cancelled() else []
             )
-            event["affectedAccounts"] = []
 
         all_events_with_accounts.append(event)
 
+    executor.shutdown(wait=False, cancel_futures=True)
+
     # Now expand events by affected accounts
-    all_events_expanded = expand_events_by_account(all_events_with_accounts)
+    # Expanded records are only built for synchronous processing; routing needs just the count
+    expanded_count = count_expanded_events(all_events_with_accounts)
     items_count = len(all_events)
+    logging.info(
+        f"Expanded {items_count} events to {expanded_count} account-specific events"
+    )
 
     # Check if we should use SQS for parallel processing or process synchronously
     # ALWAYS use SQS for scheduled sync mode for better performance
     if lookback_days is not None:
         logging.info(
-            f"Scheduled sync mode: forcing SQS parallel processing for {items_count} events ({len(all_events_expanded)} expanded)"
+            f"Scheduled sync mode: forcing SQS parallel processing for {items_count} events ({expanded_count} expanded)"
         )
         return process_with_sqs(
             all_events_with_accounts, bedrock_client, items_count, event_categories_to_process
         )
     elif (
-        DYNAMODB_TABLE_NAME and len(all_events_expanded) > 10
+        DYNAMODB_TABLE_NAME and expanded_count > 10
     ):  # Use SQS for large batches
         logging.info(
-            f"Large batch detected ({len(all_events_expanded)} events), using SQS for parallel processing..."
+            f"Large batch detected ({expanded_count} events), using SQS for parallel processing..."
         )
         return process_with_sqs(
             all_events_with_accounts, bedrock_client, items_count, event_categories_to_process
@@ -751,17 +835,80 @@ def process_batch_events(health_client, bedrock_client, sqs_client, context, loo
     else:
         # Synchronous processing mode (for small batches)
         logging.info(
-            f"Using synchronous processing mode for {len(all_events_expanded)} events..."
+            f"Using synchronous processing mode for {expanded_count} events..."
         )
         return process_synchronously(
-            all_events_expanded,
+            expand_events_by_account(all_events_with_accounts),
             items_count,
+            expanded_count,
             event_categories_to_process,
             bedrock_client,
             context,
         )
 
 
+def dedupe_events_by_arn(events):
+    """
+    Drop repeated events, keeping the most recently updated copy of each ARN
+
+    Args:
+        events (list): Health events from describe_events_for_organization
+
+    Returns:
+        list: Events with unique ARNs (events without an ARN are kept as-is)
+    """
+    unique_events = {}
+    events_without_arn = []
+    for event in events:
+        event_arn = event.get("arn")
+        if not event_arn:
+            events_without_arn.append(event)
+            continue
+        current = unique_events.get(event_arn)
+        if current is None or (
+            event.get("lastUpdatedTime")
+            and current.get("lastUpdatedTime")
+            and event["lastUpdatedTime"] > current["lastUpdatedTime"]
+        ):
+            unique_events[event_arn] = event
+
+    if len(unique_events) + len(events_without_arn) < len(events):
+        logging.info(
+            f"Removed {len(events) - len(unique_events) - len(events_without_arn)} duplicate events"
+        )
+    return [*unique_events.values(), *events_without_arn]
+
+
+def fetch_event_affected_accounts(event):
+    """
+    Fetch affected accounts for a single event (runs on the process_batch_events worker pool)
+
+    Args:
+        event (dict): Health event from describe_events_for_organization
+
+    Returns:
+        list: Affected account IDs, empty if the event has no ARN or the lookup fails
+    """
+    event_type_code = event.get("eventTypeCode", "unknown")
+    event_arn = event.get("arn", "")
+    if not event_arn:
+        logging.warning(f"Event {event_type_code} has no ARN - will be skipped")
+        return []
+
+    try:
+        # Fetch affected accounts for this event (with pagination support)
+        affected_accounts = fetch_affected_accounts_for_event(event_arn)
+    except Exception as e:
+        logging.error(f"Error fetching affected accounts for event {event_type_code}: {str(e)}")
+        return []
+
+    if affected_accounts:
+        logging.debug(f"Event {event_type_code} affects {len(affected_accounts)} accounts")
+    else:
+        logging.debug(f"Event {event_type_code} has no affected accounts - will be skipped")
+    return affected_accounts
+
+
 def fetch_organization_events(
     health_client, formatted_start, formatted_end, event_categories_to_process, context
 ):
@@ -779,35 +926,20 @@ def fetch_organization_events(
         event_filter["eventTypeCategories"] = event_categories_to_process
 
     logging.info(f"Fetching ALL events (all statuses) with filter: {event_filter}")
-    response = health_client.describe_events_for_organization(
-        filter=event_filter, maxResults=100
-    )
+    paginator = health_client.get_paginator("describe_events_for_organization")
+    pages = paginator.paginate(filter=event_filter, PaginationConfig={"PageSize": 100})  # Request maximum per page
 
-    if "events" in response:
-        all_events.extend(response["events"])
-        logging.info(
-            f"Retrieved {len(response.get('events', []))} events"
-        )
+    for page_count, page in enumerate(pages, 1):
+        page_events = page.get("events", [])
+        all_events.extend(page_events)
+        logging.debug(f"Page {page_count}: Retrieved {len(page_events)} events")
 
-    # Handle pagination
-    while "nextToken" in response and response["nextToken"]:
-        logging.debug("Found nextToken, fetching more events...")
+        # Next page is only requested when the loop continues
         if context.get_remaining_time_in_millis() < 15000:
             logging.warning("Approaching Lambda timeout, stopping pagination")
             break
 
-        response = health_client.describe_events_for_organization(
-            filter=event_filter,
-            maxResults=100,
-            nextToken=response["nextToken"],
-        )
-
-        if "events" in response:
-            all_events.extend(response["events"])
-            logging.debug(
-                f"Retrieved {len(response.get('events', []))} additional events"
-            )
-
+    logging.info(f"Retrieved {len(all_events)} events")
     return all_events
 
 
@@ -835,15 +967,16 @@ def process_with_sqs(all_events_with_accounts, bedrock_client, items_count, even
     # Smart detection: Should we skip analysis in main Lambda?
     skip_analysis = should_skip_analysis_in_main_lambda(all_events_with_accounts)
     
-    # Process each event: analyze once and create account batches
+    # Set membership for the per-event category check (None = process all categories)
+    category_filter = frozenset(event_categories_to_process) if event_categories_to_process else None
+
+    # Filter out events that won't be sent to SQS
+    events_to_process = []
     for event in all_events_with_accounts:
         # Check if we should process this event category
         event_type_category = event.get("eventTypeCategory", "")
         
-        if (
-            event_categories_to_process
-            and event_type_category not in event_categories_to_process
-        ):
+        if category_filter and event_type_category not in category_filter:
             logging.debug(
                 f"Skipping event {event.get('eventTypeCode', 'unknown')} with category {event_type_category} (not in configured categories)"
             )
@@ -863,15 +996,47 @@ def process_with_sqs(all_events_with_accounts, bedrock_client, items_count, even
         event_arn = event.get("arn", "")
         if event_arn:
             event["eventArn"] = event_arn
-        
-        # Analyze event once and create batches (or skip analysis if detected)
-        batch_messages = analyze_and_batch_event(event, bedrock_client, skip_analysis=skip_analysis)
+
+        events_to_process.append(event)
+
+    # Reuse cached analysis where available, and analyze the remaining events
+    # with batched Bedrock requests (several events per call) instead of one call each
+    existing_analyses = {}
+    analyzed_events = {}
+    if not skip_analysis:
+        uncached_events = []
+        for event in events_to_process:
+            existing_analysis = get_existing_analysis(event)
+            if existing_analysis is None:
+                uncached_events.append(event)
+            else:
+                existing_analyses[id(event)] = existing_analysis
+
+        if uncached_events:
+            logging.info(
+                f"{len(events_to_process) - len(uncached_events)} events have cached analysis, "
+                f"analyzing {len(uncached_events)} events with batched Bedrock requests"
+            )
+            results, bedrock_calls = analyze_events_batch(
+                bedrock_client,
+                [build_event_for_analysis(event) for event in uncached_events],
+            )
+            analyzed_events = {
+                id(event): result for event, result in zip(uncached_events, results)
+            }
+
+    # Create account batches for each event (analysis is shared across its accounts)
+    for event in events_to_process:
+        batch_messages = analyze_and_batch_event(
+            event,
+            bedrock_client,
+            skip_analysis=skip_analysis,
+            existing_analysis=existing_analyses.get(id(event)),
+            analyzed_event=analyzed_events.get(id(event)),
+        )
         
         if batch_messages:
             all_batch_messages.extend(batch_messages)
-            # Only count as Bedrock call if we actually analyzed (not skipped)
-            if not skip_analysis:
-                bedrock_calls += 1
     
     if skip_analysis:
         logging.info(
@@ -912,15 +1077,166 @@ def process_with_sqs(all_events_with_accounts, bedrock_client, items_count, even
                     "batches_failed_to_send": sqs_result["failed"],
                     "filtered_events": filtered_count,
                     "optimization_note": "Analysis deferred to SQS workers for parallel processing" if skip_analysis else f"Avoided {len(all_batch_messages) - bedrock_calls} duplicate Bedrock calls",
-                    "message": f"Sent {sqs_result['sent']} batches to SQS for parallel processing" + (f" (analyzed {bedrock_calls} unique events)" if not skip_analysis else " (analysis will be done by SQS workers)"),
+                    "message": f"Sent {sqs_result['sent']} batches to SQS for parallel processing" + (f" ({bedrock_calls} Bedrock calls in main Lambda)" if not skip_analysis else " (analysis will be done by SQS workers)"),
                 }
             ),
         }
 
 
+def analyze_with_cache(bedrock_client, event_for_analysis, analysis_cache):
+    """
+    Analyze an event with Bedrock once per distinct prompt
+
+    The prompt only uses the event type, category, region, start time and description, so
+    account copies of the same event share one Bedrock call; concurrent callers with the same
+    prompt wait for the first one instead of calling Bedrock themselves.
+
+    Args:
+        bedrock_client: Bedrock client
+        event_for_analysis (dict): Event to analyze (analysis fields are added to it)
+        analysis_cache (dict): Prompt key -> Future of the analysis fields, shared per invocation
+
+    Returns:
+        dict: event_for_analysis updated with the analysis, as analyze_event_with_bedrock returns it
+    """
+    cache_key = (
+        event_for_analysis.get("eventTypeCode"),
+        event_for_analysis.get("eventTypeCategory"),
+        event_for_analysis.get("region"),
+        str(event_for_analysis.get("startTime")),
+        event_for_analysis.get("description"),
+    )
+    with _analysis_cache_lock:
+        cached = analysis_cache.get(cache_key)
+        if cached is None:
+            pending = analysis_cache[cache_key] = concurrent.futures.Future()
+
+    if cached is not None:
+        try:
+            analysis_fields = cached.result()
+        except Exception:
+            return analyze_event_with_bedrock(bedrock_client, event_for_analysis)
+        event_for_analysis.update(analysis_fields)
+        return event_for_analysis
+
+    try:
+        input_keys = set(event_for_analysis)
+        analysis = analyze_event_with_bedrock(bedrock_client, event_for_analysis)
+        pending.set_result({key: analysis[key] for key in analysis.keys() - input_keys})
+        return analysis
+    finally:
+        # Never leave waiters blocked; they fall back to analyzing on their own
+        if not pending.done():
+            pending.set_exception(RuntimeError("Shared Bedrock analysis failed"))
+            with _analysis_cache_lock:
+                analysis_cache.pop(cache_key, None)
+
+
+def analyze_expanded_event(item, account_id, bedrock_client, context, analysis_cache):
+    """
+    Fetch Health details for one expanded event and analyze it with Bedrock
+    (runs on the process_synchronously worker pool)
+
+    Args:
+        item (dict): Expanded event (one affected account)
+        account_id (str): Affected account ID
+        bedrock_client: Bedrock client
+        context: Lambda context
+        analysis_cache (dict): Per-invocation analysis cache (see analyze_with_cache)
+
+    Returns:
+        tuple: (event_entry, categories), or None if skipped near the timeout or on error
+    """
+    if context.get_remaining_time_in_millis() <= 10000:
+        logging.warning(
+            f"Approaching Lambda timeout, skipping event {item.get('eventTypeCode', 'unknown')}"
+        )
+        return None
+
+    try:
+        logging.debug(f"Processing with account ID: {account_id}")
+
+        # Get account name
+        account_name = get_account_name(account_id)
+
+        # Fetch additional details from Health API
+        health_data = fetch_health_event_details_for_org(
+            item.get("arn", ""), account_id
+        )
+
+        # Extract the actual description for analysis
+        actual_description = (
+            health_data["details"]
+            .get("eventDescription", {})
+            .get("latestDescription", "")
+        )
+
+        if not actual_description:
+            actual_description = (
+                item.get("eventDescription", "")
+                or item.get("description", "")
+                or item.get("message", "")
+                or "No description available"
+            )
+
+        logging.debug(
+            f"Using description (length: {len(actual_description)}): {actual_description[:100]}..."
+        )
+
+        # Analyze a shallow copy carrying the actual description: analyze_event_with_bedrock
+        # writes its results into the dict it is given, and item must stay untouched
+        item_with_description = {**item, "description": actual_description}
+
+        analysis = analyze_with_cache(bedrock_client, item_with_description, analysis_cache)
+
+        categories = categorize_analysis(analysis)
+
+        # Handle region - use "global" for events without a specific region
+        item_region = item.get("region", "")
+        if not item_region or item_region == "":
+            item_region = "global"
+        
+        # Create structured event data with both raw data and analysis
+        event_entry = {
+            "arn": item.get("arn", "N/A"),
+            "eventArn": item.get("eventArn", item.get("arn", "N/A")),
+            "event_type": item.get("eventTypeCode", "N/A"),
+            "service": item.get("service", "N/A"),
+            "description": actual_description,
+            "region": item_region,
+            "start_time": format_date_only(item.get("startTime", "N/A")),
+            "last_update_time": format_datetime(item.get("lastUpdatedTime", "N/A")),
+            "status_code": item.get("statusCode", "unknown"),
+            "event_type_category": item.get("eventTypeCategory", "N/A"),
+            "analysis_text": analysis,
+            "critical": categories.get("critical", False),
+            "risk_level": categories.get("risk_level", "LOW"),
+            "accountId": account_id,
+            "accountName": account_name,
+            "impact_analysis": categories.get("impact_analysis", ""),
+            "required_actions": categories.get("required_actions", ""),
+            "time_sensitivity": categories.get("time_sensitivity", "Routine"),
+            "risk_category": categories.get("risk_category", "Unknown"),
+            "consequences_if_ignored": categories.get(
+                "consequences_if_ignored", ""
+            ),
+            "affected_resources": extract_affected_resources(
+                health_data["entities"]
+            ),
+            "event_impact_type": categories.get("event_impact_type", "Unknown"),
+        }
+
+        return event_entry, categories
+    except Exception as e:
+        logging.error(f"Error analyzing event: {str(e)}")
+        logging.error(f"{traceback.format_exc()}")
+        return None
+
+
 def process_synchronously(
     all_events_expanded,
     items_count,
+    expanded_count,
     event_categories_to_process,
     bedrock_client,
     context,
@@ -931,134 +1247,74 @@ def process_synchronously(
     events_analysis = []
     event_categories = defaultdict(int)
     filtered_count = 0
+    items_to_analyze = []
+    # Set membership for the per-event category check (None = process all categories)
+    category_filter = frozenset(event_categories_to_process) if event_categories_to_process else None
 
-    # Process each event from the expanded API results
+    # Filter the expanded API results; only events that pass are analyzed
     for item in all_events_expanded:
-        if context.get_remaining_time_in_millis() > 10000:
-            # Check if we should process this event category
-            event_type_category = item.get("eventTypeCategory", "")
+        if context.get_remaining_time_in_millis() <= 10000:
+            logging.warning("Approaching Lambda timeout, stopping event processing")
+            break
 
-            if (
-                event_categories_to_process
-                and event_type_category not in event_categories_to_process
-            ):
-                logging.debug(
-                    f"Skipping event {item.get('eventTypeCode', 'unknown')} with category {event_type_category} (not in configured categories)"
-                )
-                filtered_count += 1
-                continue
+        # Check if we should process this event category
+        event_type_category = item.get("eventTypeCategory", "")
 
+        if category_filter and event_type_category not in category_filter:
             logging.debug(
-                f"Processing event: {item.get('eventTypeCode', 'unknown')} with category {event_type_category}"
+                f"Skipping event {item.get('eventTypeCode', 'unknown')} with category {event_type_category} (not in configured categories)"
             )
+            filtered_count += 1
+            continue
 
-            try:
-                # Ensure we have the event ARN and standardize field name
-                event_arn = item.get("arn", "")
-                if event_arn:
-                    item["eventArn"] = event_arn
-
-                # Extract account ID from ARN
-                account_id = item.get("accountId", "N/A")
-
-                # Skip events without valid account ID early to save processing time
-                if account_id == "N/A" or not account_id:
-                    logging.debug(
-                        f"Skipping event {item.get('eventTypeCode', 'unknown')} - no valid account ID"
-                    )
-                    filtered_count += 1
-                    continue
-
-                logging.debug(f"Processing with account ID: {account_id}")
-
-                # Get account name
-                account_name = get_account_name(account_id)
-
-                # Fetch additional details from Health API
-                health_data = fetch_health_event_details_for_org(
-                    item.get("arn", ""), account_id
-                )
+        logging.debug(
+            f"Processing event: {item.get('eventTypeCode', 'unknown')} with category {event_type_category}"
+        )
 
-                # Extract the actual description for analysis
-                actual_description = (
-                    health_data["details"]
-                    .get("eventDescription", {})
-                    .get("latestDescription", "")
-                )
+        # Ensure we have the event ARN and standardize field name
+        event_arn = item.get("arn", "")
+        if event_arn:
+            item["eventArn"] = event_arn
 
-                if not actual_description:
-                    actual_description = (
-                        item.get("eventDescription", "")
-                        or item.get("description", "")
-                        or item.get("message", "")
-                        or "No description available"
-                    )
+        # Extract account ID from ARN
+        account_id = item.get("accountId", "N/A")
 
-                logging.debug(
-                    f"Using description (length: {len(actual_description)}): {actual_description[:100]}..."
-                )
-
-                # Update the item with the actual description to improve analysis
-                item_with_description = item.copy()
-                item_with_description["description"] = actual_description
+        # Skip events without valid account ID early to save processing time
+        if account_id == "N/A" or not account_id:
+            logging.debug(
+                f"Skipping event {item.get('eventTypeCode', 'unknown')} - no valid account ID"
+            )
+            filtered_count += 1
+            continue
 
-                analysis = analyze_event_with_bedrock(
-                    bedrock_client, item_with_description
-                )
+        items_to_analyze.append((item, account_id))
 
-                categories = categorize_analysis(analysis)
-                if categories.get("critical", False):
-                    event_categories["critical"] += 1
+    # Health + Bedrock calls are I/O-bound: overlap them, bounded to respect Bedrock rate limits.
+    # Account copies of the same event share one Bedrock analysis through analysis_cache.
+    analysis_cache = {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=BEDROCK_MAX_CONCURRENCY) as executor:
+        results = executor.map(
+            lambda item_and_account: analyze_expanded_event(
+                *item_and_account, bedrock_client, context, analysis_cache
+            ),
+            items_to_analyze,
+        )
+        for result in results:
+            if result is None:
+                continue
+            event_entry, categories = result
 
-                risk_level = categories.get("risk_level", "LOW")
-                event_categories[f"{risk_level}_risk"] += 1
+            if categories.get("critical", False):
+                event_categories["critical"] += 1
 
-                account_impact = categories.get("account_impact", "low")
-                event_categories[f"{account_impact}_impact"] += 1
+            risk_level = categories.get("risk_level", "LOW")
+            event_categories[RISK_LEVEL_KEYS.get(risk_level) or f"{risk_level}_risk"] += 1
 
-                # Handle region - use "global" for events without a specific region
-                item_region = item.get("region", "")
-                if not item_region or item_region == "":
-                    item_region = "global"
-                
-                # Create structured event data with both raw data and analysis
-                event_entry = {
-                    "arn": item.get("arn", "N/A"),
-                    "eventArn": item.get("eventArn", item.get("arn", "N/A")),
-                    "event_type": item.get("eventTypeCode", "N/A"),
-                    "service": item.get("service", "N/A"),
-                    "description": actual_description,
-                    "region": item_region,
-                    "start_time": format_date_only(item.get("startTime", "N/A")),
-                    "last_update_time": format_datetime(item.get("lastUpdatedTime", "N/A")),
-                    "status_code": item.get("statusCode", "unknown"),
-                    "event_type_category": item.get("eventTypeCategory", "N/A"),
-                    "analysis_text": analysis,
-                    "critical": categories.get("critical", False),
-                    "risk_level": categories.get("risk_level", "LOW"),
-                    "accountId": account_id,
-                    "accountName": account_name,
-                    "impact_analysis": categories.get("impact_analysis", ""),
-                    "required_actions": categories.get("required_actions", ""),
-                    "time_sensitivity": categories.get("time_sensitivity", "Routine"),
-                    "risk_category": categories.get("risk_category", "Unknown"),
-                    "consequences_if_ignored": categories.get(
-                        "consequences_if_ignored", ""
-                    ),
-                    "affected_resources": extract_affected_resources(
-                        health_data["entities"]
-                    ),
-                    "event_impact_type": categories.get("event_impact_type", "Unknown"),
-                }
+            account_impact = categories.get("account_impact", "low")
+            event_categories[ACCOUNT_IMPACT_KEYS.get(account_impact) or f"{account_impact}_impact"] += 1
 
-                events_analysis.append(event_entry)
-                logging.debug(f"Successfully analyzed event {len(events_analysis)}")
-            except Exception as e:
-                logging.error(f"Error analyzing event: {str(e)}")
-                logging.error(f"{traceback.format_exc()}")
-        else:
-            logging.warning("Approaching Lambda timeout, stopping event processing")
-            break
+            events_analysis.append(event_entry)
+            logging.debug(f"Successfully analyzed event {len(events_analysis)}")
 
     if events_analysis:
         logging.info(
@@ -1091,7 +1347,7 @@ def process_synchronously(
                 "body": json.dumps(
                     {
                         "total_events": items_count,
-                        "total_expanded_events": len(all_events_expanded),
+                        "total_expanded_events": expanded_count,
                         "analyzed_events": len(events_analysis),
                         "filtered_events": filtered_count,
                         "stored_in_dynamodb": storage_result["stored"],
@@ -2,17 +2,38 @@
 SQS event processing for individual health events
 """
 
+import concurrent.futures
 import json
 import logging
-import traceback
 import re
+
+import orjson
+
 from aws_clients.client_manager import get_clients
+from aws_clients.organizations_client import get_account_name
+from aws_clients.health_client import fetch_health_event_details_for_org_bulk, fetch_per_account_status_batch
+from analysis.bedrock_analyzer import analyze_event_with_bedrock, categorize_analysis
 from utils.event_helpers import normalize_event_format
+from utils.helpers import format_date_only, format_datetime, extract_affected_resources
+from utils.sqs_helpers import decode_message_body
 from storage.dynamodb_handler import (
     process_single_event,
     store_events_in_dynamodb,
 )
 
+logger = logging.getLogger(__name__)
+
+# Concurrent account lookups per batch message (messages carry at most 10 accounts)
+ACCOUNT_LOOKUP_MAX_WORKERS = 10
+
+# Shared pool for a batch message's independent lookups: one per account name, plus the
+# Health details and per-account status fetches
+_lookup_executor = concurrent.futures.ThreadPoolExecutor(max_workers=ACCOUNT_LOOKUP_MAX_WORKERS + 2)
+
+# Escape sequences json.loads rejects, replaced with spaces when recovering a malformed message body
+_HEX_ESC_RE = re.compile(r"\\x[0-9a-fA-F]{2}")
+_INVALID_ESC_RE = re.compile(r'\\[^"\\bfnrt/]')
+
 
 def process_sqs_event(event, context):
     """
@@ -35,6 +56,9 @@ def process_sqs_event(event, context):
         ...
     }
 
+    Every record of the SQS batch is processed; the resulting event records are stored
+    with a single DynamoDB batch write and only the failed messages are reported back.
+
     Args:
         event (dict): Lambda event from SQS
         context: Lambda context
@@ -42,63 +66,193 @@ def process_sqs_event(event, context):
     Returns:
         dict: Processing result with batch item failures format
     """
+    records = event.get("Records", [])
     try:
         # Initialize clients
         health_client, bedrock_client, sqs_client = get_clients()
 
-        # Extract the health event data from SQS message
-        sqs_record = event["Records"][0]
-        raw_body = sqs_record["body"]
+        failures = []
+        # (messageId, event records) for every message processed successfully
+        processed = []
+        for sqs_record in records:
+            try:
+                events_analysis = process_sqs_record(sqs_record, health_client, bedrock_client, context)
+            except Exception as e:
+                logger.exception("Error processing SQS message %s: %s", sqs_record.get("messageId"), e)
+                events_analysis = None
 
-        # Handle JSON parsing with potential escape sequence issues
-        try:
-            message_body = json.loads(raw_body)
-        except json.JSONDecodeError as e:
-            logging.error(f"JSON decode error: {str(e)}")
-            # Try to fix invalid escape sequences
+            if events_analysis:
+                processed.append((sqs_record.get("messageId"), events_analysis))
+            else:
+                failures.append({"itemIdentifier": sqs_record.get("messageId")})
+
+        # Store the event records of all messages with one batch write
+        all_events = [entry for _, events_analysis in processed for entry in events_analysis]
+        if all_events:
             try:
-                # Replace invalid escape sequences with spaces or remove them
-                fixed_body = re.sub(
-                    r"\\x[0-9a-fA-F]{2}", " ", raw_body
-                )  # Replace hex escapes
-                fixed_body = re.sub(
-                    r'\\[^"\\bfnrt/]', " ", fixed_body
-                )  # Replace other invalid escapes
-                message_body = json.loads(fixed_body)
-                logging.info(
-                    "Successfully parsed JSON after fixing escape sequences"
-                )
-            except json.JSONDecodeError as e2:
-                logging.error(
-                    f"Failed to parse JSON even after fixing: {str(e2)}"
+                storage_result = store_events_in_dynamodb(all_events)
+            except Exception as e:
+                logger.exception("Error storing SQS batch in DynamoDB: %s", e)
+                failures.extend({"itemIdentifier": message_id} for message_id, _ in processed)
+            else:
+                # NOTE: Counts are NOT updated here to avoid performance issues.
+                # ARN-based counts require checking ALL accounts for each ARN to determine
+                # if the ARN is fully closed. This is done during scheduled_sync instead.
+                # The counts will be slightly stale (up to sync interval) but accurate.
+                logger.debug("Skipping counts update in SQS - will be handled by scheduled sync")
+
+                logger.info(
+                    "SQS batch complete: messages=%s, failed=%s, stored=%s, updated=%s",
+                    len(records), len(failures), storage_result.get("stored", 0), storage_result.get("updated", 0)
                 )
-                return {
-                    "batchItemFailures": [
-                        {"itemIdentifier": sqs_record.get("messageId")}
-                    ]
-                }
-        
-        # Check if this is the new batch format or old single-event format
-        if "accounts" in message_body and "analysis" in message_body and "categories" in message_body:
-            # New optimized batch format
-            logging.info("Processing message in new batch format (optimized)")
-            return process_batch_message(message_body, health_client, bedrock_client, sqs_record, context)
-        else:
-            # Old single-event format (backward compatibility)
-            logging.info("Processing message in legacy single-event format")
-            return process_legacy_single_event(message_body, bedrock_client, sqs_record)
-            
+
+        return {"batchItemFailures": failures}
+
     except Exception as e:
-        logging.error(f"Error processing SQS event: {str(e)}")
-        logging.error(f"{traceback.format_exc()}")
+        logger.exception("Error processing SQS event: %s", e)
         return {
             "batchItemFailures": [
-                {"itemIdentifier": event["Records"][0].get("messageId")}
+                {"itemIdentifier": sqs_record.get("messageId")} for sqs_record in records
             ]
         }
 
 
-def process_batch_message(message_body, health_client, bedrock_client, sqs_record, context):
+def process_sqs_record(sqs_record, health_client, bedrock_client, context):
+    """
+    Parse one SQS message and build its event records (storage is left to the caller)
+
+    Args:
+        sqs_record (dict): SQS record from the Lambda event
+        health_client: AWS Health client
+        bedrock_client: Bedrock client for analysis
+        context: Lambda context
+
+    Returns:
+        list: Event records to store, empty if the message could not be processed
+    """
+    # Large messages arrive compressed (see utils.sqs_helpers.encode_message_body)
+    raw_body = decode_message_body(sqs_record["body"])
+
+    # Handle JSON parsing with potential escape sequence issues
+    try:
+        try:
+            message_body = orjson.loads(raw_body)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than json (e.g. it rejects lone surrogate escapes)
+            message_body = json.loads(raw_body)
+    except json.JSONDecodeError as e:
+        logger.error("JSON decode error: %s", e)
+        try:
+            try:
+                # Unescaped control characters in descriptions are the common failure: no fixup needed
+                message_body = json.loads(raw_body, strict=False)
+                logger.info("Successfully parsed JSON with control characters allowed")
+            except json.JSONDecodeError:
+                # Try to fix invalid escape sequences: replace them with spaces
+                fixed_body = _HEX_ESC_RE.sub(" ", raw_body)  # Replace hex escapes
+                fixed_body = _INVALID_ESC_RE.sub(" ", fixed_body)  # Replace other invalid escapes
+                message_body = json.loads(fixed_body, strict=False)
+                logger.info("Successfully parsed JSON after fixing escape sequences")
+        except json.JSONDecodeError as e2:
+            logger.error("Failed to parse JSON even after fixing: %s", e2)
+            return []
+
+    # Check if this is the new batch format or old single-event format
+    if "accounts" in message_body and "analysis" in message_body and "categories" in message_body:
+        # New optimized batch format
+        logger.info("Processing message in new batch format (optimized)")
+        return process_batch_message(message_body, health_client, bedrock_client, context)
+    else:
+        # Old single-event format (backward compatibility)
+        logger.info("Processing message in legacy single-event format")
+        return process_legacy_single_event(message_body, bedrock_client)
+
+
+def build_shared_event_fields(event_data, analysis, categories):
+    """
+    Build the record fields shared by every account of a batch message
+
+    Args:
+        event_data: Event from the SQS message
+        analysis: Shared analysis text
+        categories: Shared analysis categories
+
+    Returns:
+        dict: Event-level fields plus the analysis fields REUSED from the message
+        (or the deferred Bedrock analysis)
+    """
+    event_arn = event_data.get("arn", "N/A")
+    return {
+        "arn": event_arn,
+        "eventArn": event_data.get("eventArn", event_arn),
+        "event_type": event_data.get("eventTypeCode", "N/A"),
+        "service": event_data.get("service", "N/A"),
+        # Handle region - use "global" for events without a specific region
+        "region": event_data.get("region") or "global",
+        "start_time": format_date_only(event_data.get("startTime", "N/A")),
+        "last_update_time": format_datetime(event_data.get("lastUpdatedTime", "N/A")),
+        "event_type_category": event_data.get("eventTypeCategory", "N/A"),
+        "analysis_text": analysis,
+        "critical": categories.get("critical", False),
+        "risk_level": categories.get("risk_level", "LOW"),
+        "impact_analysis": categories.get("impact_analysis", ""),
+        "required_actions": categories.get("required_actions", ""),
+        "time_sensitivity": categories.get("time_sensitivity", "Routine"),
+        "risk_category": categories.get("risk_category", "Unknown"),
+        "consequences_if_ignored": categories.get("consequences_if_ignored", ""),
+        "event_impact_type": categories.get("event_impact_type", "Unknown"),
+    }
+
+
+def build_account_event_entry(account_id, account_name_future, account_status, health_data, shared_fields):
+    """
+    Build the event record for one account of a batch message
+
+    Args:
+        account_id: Affected account ID
+        account_name_future: Future resolving to the account name
+        account_status: Normalized per-account status
+        health_data: Health event details and entities for this account
+        shared_fields: Event-level fields from build_shared_event_fields
+
+    Returns:
+        dict: Event record, or None if the account could not be processed
+    """
+    try:
+        # Account-specific data (looked up concurrently by process_batch_message)
+        account_name = account_name_future.result()
+        
+        affected_resources = extract_affected_resources(
+            health_data.get("entities", [])
+        )
+        
+        # Extract description from health data (same for all accounts)
+        description = (
+            health_data.get("details", {})
+            .get("eventDescription", {})
+            .get("latestDescription", "No description available")
+        )
+        if not description:
+            description = "No description available"
+        
+        logger.debug("Account %s: status=%s", account_id, account_status)
+        
+        # Build event record with SHARED event/analysis fields and FETCHED description
+        return {
+            **shared_fields,  # REUSED event and analysis fields
+            "description": description,  # FETCHED from Health API
+            "status_code": account_status,  # PER-ACCOUNT STATUS!
+            "accountId": account_id,
+            "accountName": account_name,
+            "affected_resources": affected_resources,  # ACCOUNT-SPECIFIC
+        }
+
+    except Exception as e:
+        logger.exception("Error processing account %s: %s", account_id, e)
+        return None
+
+
+def process_batch_message(message_body, health_client, bedrock_client, context):
     """
     Process new batch message format with pre-computed analysis.
     
@@ -106,11 +260,10 @@ def process_batch_message(message_body, health_client, bedrock_client, sqs_recor
         message_body: Parsed message body with batch data
         health_client: AWS Health client
         bedrock_client: Bedrock client for analysis (when deferred)
-        sqs_record: SQS record for error handling
         context: Lambda context
         
     Returns:
-        dict: Processing result with batch item failures
+        list: Event records for the batch's accounts, empty if none could be processed
     """
     try:
         # Extract batch data from message
@@ -123,48 +276,66 @@ def process_batch_message(message_body, health_client, bedrock_client, sqs_recor
         
         # Validate required fields
         if not account_batch:
-            logging.error("Accounts array missing or empty in SQS message")
-            return {
-                "batchItemFailures": [
-                    {"itemIdentifier": sqs_record.get("messageId")}
-                ]
-            }
+            logger.error("Accounts array missing or empty in SQS message")
+            return []
+        
+        event_arn = event_data.get("arn", "")
+        event_level_status = event_data.get("statusCode", "open")  # Get event-level status for fallback
+        
+        # Health details, per-account status and account names are independent lookups: start them
+        # together so they overlap with each other (and with the Bedrock analysis, when deferred)
+        details_future = _lookup_executor.submit(
+            fetch_health_event_details_for_org_bulk, event_arn, account_batch
+        )
+        status_future = None
+        if event_level_status != "closed" and event_arn:
+            # Event is "open" or other status - fetch per-account status for granular tracking
+            logger.info("Fetching per-account status for %s accounts (event-level status: %s)", len(account_batch), event_level_status)
+            status_future = _lookup_executor.submit(
+                fetch_per_account_status_batch,
+                event_arn,
+                account_batch,
+                event_level_status=event_level_status,  # Pass event-level status as fallback
+                batch_size=10  # All accounts in this batch (max 10 per SQS message)
+            )
+        account_name_futures = [
+            _lookup_executor.submit(get_account_name, account_id)
+            for account_id in account_batch
+        ]
+        
+        # Event details and affected entities for every account in the batch (fetched at once)
+        try:
+            health_data_by_account = details_future.result()
+        except Exception as e:
+            logger.error("Error fetching Health event details for batch: %s", e)
+            health_data_by_account = {}
         
         # Check if we need to perform Bedrock analysis (deferred from main Lambda)
         needs_bedrock_analysis = (not analysis or not categories or 
                                    analysis is None or categories is None)
         
         if needs_bedrock_analysis:
-            logging.info(
-                f"Processing batch {batch_num}/{total_batches} "
-                f"with {len(account_batch)} accounts "
-                f"(will perform Bedrock analysis in SQS worker)"
+            logger.info(
+                "Processing batch %s/%s with %s accounts (will perform Bedrock analysis in SQS worker)",
+                batch_num, total_batches, len(account_batch)
             )
         else:
-            logging.info(
-                f"Processing batch {batch_num}/{total_batches} "
-                f"with {len(account_batch)} accounts "
-                f"(reusing pre-computed analysis)"
+            logger.info(
+                "Processing batch %s/%s with %s accounts (reusing pre-computed analysis)",
+                batch_num, total_batches, len(account_batch)
             )
         
-        # Import here to avoid circular dependency
-        from aws_clients.organizations_client import get_account_name
-        from aws_clients.health_client import fetch_health_event_details_for_org, fetch_per_account_status_batch
-        from utils.helpers import format_date_only, format_datetime, extract_affected_resources
-        from analysis.bedrock_analyzer import analyze_event_with_bedrock, categorize_analysis
-        
         # If analysis is missing, perform Bedrock analysis now (once for all accounts in batch)
         if needs_bedrock_analysis:
-            logging.info(f"Performing Bedrock analysis for event {event_data.get('eventTypeCode', 'unknown')}")
+            logger.info("Performing Bedrock analysis for event %s", event_data.get("eventTypeCode", "unknown"))
             
-            # Fetch event description for Bedrock analysis
-            event_arn = event_data.get("arn", "")
+            # Event description for Bedrock analysis
             description = "No description available"
             
             if event_arn and account_batch:
                 try:
-                    # Fetch event details using first account to get description
-                    health_data = fetch_health_event_details_for_org(event_arn, account_batch[0])
+                    # Use the first account's event details to get description
+                    health_data = health_data_by_account.get(account_batch[0], {})
                     description = (
                         health_data.get("details", {})
                         .get("eventDescription", {})
@@ -173,7 +344,7 @@ def process_batch_message(message_body, health_client, bedrock_client, sqs_recor
                     if not description:
                         description = "No description available"
                 except Exception as e:
-                    logging.warning(f"Could not fetch description for Bedrock analysis: {str(e)}")
+                    logger.warning("Could not fetch description for Bedrock analysis: %s", e)
                     description = "No description available"
             
             # Create event data structure for analysis
@@ -194,15 +365,15 @@ def process_batch_message(message_body, health_client, bedrock_client, sqs_recor
                 
                 # If analysis_text is empty, use impactAnalysis as fallback
                 if not analysis or analysis.strip() == "":
-                    logging.warning(f"Bedrock returned empty analysis_text, using impactAnalysis as fallback")
+                    logger.warning("Bedrock returned empty analysis_text, using impactAnalysis as fallback")
                     analysis = categories.get("impact_analysis", "Analysis data stored in category fields")
                 
-                logging.info(
-                    f"Bedrock analysis complete: risk_level={categories.get('risk_level', 'unknown')}, "
-                    f"critical={categories.get('critical', False)}"
+                logger.info(
+                    "Bedrock analysis complete: risk_level=%s, critical=%s",
+                    categories.get("risk_level", "unknown"), categories.get("critical", False)
                 )
             except Exception as e:
-                logging.error(f"Error performing Bedrock analysis in SQS worker: {str(e)}")
+                logger.error("Error performing Bedrock analysis in SQS worker: %s", e)
                 # Use fallback values
                 analysis = "Analysis failed in SQS worker"
                 categories = {
@@ -217,44 +388,35 @@ def process_batch_message(message_body, health_client, bedrock_client, sqs_recor
                     "account_impact": "low",
                 }
         
-        # NEW: Fetch per-account status for all accounts in this batch
-        event_arn = event_data.get("arn", "")
-        event_level_status = event_data.get("statusCode", "open")  # Get event-level status for fallback
+        # NEW: Per-account status for all accounts in this batch
         account_statuses = {}
         
         # CRITICAL LOGIC: If event-level status is "closed", ALL accounts must be "closed"
         # This overrides per-account status to ensure consistency
         if event_level_status == "closed":
-            logging.info(
-                f"Event-level status is 'closed' - marking all {len(account_batch)} accounts as 'closed' "
-                f"(skipping per-account status fetch)"
+            logger.info(
+                "Event-level status is 'closed' - marking all %s accounts as 'closed' (skipping per-account status fetch)",
+                len(account_batch)
             )
             account_statuses = {
                 account_id: "closed"
                 for account_id in account_batch
             }
-        elif event_arn and account_batch:
-            # Event is "open" or other status - fetch per-account status for granular tracking
+        elif status_future is not None:
             try:
-                logging.info(f"Fetching per-account status for {len(account_batch)} accounts (event-level status: {event_level_status})")
-                account_statuses = fetch_per_account_status_batch(
-                    event_arn,
-                    account_batch,
-                    event_level_status=event_level_status,  # Pass event-level status as fallback
-                    batch_size=10  # All accounts in this batch (max 10 per SQS message)
-                )
-                logging.info(f"Successfully fetched per-account status: {account_statuses}")
+                account_statuses = status_future.result()
+                logger.info("Successfully fetched per-account status: %s", account_statuses)
             except Exception as e:
-                logging.error(f"Error fetching per-account status: {str(e)}")
+                logger.error("Error fetching per-account status: %s", e)
                 # Fallback: use event-level status for all accounts
                 account_statuses = {
                     account_id: event_level_status
                     for account_id in account_batch
                 }
-                logging.warning(f"Using event-level status fallback: {event_level_status}")
+                logger.warning("Using event-level status fallback: %s", event_level_status)
         else:
             # Fallback: use event-level status if no event ARN
-            logging.warning("No event ARN or accounts, using event-level status fallback")
+            logger.warning("No event ARN or accounts, using event-level status fallback")
             account_statuses = {
                 account_id: event_level_status
                 for account_id in account_batch
@@ -276,11 +438,11 @@ def process_batch_message(message_body, health_client, bedrock_client, sqs_recor
             elif status in ['open', 'upcoming', 'ongoing']:
                 normalized_statuses[account_id] = 'open'
                 if status in ['upcoming', 'ongoing']:
-                    logging.debug(f"Normalized status '{status}' → 'open' for account {account_id}")
+                    logger.debug("Normalized status '%s' → 'open' for account %s", status, account_id)
             else:
                 # Unknown status - default to 'open' for safety (better to show false positive than miss an issue)
                 normalized_statuses[account_id] = 'open'
-                logging.warning(f"Unknown status '{status}' for account {account_id}, defaulting to 'open'")
+                logger.warning("Unknown status '%s' for account %s, defaulting to 'open'", status, account_id)
         
         # Use normalized statuses for processing
         account_statuses = normalized_statuses
@@ -290,192 +452,83 @@ def process_batch_message(message_body, health_client, bedrock_client, sqs_recor
         successful_accounts = 0
         failed_accounts = 0
         
-        for account_id in account_batch:
-            try:
-                # Fetch account-specific data
-                account_name = get_account_name(account_id)
-                
-                # Fetch affected resources AND description for this account
-                health_data = fetch_health_event_details_for_org(
-                    event_data.get("arn", ""),
-                    account_id
-                )
-                
-                affected_resources = extract_affected_resources(
-                    health_data.get("entities", [])
-                )
-                
-                # Extract description from health data (same for all accounts, but fetched per account)
-                description = (
-                    health_data.get("details", {})
-                    .get("eventDescription", {})
-                    .get("latestDescription", "No description available")
-                )
-                if not description:
-                    description = "No description available"
-                
-                # Handle region - use "global" for events without a specific region
-                event_region = event_data.get("region", "")
-                if not event_region or event_region == "":
-                    event_region = "global"
-                
-                # Get per-account status (with fallback to event-level status)
-                account_status = account_statuses.get(
-                    account_id,
-                    event_level_status  # Use event-level status instead of "unknown"
-                )
-                
-                logging.debug(f"Account {account_id}: status={account_status}")
-                
-                # Build event record with SHARED analysis and FETCHED description
-                event_entry = {
-                    "arn": event_data.get("arn", "N/A"),
-                    "eventArn": event_data.get("eventArn", event_data.get("arn", "N/A")),
-                    "event_type": event_data.get("eventTypeCode", "N/A"),
-                    "service": event_data.get("service", "N/A"),
-                    "description": description,  # FETCHED from Health API
-                    "region": event_region,
-                    "start_time": format_date_only(event_data.get("startTime", "N/A")),
-                    "last_update_time": format_datetime(event_data.get("lastUpdatedTime", "N/A")),
-                    "status_code": account_status,  # PER-ACCOUNT STATUS!
-                    "event_type_category": event_data.get("eventTypeCategory", "N/A"),
-                    "analysis_text": analysis,  # REUSED from message
-                    "critical": categories.get("critical", False),  # REUSED
-                    "risk_level": categories.get("risk_level", "LOW"),  # REUSED
-                    "accountId": account_id,
-                    "accountName": account_name,
-                    "impact_analysis": categories.get("impact_analysis", ""),  # REUSED
-                    "required_actions": categories.get("required_actions", ""),  # REUSED
-                    "time_sensitivity": categories.get("time_sensitivity", "Routine"),  # REUSED
-                    "risk_category": categories.get("risk_category", "Unknown"),  # REUSED
-                    "consequences_if_ignored": categories.get("consequences_if_ignored", ""),  # REUSED
-                    "affected_resources": affected_resources,  # ACCOUNT-SPECIFIC
-                    "event_impact_type": categories.get("event_impact_type", "Unknown"),  # REUSED
-                }
-                
+        # Event and analysis fields are identical for every account: build them once and merge them into each record
+        shared_fields = build_shared_event_fields(event_data, analysis, categories)
+        for account_id, account_name_future in zip(account_batch, account_name_futures):
+            event_entry = build_account_event_entry(
+                account_id,
+                account_name_future,
+                # Per-account status, falling back to event-level status instead of "unknown"
+                account_statuses.get(account_id, event_level_status),
+                health_data_by_account.get(account_id, {}),
+                shared_fields,
+            )
+            if event_entry is None:
+                failed_accounts += 1
+            else:
                 events_analysis.append(event_entry)
                 successful_accounts += 1
-                
-            except Exception as e:
-                logging.error(f"Error processing account {account_id}: {str(e)}")
-                logging.error(f"{traceback.format_exc()}")
-                failed_accounts += 1
-                # Continue processing remaining accounts
-                continue
         
-        # Store all successfully processed accounts in DynamoDB (batch write)
         if events_analysis:
-            logging.info(f"Storing {len(events_analysis)} event records in DynamoDB (batch write)")
-            
-            # Batch write to DynamoDB
-            storage_result = store_events_in_dynamodb(events_analysis)
-            
-            # NOTE: Counts are NOT updated here to avoid performance issues.
-            # ARN-based counts require checking ALL accounts for each ARN to determine
-            # if the ARN is fully closed. This is done during scheduled_sync instead.
-            # The counts will be slightly stale (up to sync interval) but accurate.
-            logging.debug("Skipping counts update in SQS - will be handled by scheduled sync")
-            
-            logging.info(
-                f"Batch {batch_num}/{total_batches} complete: "
-                f"successful={successful_accounts}, failed={failed_accounts}, "
-                f"stored={storage_result.get('stored', 0)}, updated={storage_result.get('updated', 0)}"
+            logger.info(
+                "Batch %s/%s processed: successful=%s, failed=%s",
+                batch_num, total_batches, successful_accounts, failed_accounts
             )
-            
-            return {"batchItemFailures": []}  # Success
         else:
-            logging.error(f"No accounts successfully processed in batch {batch_num}/{total_batches}")
-            return {
-                "batchItemFailures": [
-                    {"itemIdentifier": sqs_record.get("messageId")}
-                ]
-            }
+            logger.error("No accounts successfully processed in batch %s/%s", batch_num, total_batches)
+        return events_analysis
             
     except Exception as e:
-        logging.error(f"Error processing batch message: {str(e)}")
-        logging.error(f"{traceback.format_exc()}")
-        return {
-            "batchItemFailures": [
-                {"itemIdentifier": sqs_record.get("messageId")}
-            ]
-        }
+        logger.exception("Error processing batch message: %s", e)
+        return []
 
 
-def process_legacy_single_event(message_body, bedrock_client, sqs_record):
+def process_legacy_single_event(message_body, bedrock_client):
     """
     Process legacy single-event message format (backward compatibility).
     
     Args:
         message_body: Parsed message body
         bedrock_client: Bedrock client for analysis
-        sqs_record: SQS record for error handling
         
     Returns:
-        dict: Processing result with batch item failures
+        list: Analyzed event records, empty if the event could not be processed
     """
     try:
-
-        # Add debugging for problematic messages
-        logging.debug(
-            f"Processing message with keys: {list(message_body.keys())}"
-        )
-        if "detail" in message_body:
-            detail = message_body["detail"]
-            logging.debug(f"Detail keys: {list(detail.keys())}")
-            if "eventDescription" in detail:
-                event_desc = detail["eventDescription"]
-                logging.debug(f"EventDescription type: {type(event_desc)}")
-                if isinstance(event_desc, list):
-                    logging.debug(
-                        f"EventDescription list length: {len(event_desc)}"
-                    )
-                    if len(event_desc) > 0:
-                        logging.debug(f"First item type: {type(event_desc[0])}")
+        # Add debugging for problematic messages (only built when debug logging is on)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Processing message with keys: %s", list(message_body.keys()))
+            if "detail" in message_body:
+                detail = message_body["detail"]
+                logger.debug("Detail keys: %s", list(detail.keys()))
+                if "eventDescription" in detail:
+                    event_desc = detail["eventDescription"]
+                    logger.debug("EventDescription type: %s", type(event_desc))
+                    if isinstance(event_desc, list):
+                        logger.debug("EventDescription list length: %s", len(event_desc))
+                        if len(event_desc) > 0:
+                            logger.debug("First item type: %s", type(event_desc[0]))
 
         # Normalize event format (handles both EventBridge and API formats)
         try:
             health_event = normalize_event_format(message_body)
         except Exception as e:
-            logging.error(f"Error normalizing event format: {str(e)}")
-            logging.debug(
-                f"Message body: {json.dumps(message_body, default=str)}"
-            )
+            logger.error("Error normalizing event format: %s", e)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Message body: %s", orjson.dumps(message_body, default=str).decode())
             # Return failure for this specific message
-            return {
-                "batchItemFailures": [{"itemIdentifier": sqs_record.get("messageId")}]
-            }
+            return []
 
         # Process the individual event (with Bedrock analysis)
         events_analysis = process_single_event(bedrock_client, health_event)
 
-        if events_analysis:
-            # Store in DynamoDB
-            storage_result = store_events_in_dynamodb(events_analysis)
-
-            # NOTE: Counts are NOT updated here to avoid performance issues.
-            # ARN-based counts require checking ALL accounts for each ARN.
-            # This is done during scheduled_sync instead.
-            logging.debug("Skipping counts update in SQS - will be handled by scheduled sync")
-
-            logging.info(
-                f"Successfully processed individual event (legacy format): stored={storage_result.get('stored', 0)}, updated={storage_result.get('updated', 0)}"
-            )
-
-            return {"batchItemFailures": []}  # No failures
-        else:
-            logging.error("Failed to process individual event")
-            return {
-                "batchItemFailures": [{"itemIdentifier": sqs_record.get("messageId")}]
-            }
+        if not events_analysis:
+            logger.error("Failed to process individual event")
+        return events_analysis or []
             
     except Exception as e:
-        logging.error(f"Error processing legacy single event: {str(e)}")
-        logging.error(f"{traceback.format_exc()}")
-        return {
-            "batchItemFailures": [
-                {"itemIdentifier": sqs_record.get("messageId")}
-            ]
-        }
+        logger.exception("Error processing legacy single event: %s", e)
+        return []
 
 
 # SQS sending functionality moved to utils/sqs_helpers.py to avoid circular imports
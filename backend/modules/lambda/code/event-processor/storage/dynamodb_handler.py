@@ -1,18 +1,28 @@
-import boto3
 import json
 import logging
-import os
+import random
+import time
 import traceback
 from datetime import datetime, timedelta
 from decimal import Decimal
 from botocore.exceptions import ClientError
 
-from utils.config import DYNAMODB_TABLE_NAME, COUNTS_TABLE_NAME
+from aws_clients.client_manager import get_dynamodb_resource
+from utils.config import DYNAMODB_TABLE_NAME, COUNTS_TABLE_NAME, EVENTS_TABLE_TTL_DAYS
 from utils.helpers import format_date_only, format_datetime, extract_affected_resources
 from aws_clients.organizations_client import get_account_name
 from aws_clients.health_client import fetch_health_event_details_for_org
 from analysis.bedrock_analyzer import analyze_event_with_bedrock, categorize_analysis
 
+# Item value types DynamoDB accepts as-is (the JSON round-trip to Decimal would return them unchanged)
+DYNAMODB_NATIVE_VALUE_TYPES = frozenset((str, int, bool, type(None)))
+
+# BatchGetItem returns UnprocessedKeys when the table is throttling: retry them with
+# exponential backoff, and treat keys still unprocessed after the last retry as not found
+BATCH_GET_MAX_RETRIES = 5
+BATCH_GET_BASE_DELAY_SECONDS = 0.05
+BATCH_GET_MAX_DELAY_SECONDS = 1.0
+
 
 def _parse_timestamp(timestamp_input):
     """
@@ -85,8 +95,7 @@ def normalize_and_calculate_ttl(last_update_time_input, start_time_input=None):
             )
 
         # Calculate TTL: configurable days from the TTL base date
-        ttl_days = int(os.environ.get("EVENTS_TABLE_TTL_DAYS", "180"))
-        ttl_date = ttl_base_dt + timedelta(days=ttl_days)
+        ttl_date = ttl_base_dt + timedelta(days=EVENTS_TABLE_TTL_DAYS)
         ttl_unix = int(ttl_date.timestamp())
 
         return normalized_iso, ttl_unix
@@ -98,8 +107,7 @@ def normalize_and_calculate_ttl(last_update_time_input, start_time_input=None):
         # Fallback: use current time
         fallback_dt = datetime.utcnow()
         fallback_iso = fallback_dt.isoformat()
-        ttl_days = int(os.environ.get("EVENTS_TABLE_TTL_DAYS", "180"))
-        fallback_ttl = int((fallback_dt + timedelta(days=ttl_days)).timestamp())
+        fallback_ttl = int((fallback_dt + timedelta(days=EVENTS_TABLE_TTL_DAYS)).timestamp())
 
         return fallback_iso, fallback_ttl
 
@@ -163,6 +171,67 @@ def generate_simplified_description(service, event_type_code):
         return f"{service} - Service-specific events"
 
 
+def fetch_existing_event_statuses(dynamodb, keys):
+    """
+    Look up the stored statusCode of (eventArn, accountId) keys in the events table
+
+    Args:
+        dynamodb: DynamoDB service resource
+        keys (list): (eventArn, accountId) tuples
+
+    Returns:
+        dict: {(eventArn, accountId): statusCode} for keys that already have an item
+            (keys DynamoDB leaves unprocessed after BATCH_GET_MAX_RETRIES are omitted)
+    """
+    existing_statuses = {}
+    # BatchGetItem rejects duplicate keys within a request
+    unique_keys = list(dict.fromkeys(keys))
+
+    for i in range(0, len(unique_keys), 100):
+        request_items = {
+            DYNAMODB_TABLE_NAME: {
+                "Keys": [
+                    {"eventArn": event_arn, "accountId": account_id}
+                    for event_arn, account_id in unique_keys[i:i + 100]
+                ],
+                "ProjectionExpression": "eventArn, accountId, statusCode",
+            }
+        }
+        for attempt in range(BATCH_GET_MAX_RETRIES + 1):
+            if attempt:
+                # Exponential backoff with jitter before retrying throttled keys
+                delay = min(BATCH_GET_BASE_DELAY_SECONDS * (2**attempt), BATCH_GET_MAX_DELAY_SECONDS)
+                time.sleep(delay * (0.5 + random.random() * 0.5))
+            response = dynamodb.batch_get_item(RequestItems=request_items)
+            for found in response.get("Responses", {}).get(DYNAMODB_TABLE_NAME, []):
+                existing_statuses[(found["eventArn"], found["accountId"])] = found.get("statusCode", "")
+            request_items = response.get("UnprocessedKeys")
+            if not request_items:
+                break
+        else:
+            unprocessed_count = len(request_items.get(DYNAMODB_TABLE_NAME, {}).get("Keys", []))
+            logging.warning(
+                f"{unprocessed_count} keys still unprocessed after {BATCH_GET_MAX_RETRIES} "
+                f"BatchGetItem retries, treating them as not found"
+            )
+
+    return existing_statuses
+
+
+def fetch_existing_event_keys(dynamodb, keys):
+    """
+    Find which (eventArn, accountId) keys already exist in the events table
+
+    Args:
+        dynamodb: DynamoDB service resource
+        keys (list): (eventArn, accountId) tuples
+
+    Returns:
+        set: Keys that already have an item
+    """
+    return set(fetch_existing_event_statuses(dynamodb, keys))
+
+
 def store_events_in_dynamodb(events_analysis):
     """
     Store analyzed events in DynamoDB table
@@ -182,7 +251,7 @@ def store_events_in_dynamodb(events_analysis):
     )
 
     # Create DynamoDB resource
-    dynamodb = boto3.resource("dynamodb")
+    dynamodb = get_dynamodb_resource()
     table = dynamodb.Table(DYNAMODB_TABLE_NAME)
 
     # Track success and failures
@@ -193,7 +262,8 @@ def store_events_in_dynamodb(events_analysis):
     # Get current timestamp for metadata in YYYY-MM-DD HH:MM:SS format
     analysis_timestamp = datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')
 
-    # Process each event
+    # Build and validate every item first, then write them in batches
+    items = []
     for event in events_analysis:
         try:
             # Get primary key values
@@ -257,34 +327,57 @@ def store_events_in_dynamodb(events_analysis):
                 if value == "":
                     item[key] = None
 
-            # Handle decimal conversion for numeric values
-            item = json.loads(json.dumps(item), parse_float=Decimal)
-
-            # Check if the item already exists
-            try:
-                response = table.get_item(
-                    Key={"eventArn": event_arn, "accountId": account_id}
-                )
-
-                if "Item" in response:
-                    logging.info(
-                        f"Event {event_arn} for account {account_id} already exists, updating..."
-                    )
-                    table.put_item(Item=item)
-                    updated_count += 1
-                else:
-                    table.put_item(Item=item)
-                    stored_count += 1
-            except Exception as e:
-                logging.error(f"Error checking for existing item: {str(e)}")
-                table.put_item(Item=item)
-                stored_count += 1
+            # Handle decimal conversion for numeric values (only needed for floats or nested values)
+            if not all(type(value) in DYNAMODB_NATIVE_VALUE_TYPES for value in item.values()):
+                item = json.loads(json.dumps(item), parse_float=Decimal)
+            items.append(item)
 
         except Exception as e:
             logging.error(f"Error storing event in DynamoDB: {str(e)}")
             logging.error(f"{traceback.format_exc()}")
             failed_count += 1
 
+    # Check which items already exist (BatchGetItem, 100 keys per call) for the stored/updated split
+    try:
+        existing_keys = fetch_existing_event_keys(
+            dynamodb, [(item["eventArn"], item["accountId"]) for item in items]
+        )
+    except Exception as e:
+        logging.error(f"Error checking for existing items: {str(e)}")
+        existing_keys = set()
+
+    # Write everything through BatchWriteItem (25 puts per call, unprocessed items retried);
+    # duplicate keys within a batch collapse to the last item instead of failing the batch
+    try:
+        with table.batch_writer(overwrite_by_pkeys=["eventArn", "accountId"]) as batch:
+            for item in items:
+                batch.put_item(Item=item)
+        written_items = items
+    except Exception as e:
+        written_items = []
+        if isinstance(e, ClientError) and e.response.get("Error", {}).get("Code") == "ResourceNotFoundException":
+            # Individual puts would fail the same way, so count the whole batch as failed
+            logging.error(f"DynamoDB table {DYNAMODB_TABLE_NAME} not found: {str(e)}")
+            failed_count += len(items)
+        else:
+            logging.error(f"Batch write failed, falling back to individual puts: {str(e)}")
+            for item in items:
+                try:
+                    table.put_item(Item=item)
+                    written_items.append(item)
+                except Exception as put_error:
+                    logging.error(f"Error storing event in DynamoDB: {str(put_error)}")
+                    failed_count += 1
+
+    for item in written_items:
+        if (item["eventArn"], item["accountId"]) in existing_keys:
+            logging.debug(
+                f"Event {item['eventArn']} for account {item['accountId']} already existed, updated"
+            )
+            updated_count += 1
+        else:
+            stored_count += 1
+
     logging.info(
         f"DynamoDB storage complete: {stored_count} stored, {updated_count} updated, {failed_count} failed"
     )
@@ -304,9 +397,11 @@ def process_single_event(bedrock_client, event_data):
     """
     try:
 
-        # Get account ID and name
+        # Get account ID and name (callers that already resolved the name pass it as accountName)
         account_id = event_data.get("accountId", "N/A")
-        account_name = get_account_name(account_id) if account_id != "N/A" else "N/A"
+        account_name = event_data.get("accountName") or (
+            get_account_name(account_id) if account_id != "N/A" else "N/A"
+        )
 
         # Check if event already exists in DynamoDB with VALID analysis
         event_arn = event_data.get("arn", "")
@@ -315,7 +410,7 @@ def process_single_event(bedrock_client, event_data):
         
         if event_arn and account_id != "N/A" and DYNAMODB_TABLE_NAME:
             try:
-                dynamodb = boto3.resource("dynamodb")
+                dynamodb = get_dynamodb_resource()
                 table = dynamodb.Table(DYNAMODB_TABLE_NAME)
                 
                 response = table.get_item(
@@ -497,9 +592,24 @@ def update_live_counts(events_analysis, is_sqs_processing=False):
         return {"updated": 0, "failed": 0}
 
     # Create DynamoDB resources
-    dynamodb = boto3.resource("dynamodb")
+    dynamodb = get_dynamodb_resource()
     counts_table = dynamodb.Table(COUNTS_TABLE_NAME)
-    events_table = dynamodb.Table(DYNAMODB_TABLE_NAME)
+
+    # Get previous statuses from DynamoDB for both SQS and batch processing (BatchGetItem, 100 keys per call)
+    # This enables proper status transition counting for all event sources
+    lookup_keys = [
+        (event.get("eventArn", event.get("arn", "")), event.get("accountId", "N/A"))
+        for event in events_analysis
+        if not event.get("force_count", False)
+    ]
+    try:
+        previous_statuses = fetch_existing_event_statuses(
+            dynamodb,
+            [key for key in lookup_keys if key[0] and key[1] and key[1] != "N/A"],
+        )
+    except Exception as e:
+        logging.error(f"Error getting previous statuses: {str(e)}")
+        previous_statuses = {}
 
     # Track updates by account
     account_updates = {}
@@ -532,32 +642,17 @@ def update_live_counts(events_analysis, is_sqs_processing=False):
         # Check if this is a force count (from initialization)
         force_count = event.get("force_count", False)
 
-        # Get previous status from DynamoDB for both SQS and batch processing
-        # This enables proper status transition counting for all event sources
         if not force_count:
-            try:
-                response = events_table.get_item(
-                    Key={"eventArn": event_arn, "accountId": account_id}
-                )
-                if "Item" in response:
-                    previous_status = response["Item"].get("statusCode", "")
-                    if is_sqs_processing:
-                        logging.debug(
-                            f"SQS processing: Found existing event {event_arn} with previous status '{previous_status}', current status '{current_status}'"
-                        )
+            previous_status = previous_statuses.get((event_arn, account_id))
+            if is_sqs_processing:
+                if previous_status is not None:
+                    logging.debug(
+                        f"SQS processing: Found existing event {event_arn} with previous status '{previous_status}', current status '{current_status}'"
+                    )
                 else:
-                    previous_status = None
-                    if is_sqs_processing:
-                        logging.debug(
-                            f"SQS processing: New event {event_arn} with status '{current_status}'"
-                        )
-            except Exception as e:
-                logging.error(
-                    f"Error getting previous status for {event_arn}: {str(e)}"
-                )
-                previous_status = None
-        else:
-            previous_status = None
+                    logging.debug(
+                        f"SQS processing: New event {event_arn} with status '{current_status}'"
+                    )
 
         # Determine what counter category this event belongs to
         counter_category = None
@@ -625,7 +720,9 @@ def update_live_counts(events_analysis, is_sqs_processing=False):
             should_update = any(value != 0 for value in updates.values())
 
             # Check if account record exists and has all required counters
+            # (the item is read once and reused for the decrement and initialization steps)
             needs_initialization = False
+            current_item = None
             try:
                 current_response = counts_table.get_item(Key={"accountId": account_id})
                 current_item = current_response.get("Item", {})
@@ -668,13 +765,8 @@ def update_live_counts(events_analysis, is_sqs_processing=False):
 
             # Handle negative updates with conditional SET to prevent negative values
             if negative_updates:
-                # First, get current values to calculate safe decrements
-                try:
-                    current_response = counts_table.get_item(
-                        Key={"accountId": account_id}
-                    )
-                    current_item = current_response.get("Item", {})
-
+                # Use current values to calculate safe decrements
+                if current_item is not None:
                     for counter, change_value in negative_updates.items():
                         current_value = current_item.get(counter, 0)
                         # Calculate new value, ensuring it doesn't go below 0
@@ -684,10 +776,7 @@ def update_live_counts(events_analysis, is_sqs_processing=False):
                         set_parts.append(f"{counter} = :val_{counter}")
                         expression_values[f":val_{counter}"] = new_value
 
-                except Exception as e:
-                    logging.error(
-                        f"Error getting current counts for negative updates: {str(e)}"
-                    )
+                else:
                     # If we can't get current values, skip negative updates to be safe
                     logging.warning(
                         f"Skipping negative updates for account {account_id} to prevent data corruption"
@@ -704,18 +793,9 @@ def update_live_counts(events_analysis, is_sqs_processing=False):
                     "billing_changes",
                 ]
 
-                # Get current item to check which counters are missing
-                try:
-                    current_response = counts_table.get_item(
-                        Key={"accountId": account_id}
-                    )
-                    current_item = current_response.get("Item", {})
-                except Exception as e:
-                    current_item = {}
-
                 # Initialize missing counters to 0
                 for counter in required_counters:
-                    if counter not in current_item and counter not in [
+                    if counter not in (current_item or {}) and counter not in [
                         k.split("_")[0]
                         for k in expression_values.keys()
                         if k.startswith("val_")
@@ -948,7 +1028,7 @@ def update_live_counts_for_ttl_deletions(ttl_deletion_events):
     logging.info(f"Updating counts for {len(ttl_deletion_events)} TTL deletions")
 
     # Create DynamoDB resource
-    dynamodb = boto3.resource("dynamodb")
+    dynamodb = get_dynamodb_resource()
     counts_table = dynamodb.Table(COUNTS_TABLE_NAME)
 
     # Track updates by account
@@ -1057,7 +1137,7 @@ def initialize_live_counts():
     logging.info("=== INITIALIZING LIVE COUNTS ===")
 
     # Query your events table for all open events
-    dynamodb = boto3.resource("dynamodb")
+    dynamodb = get_dynamodb_resource()
     events_table = dynamodb.Table(DYNAMODB_TABLE_NAME)
 
     # Scan for open events
@@ -1126,7 +1206,7 @@ def ensure_all_counters_initialized():
 
     logging.info("=== ENSURING ALL COUNTERS ARE INITIALIZED ===")
 
-    dynamodb = boto3.resource("dynamodb")
+    dynamodb = get_dynamodb_resource()
     counts_table = dynamodb.Table(COUNTS_TABLE_NAME)
 
     required_counters = [
@@ -1207,7 +1287,7 @@ def force_counts_update():
     logging.info("=== FORCING COUNTS UPDATE ===")
 
     # Query your events table for all events
-    dynamodb = boto3.resource("dynamodb")
+    dynamodb = get_dynamodb_resource()
     events_table = dynamodb.Table(DYNAMODB_TABLE_NAME)
 
     # Scan for all events
@@ -1281,7 +1361,7 @@ def update_counts_for_arn(event_arn, affected_account_ids=None):
         logging.warning("Missing configuration for ARN-based count update")
         return {"updated": 0}
 
-    dynamodb = boto3.resource("dynamodb")
+    dynamodb = get_dynamodb_resource()
     events_table = dynamodb.Table(DYNAMODB_TABLE_NAME)
     counts_table = dynamodb.Table(COUNTS_TABLE_NAME)
 
@@ -1452,7 +1532,7 @@ def recalculate_arn_based_counts():
 
     logging.info("=== RECALCULATING ARN-BASED COUNTS (FULL SCAN) ===")
 
-    dynamodb = boto3.resource("dynamodb")
+    dynamodb = get_dynamodb_resource()
     events_table = dynamodb.Table(DYNAMODB_TABLE_NAME)
     counts_table = dynamodb.Table(COUNTS_TABLE_NAME)
 
@@ -7,11 +7,23 @@ BEDROCK_MODEL_ID = os.environ.get(
 BEDROCK_TEMPERATURE = float(os.environ.get("BEDROCK_TEMPERATURE", "0.1"))
 BEDROCK_TOP_P = float(os.environ.get("BEDROCK_TOP_P", "0.9"))
 BEDROCK_MAX_TOKENS = int(os.environ.get("BEDROCK_MAX_TOKENS", "4000"))
+BEDROCK_BATCH_SIZE = int(os.environ.get("BEDROCK_BATCH_SIZE", "10"))
+BEDROCK_BATCH_MAX_TOKENS = int(os.environ.get("BEDROCK_BATCH_MAX_TOKENS", "8192"))
+# Concurrent Health + Bedrock analyses in synchronous batch processing
+BEDROCK_MAX_CONCURRENCY = int(os.environ.get("BEDROCK_MAX_CONCURRENCY", "4"))
 EXCLUDED_SERVICES = os.environ.get("EXCLUDED_SERVICES", "")
 DYNAMODB_TABLE_NAME = os.environ.get("DYNAMODB_HEALTH_EVENTS_TABLE_NAME", "")
 COUNTS_TABLE_NAME = os.environ.get("DYNAMODB_COUNTS_TABLE_NAME", "")
 SPECIFIC_ACCOUNT_IDS = os.environ.get("SPECIFIC_ACCOUNT_IDS", "")
+# Optional override ("true"/"false") that skips the Health organization view probe
+HEALTH_ORG_VIEW_ENABLED = os.environ.get("HEALTH_ORG_VIEW_ENABLED", "")
+AWS_REGION = os.environ.get("AWS_REGION", "us-east-1")
+ANALYSIS_WINDOW_DAYS = int(os.environ.get("ANALYSIS_WINDOW_DAYS", "90"))
+EVENT_CATEGORIES = os.environ.get("EVENT_CATEGORIES", "")
+EVENTS_TABLE_TTL_DAYS = int(os.environ.get("EVENTS_TABLE_TTL_DAYS", "180"))
+SQS_EVENT_PROCESSING_QUEUE_URL = os.environ.get("SQS_EVENT_PROCESSING_QUEUE_URL")
 
 # Processed configurations
 excluded_services = [s.strip() for s in EXCLUDED_SERVICES.split(",") if s.strip()]
 specific_account_ids = [s.strip() for s in SPECIFIC_ACCOUNT_IDS.split(",") if s.strip()]
+event_categories = [c.strip() for c in EVENT_CATEGORIES.split(",")] if EVENT_CATEGORIES.strip() else []
@@ -48,40 +48,6 @@ def extract_event_description(event_description):
         return ""
 
 
-def is_sqs_event(event):
-    """
-    Check if the event is from SQS (individual processing mode)
-
-    Args:
-        event (dict): Lambda event
-
-    Returns:
-        bool: True if event is from SQS
-    """
-    return (
-        "Records" in event
-        and len(event["Records"]) > 0
-        and event["Records"][0].get("eventSource") == "aws:sqs"
-    )
-
-
-def is_dynamodb_stream_event(event):
-    """
-    Check if the event is from DynamoDB Streams (TTL deletions)
-
-    Args:
-        event (dict): Lambda event
-
-    Returns:
-        bool: True if event is from DynamoDB Streams
-    """
-    return (
-        "Records" in event
-        and len(event["Records"]) > 0
-        and event["Records"][0].get("eventSource") == "aws:dynamodb"
-    )
-
-
 def normalize_event_format(message_body):
     """
     Convert EventBridge format to API format for consistent processing
@@ -129,16 +95,17 @@ def normalize_event_format(message_body):
 
 def expand_events_by_account(events):
     """
-    Expands events that affect multiple accounts into separate event records for each account.
+    Lazily expands events that affect multiple accounts into separate event records for each account.
+
+    Records are produced one at a time as the caller consumes them, so the full
+    events x accounts list is never held in memory.
 
     Args:
         events (list): List of health events
 
-    Returns:
-        list: Expanded list with separate records for each affected account
+    Yields:
+        dict: Account-specific event record (the original event if it has no affected accounts)
     """
-    expanded_events = []
-
     for event in events:
         # Get affected accounts for this event
         affected_accounts = event.get("affectedAccounts", [])
@@ -146,17 +113,23 @@ def expand_events_by_account(events):
         if affected_accounts:
             # Create separate event record for each affected account
             for account_id in affected_accounts:
-                account_event = event.copy()
-                account_event["accountId"] = account_id
-                expanded_events.append(account_event)
+                yield {**event, "accountId": account_id}
         else:
             # No affected accounts specified, keep original event
-            expanded_events.append(event)
+            yield event
 
-    logging.info(
-        f"Expanded {len(events)} events to {len(expanded_events)} account-specific events"
-    )
-    return expanded_events
+
+def count_expanded_events(events):
+    """
+    Count the records expand_events_by_account would produce, without building them
+
+    Args:
+        events (list): List of health events
+
+    Returns:
+        int: Number of account-specific event records
+    """
+    return sum(len(event.get("affectedAccounts") or ()) or 1 for event in events)
 
 
 def create_account_batches(affected_accounts, batch_size=10):
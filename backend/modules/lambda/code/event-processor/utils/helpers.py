@@ -100,17 +100,10 @@ def extract_affected_resources(entities):
     """
     if not entities:
         return "None specified"
-    
-    resources = []
-    for entity in entities:
-        entity_value = entity.get('entityValue', '')
-        if entity_value:
-            resources.append(entity_value)
-    
-    if resources:
-        return ", ".join(resources)
-    else:
-        return "None specified"
+
+    # str.join materializes its input anyway, so feed it directly instead of building a list first
+    resources = ", ".join(filter(None, (entity.get('entityValue') for entity in entities)))
+    return resources or "None specified"
 
 def get_account_id_from_event(event_arn):
     """
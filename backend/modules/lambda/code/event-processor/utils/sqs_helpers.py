@@ -2,11 +2,113 @@
 SQS utility functions
 """
 
-import json
-import os
-import boto3
+import base64
+import concurrent.futures
+import gzip
 import logging
 
+import orjson
+
+from aws_clients.client_manager import get_clients
+from utils.config import SQS_EVENT_PROCESSING_QUEUE_URL
+
+# SendMessageBatch limits: 10 entries and 256 KB of message bodies per request
+SQS_BATCH_MAX_ENTRIES = 10
+SQS_BATCH_MAX_BYTES = 256 * 1024
+# Concurrent SendMessageBatch requests (kept within the SQS client's connection pool)
+SQS_SEND_MAX_WORKERS = 8
+# Datetimes go through default=str (same text as json.dumps(default=str)); non-str keys are allowed like json
+SQS_MESSAGE_JSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+# SQS bills every 64 KB of a message as a request: bodies larger than that are gzip + base64 encoded
+SQS_COMPRESS_MIN_BYTES = 64 * 1024
+# Base64 of the gzip magic bytes - JSON bodies never start with it, so no message attribute is needed
+COMPRESSED_BODY_PREFIX = "H4sI"
+
+
+def encode_message_body(event_data):
+    """
+    Serialize a message for SQS, compressing it when it spans more than one billing chunk
+
+    Args:
+        event_data (dict): Message to send
+
+    Returns:
+        str: JSON body, or gzip + base64 encoded JSON for large messages
+    """
+    body = orjson.dumps(event_data, default=str, option=SQS_MESSAGE_JSON_OPTIONS)
+    if len(body) > SQS_COMPRESS_MIN_BYTES:
+        return base64.b64encode(gzip.compress(body, compresslevel=6)).decode()
+    return body.decode()
+
+
+def decode_message_body(raw_body):
+    """
+    Undo encode_message_body's compression (uncompressed bodies are returned unchanged)
+
+    Args:
+        raw_body (str): SQS message body
+
+    Returns:
+        str: JSON body
+    """
+    if raw_body.startswith(COMPRESSED_BODY_PREFIX):
+        return gzip.decompress(base64.b64decode(raw_body)).decode()
+    return raw_body
+
+
+def chunk_message_bodies(message_bodies):
+    """
+    Group message bodies into SendMessageBatch-sized chunks
+
+    Args:
+        message_bodies (list): Serialized message bodies
+
+    Yields:
+        list: (index, body) pairs, at most SQS_BATCH_MAX_ENTRIES and SQS_BATCH_MAX_BYTES per chunk
+    """
+    chunk = []
+    chunk_bytes = 0
+    for index, body in enumerate(message_bodies):
+        body_bytes = len(body.encode("utf-8"))
+        if chunk and (len(chunk) == SQS_BATCH_MAX_ENTRIES or chunk_bytes + body_bytes > SQS_BATCH_MAX_BYTES):
+            yield chunk
+            chunk = []
+            chunk_bytes = 0
+        chunk.append((index, body))
+        chunk_bytes += body_bytes
+    if chunk:
+        yield chunk
+
+
+def send_message_chunk(sqs_client, sqs_queue_url, chunk):
+    """
+    Send one chunk of messages with a single SendMessageBatch call
+
+    Args:
+        sqs_client: SQS client
+        sqs_queue_url (str): Queue URL
+        chunk (list): (index, body) pairs from chunk_message_bodies
+
+    Returns:
+        tuple: (sent_count, failed_count)
+    """
+    try:
+        response = sqs_client.send_message_batch(
+            QueueUrl=sqs_queue_url,
+            Entries=[{"Id": str(index), "MessageBody": body} for index, body in chunk],
+        )
+    except Exception as e:
+        logging.error(f"Error sending events {chunk[0][0] + 1}-{chunk[-1][0] + 1} to SQS: {str(e)}")
+        return 0, len(chunk)
+
+    failed = response.get("Failed", [])
+    for failure in failed:
+        logging.error(
+            f"Error sending event {int(failure['Id']) + 1} to SQS: "
+            f"{failure.get('Code')} {failure.get('Message', '')}"
+        )
+    return len(response.get("Successful", [])), len(failed)
+
 
 def send_events_to_sqs(events_data):
     """
@@ -18,7 +120,7 @@ def send_events_to_sqs(events_data):
     Returns:
         dict: Summary of SQS operations
     """
-    sqs_queue_url = os.environ.get("SQS_EVENT_PROCESSING_QUEUE_URL")
+    sqs_queue_url = SQS_EVENT_PROCESSING_QUEUE_URL
 
     if not sqs_queue_url:
         logging.warning(
@@ -26,22 +128,19 @@ def send_events_to_sqs(events_data):
         )
         return {"sent": 0, "failed": 0, "fallback": True}
 
-    sqs_client = boto3.client("sqs")
+    _, _, sqs_client = get_clients()
     sent_count = 0
     failed_count = 0
 
-    for i, event_data in enumerate(events_data):
-        try:
-            # Send individual event to SQS
-            message_body = json.dumps(event_data, default=str)
-
-            sqs_client.send_message(QueueUrl=sqs_queue_url, MessageBody=message_body)
-
-            sent_count += 1
-
-        except Exception as e:
-            logging.error(f"Error sending event {i+1} to SQS: {str(e)}")
-            failed_count += 1
+    # Each event is serialized once; chunks of up to 10 are sent concurrently
+    message_bodies = [encode_message_body(event_data) for event_data in events_data]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=SQS_SEND_MAX_WORKERS) as executor:
+        for sent, failed in executor.map(
+            lambda chunk: send_message_chunk(sqs_client, sqs_queue_url, chunk),
+            chunk_message_bodies(message_bodies),
+        ):
+            sent_count += sent
+            failed_count += failed
 
     logging.info(f"SQS batch complete: {sent_count} sent, {failed_count} failed")
     return {"sent": sent_count, "failed": failed_count, "fallback": False}
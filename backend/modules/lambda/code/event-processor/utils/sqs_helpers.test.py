@@ -0,0 +1,111 @@
+"""
+Property-based tests for SQS message encoding and SendMessageBatch chunking
+"""
+
+import os
+import sys
+
+import orjson
+from hypothesis import given, strategies as st, settings
+
+# sqs_helpers imports its siblings as top-level packages (utils.config, aws_clients, ...)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+
+from utils.sqs_helpers import (
+    COMPRESSED_BODY_PREFIX,
+    SQS_BATCH_MAX_BYTES,
+    SQS_BATCH_MAX_ENTRIES,
+    SQS_COMPRESS_MIN_BYTES,
+    chunk_message_bodies,
+    decode_message_body,
+    encode_message_body,
+)
+
+
+def message_of_size(size):
+    """Build a message whose serialized JSON body is exactly size bytes"""
+    overhead = len(orjson.dumps({"description": ""}))
+    return {"description": "x" * (size - overhead)}
+
+
+# Property Test 1: Encoded bodies round-trip at, below and above the compression threshold
+@given(
+    size_delta=st.integers(min_value=-1024, max_value=1024),
+    arn=st.text(max_size=50),
+)
+@settings(max_examples=50)
+def test_encode_decode_round_trip(size_delta, arn):
+    """
+    For any message, decoding the encoded body should give back the same JSON,
+    and only bodies larger than SQS_COMPRESS_MIN_BYTES should be compressed.
+    """
+    message = message_of_size(SQS_COMPRESS_MIN_BYTES + size_delta)
+    message["arn"] = arn
+    json_size = len(orjson.dumps(message))
+
+    body = encode_message_body(message)
+
+    assert orjson.loads(decode_message_body(body)) == message
+    if json_size > SQS_COMPRESS_MIN_BYTES:
+        assert body.startswith(COMPRESSED_BODY_PREFIX), "Large bodies should be compressed"
+        assert len(body) < json_size, "Compressed body should be smaller than the JSON"
+    else:
+        assert body == orjson.dumps(message).decode(), "Small bodies should be plain JSON"
+
+
+def test_encode_threshold_boundary():
+    """A body of exactly SQS_COMPRESS_MIN_BYTES stays plain; one byte more is compressed"""
+    at_threshold = encode_message_body(message_of_size(SQS_COMPRESS_MIN_BYTES))
+    above_threshold = encode_message_body(message_of_size(SQS_COMPRESS_MIN_BYTES + 1))
+
+    assert not at_threshold.startswith(COMPRESSED_BODY_PREFIX)
+    assert above_threshold.startswith(COMPRESSED_BODY_PREFIX)
+    assert decode_message_body(at_threshold) == at_threshold
+
+
+# Property Test 2: Chunks respect the SendMessageBatch entry and byte limits
+@given(
+    body_sizes=st.lists(st.integers(min_value=1, max_value=100 * 1024), max_size=60),
+    multibyte=st.booleans(),
+)
+@settings(max_examples=50)
+def test_chunk_limits(body_sizes, multibyte):
+    """
+    For any list of bodies no larger than the batch limit, every chunk should hold at
+    most SQS_BATCH_MAX_ENTRIES bodies and SQS_BATCH_MAX_BYTES of UTF-8, keep input
+    order, and only be closed when the next body would not fit.
+    """
+    # "é" is two bytes in UTF-8, so byte and character counts differ
+    bodies = [("é" * (size // 2) if multibyte else "x" * size) for size in body_sizes]
+
+    chunks = list(chunk_message_bodies(bodies))
+
+    flattened = [pair for chunk in chunks for pair in chunk]
+    assert flattened == list(enumerate(bodies)), "Every body should be sent once, in order"
+
+    for chunk_index, chunk in enumerate(chunks):
+        chunk_bytes = sum(len(body.encode("utf-8")) for _, body in chunk)
+        assert 1 <= len(chunk) <= SQS_BATCH_MAX_ENTRIES
+        assert chunk_bytes <= SQS_BATCH_MAX_BYTES, (
+            f"Chunk {chunk_index} holds {chunk_bytes} bytes"
+        )
+
+        if chunk_index < len(chunks) - 1 and len(chunk) < SQS_BATCH_MAX_ENTRIES:
+            next_body = chunks[chunk_index + 1][0][1]
+            assert chunk_bytes + len(next_body.encode("utf-8")) > SQS_BATCH_MAX_BYTES, (
+                "A chunk should only be closed early when the next body does not fit"
+            )
+
+
+if __name__ == "__main__":
+    print("Running Property Test 1: Encode/decode round trip...")
+    test_encode_decode_round_trip()
+    test_encode_threshold_boundary()
+    print("✓ Property Test 1 passed\n")
+
+    print("Running Property Test 2: SendMessageBatch chunk limits...")
+    test_chunk_limits()
+    print("✓ Property Test 2 passed\n")
+
+    print("All SQS helper property tests passed!")
@@ -1,3 +1,8 @@
 #!/bin/bash
 # Build script for Lambda layer
-pip3 install -r requirements.txt -t python/
\ No newline at end of file
+# orjson ships compiled wheels, so pin the target platform to the Lambda runtime
+pip3 install -r requirements.txt -t python/ \
+    --platform manylinux2014_x86_64 \
+    --implementation cp \
+    --python-version 3.11 \
+    --only-binary=:all:
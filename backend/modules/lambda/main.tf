@@ -140,6 +140,15 @@ data "archive_file" "event_processor_zip" {
   type        = "zip"
   source_dir  = "${path.module}/code/event-processor"
   output_path = "${path.module}/code/event-processor.zip"
+
+  # Property tests live next to the modules they cover but are not needed at runtime
+  excludes = [
+    "analysis/bedrock_analyzer.test.py",
+    "processing/batch_processor.test.py",
+    "processing/sqs_processor.test.py",
+    "utils/event_helpers.test.py",
+    "utils/sqs_helpers.test.py",
+  ]
 }
 
 data "archive_file" "email_processor_zip" {